@@ -10,7 +10,8 @@ from alembic import context
 
 # Import our models
 from app.core.database import Base
-from app.models import User
+from app.models import load_all_models
+load_all_models()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
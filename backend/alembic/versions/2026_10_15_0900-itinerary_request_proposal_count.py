@@ -0,0 +1,38 @@
+"""Add denormalized proposal_count to itinerary_requests
+
+Revision ID: 2026_10_15_0900_proposal_count
+Revises: 2025_09_22_2051_chat
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0900_proposal_count'
+down_revision: Union[str, Sequence[str], None] = '2025_09_22_2051_chat'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add proposal_count column and backfill it from itinerary_proposals"""
+    op.add_column(
+        'itinerary_requests',
+        sa.Column('proposal_count', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # One-time backfill; afterwards the ORM keeps the counter in sync
+    op.execute("""
+        UPDATE itinerary_requests r
+        SET proposal_count = (
+            SELECT count(*) FROM itinerary_proposals p WHERE p.request_id = r.id
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Remove proposal_count column"""
+    op.drop_column('itinerary_requests', 'proposal_count')
@@ -0,0 +1,49 @@
+"""Add composite and partial indexes for hot query predicates
+
+Revision ID: 2026_10_15_0910_hot_indexes
+Revises: 2026_10_15_0900_proposal_count
+Create Date: 2026-10-15 09:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0910_hot_indexes'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0900_proposal_count'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes for message pagination, unread notifications, conversation lists and open requests"""
+    op.create_index('ix_messages_conv_created', 'messages', ['conversation_id', 'created_at'])
+    op.create_index(
+        'ix_notifications_user_unread', 'notifications', ['user_id'],
+        postgresql_where=sa.text('is_read = false')
+    )
+    op.create_index(
+        'ix_conversations_traveler_active', 'conversations', ['traveler_id'],
+        postgresql_where=sa.text('is_active AND NOT traveler_archived')
+    )
+    op.create_index(
+        'ix_conversations_local_active', 'conversations', ['local_id'],
+        postgresql_where=sa.text('is_active AND NOT local_archived')
+    )
+    # status is still the native enum here, which stores member names;
+    # 0950 rebuilds this index against the lowercase VARCHAR values
+    op.create_index(
+        'ix_itinerary_requests_open', 'itinerary_requests', ['destination_city', 'status'],
+        postgresql_where=sa.text("status IN ('PENDING', 'IN_REVIEW') AND is_public")
+    )
+
+
+def downgrade() -> None:
+    """Remove hot-path indexes"""
+    op.drop_index('ix_itinerary_requests_open', table_name='itinerary_requests')
+    op.drop_index('ix_conversations_local_active', table_name='conversations')
+    op.drop_index('ix_conversations_traveler_active', table_name='conversations')
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
+    op.drop_index('ix_messages_conv_created', table_name='messages')
@@ -0,0 +1,66 @@
+"""Convert JSON columns to JSONB and add GIN indexes
+
+Revision ID: 2026_10_15_0920_jsonb
+Revises: 2026_10_15_0910_hot_indexes
+Create Date: 2026-10-15 09:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0920_jsonb'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0910_hot_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = [
+    ('itinerary_proposals', 'daily_itinerary'),
+    ('itinerary_proposals', 'price_breakdown'),
+    ('notifications', 'extra_data'),
+]
+
+
+def upgrade() -> None:
+    """Retype JSON columns as JSONB and index them for containment queries"""
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    op.create_index(
+        'ix_proposals_daily_itinerary_gin', 'itinerary_proposals', ['daily_itinerary'],
+        postgresql_using='gin', postgresql_ops={'daily_itinerary': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_proposals_price_breakdown_gin', 'itinerary_proposals', ['price_breakdown'],
+        postgresql_using='gin', postgresql_ops={'price_breakdown': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_notifications_extra_data_gin', 'notifications', ['extra_data'],
+        postgresql_using='gin', postgresql_ops={'extra_data': 'jsonb_path_ops'}
+    )
+    op.create_index(
+        'ix_notifications_extra_proposal', 'notifications',
+        [sa.text("(extra_data->>'proposal_id')")]
+    )
+
+
+def downgrade() -> None:
+    """Drop JSONB indexes and revert columns to JSON"""
+    op.drop_index('ix_notifications_extra_proposal', table_name='notifications')
+    op.drop_index('ix_notifications_extra_data_gin', table_name='notifications')
+    op.drop_index('ix_proposals_price_breakdown_gin', table_name='itinerary_proposals')
+    op.drop_index('ix_proposals_daily_itinerary_gin', table_name='itinerary_proposals')
+
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSON(),
+            postgresql_using=f'{column}::json'
+        )
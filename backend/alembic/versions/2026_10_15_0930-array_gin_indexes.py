@@ -0,0 +1,35 @@
+"""Add GIN indexes on array columns used for request matching
+
+Revision ID: 2026_10_15_0930_array_gin
+Revises: 2026_10_15_0920_jsonb
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0930_array_gin'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0920_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GIN_INDEXES = [
+    ('ix_requests_interests_gin', 'itinerary_requests', 'interests'),
+    ('ix_requests_diet_gin', 'itinerary_requests', 'dietary_restrictions'),
+    ('ix_local_profiles_specialties_gin', 'local_profiles', 'specialties'),
+    ('ix_local_profiles_languages_gin', 'local_profiles', 'languages'),
+]
+
+
+def upgrade() -> None:
+    """Add GIN indexes for && / @> queries on array columns"""
+    for name, table, column in GIN_INDEXES:
+        op.create_index(name, table, [column], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Remove array GIN indexes"""
+    for name, table, _ in reversed(GIN_INDEXES):
+        op.drop_index(name, table_name=table)
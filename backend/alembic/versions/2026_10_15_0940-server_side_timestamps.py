@@ -0,0 +1,46 @@
+"""Use server-side timestamps on notifications and reviews
+
+Revision ID: 2026_10_15_0940_server_ts
+Revises: 2026_10_15_0930_array_gin
+Create Date: 2026-10-15 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0940_server_ts'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0930_array_gin'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TIMESTAMP_COLUMNS = [
+    ('notifications', 'created_at'),
+    ('reviews', 'created_at'),
+    ('reviews', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+    """Convert created/updated timestamps to timestamptz with now() defaults"""
+    for table, column in TIMESTAMP_COLUMNS:
+        # Existing values were written with datetime.utcnow()
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            server_default=sa.text('now()'),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
+
+
+def downgrade() -> None:
+    """Revert to naive UTC timestamps without server defaults"""
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            server_default=None,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
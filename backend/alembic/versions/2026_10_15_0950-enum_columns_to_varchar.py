@@ -0,0 +1,108 @@
+"""Replace native enum status columns with VARCHAR + CHECK
+
+Revision ID: 2026_10_15_0950_enum_varchar
+Revises: 2026_10_15_0940_server_ts
+Create Date: 2026-10-15 09:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_0950_enum_varchar'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0940_server_ts'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, constraint name, allowed values, USING expression)
+ENUM_COLUMNS = [
+    ('itinerary_requests', 'status', 'ck_itinerary_requests_status',
+     ('draft', 'pending', 'in_review', 'accepted', 'declined', 'cancelled', 'completed'),
+     'lower(status::text)'),
+    ('itinerary_proposals', 'status', 'ck_itinerary_proposals_status',
+     ('draft', 'submitted', 'under_review', 'accepted', 'declined', 'withdrawn'),
+     'lower(status::text)'),
+    ('messages', 'message_type', 'ck_messages_message_type',
+     ('text', 'system', 'booking_request', 'booking_confirmation'),
+     'lower(message_type::text)'),
+    ('messages', 'status', 'ck_messages_status',
+     ('sent', 'delivered', 'read'),
+     'lower(status::text)'),
+    ('local_profiles', 'availability_status', 'ck_local_profiles_availability_status',
+     ('available', 'busy', 'unavailable'),
+     "CASE WHEN lower(availability_status::text) IN ('away', 'offline') THEN 'unavailable' "
+     "ELSE lower(availability_status::text) END"),
+]
+
+# Native types previously backing these columns
+OLD_ENUM_TYPES = [
+    'itineraryrequeststatus', 'proposalstatus', 'messagetype', 'messagestatus',
+    'availabilitystatus', 'availability_enum',
+]
+
+
+def upgrade() -> None:
+    """Convert enum columns to VARCHAR(32) with CHECK constraints and drop the native types"""
+    # Partial index predicate references the enum type; rebuild it around the retype
+    op.drop_index('ix_itinerary_requests_open', table_name='itinerary_requests')
+
+    for table, column, constraint, values, using in ENUM_COLUMNS:
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.alter_column(table, column, type_=sa.String(32), postgresql_using=using)
+
+        # NOT VALID skips the full-table validation scan; new writes are still checked
+        allowed = ', '.join(f"'{value}'" for value in values)
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {constraint} '
+            f'CHECK ({column} IN ({allowed})) NOT VALID'
+        )
+
+    # The old default was cast to the native type; restore it as plain text
+    op.alter_column('local_profiles', 'availability_status', server_default='available')
+
+    for enum_type in OLD_ENUM_TYPES:
+        op.execute(f'DROP TYPE IF EXISTS {enum_type}')
+
+    op.create_index(
+        'ix_itinerary_requests_open', 'itinerary_requests', ['destination_city', 'status'],
+        postgresql_where=sa.text("status IN ('pending', 'in_review') AND is_public")
+    )
+
+
+def downgrade() -> None:
+    """Restore native enum types"""
+    type_names = {
+        ('itinerary_requests', 'status'): 'itineraryrequeststatus',
+        ('itinerary_proposals', 'status'): 'proposalstatus',
+        ('messages', 'message_type'): 'messagetype',
+        ('messages', 'status'): 'messagestatus',
+        ('local_profiles', 'availability_status'): 'availabilitystatus',
+    }
+
+    op.drop_index('ix_itinerary_requests_open', table_name='itinerary_requests')
+
+    for table, column, constraint, values, _ in ENUM_COLUMNS:
+        type_name = type_names[(table, column)]
+        op.drop_constraint(constraint, table, type_='check')
+
+        # Native enums store the Python member names, i.e. the uppercased values;
+        # the VARCHAR default cannot be cast, so drop it around the retype
+        allowed = ', '.join(f"'{value.upper()}'" for value in values)
+        op.execute(f'CREATE TYPE {type_name} AS ENUM ({allowed})')
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT')
+        op.execute(
+            f'ALTER TABLE {table} ALTER COLUMN {column} '
+            f'TYPE {type_name} USING upper({column})::{type_name}'
+        )
+
+    op.alter_column(
+        'local_profiles', 'availability_status',
+        server_default=sa.text("'AVAILABLE'::availabilitystatus")
+    )
+
+    op.create_index(
+        'ix_itinerary_requests_open', 'itinerary_requests', ['destination_city', 'status'],
+        postgresql_where=sa.text("status IN ('PENDING', 'IN_REVIEW') AND is_public")
+    )
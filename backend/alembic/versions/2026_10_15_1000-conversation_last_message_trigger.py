@@ -0,0 +1,43 @@
+"""Maintain conversation last_message_* columns with a trigger on messages
+
+Revision ID: 2026_10_15_1000_last_msg_trigger
+Revises: 2026_10_15_0950_enum_varchar
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1000_last_msg_trigger'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_0950_enum_varchar'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create AFTER INSERT trigger that copies the new message onto its conversation"""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION upd_conv_last_msg() RETURNS trigger AS $$
+        BEGIN
+            UPDATE conversations
+            SET last_message_at = NEW.created_at,
+                last_message_content = left(NEW.content, 100),
+                last_message_sender_id = NEW.sender_id
+            WHERE id = NEW.conversation_id;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_messages_last_msg
+        AFTER INSERT ON messages
+        FOR EACH ROW EXECUTE FUNCTION upd_conv_last_msg();
+    """)
+
+
+def downgrade() -> None:
+    """Drop last message trigger and function"""
+    op.execute("DROP TRIGGER IF EXISTS trg_messages_last_msg ON messages")
+    op.execute("DROP FUNCTION IF EXISTS upd_conv_last_msg()")
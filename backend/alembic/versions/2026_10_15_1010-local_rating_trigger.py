@@ -0,0 +1,79 @@
+"""Maintain local_profiles.average_rating incrementally from reviews
+
+Revision ID: 2026_10_15_1010_rating_trigger
+Revises: 2026_10_15_1000_last_msg_trigger
+Create Date: 2026-10-15 10:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1010_rating_trigger'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1000_last_msg_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add rating_sum/rating_count and keep average_rating in sync with an O(1) trigger"""
+    op.add_column(
+        'local_profiles',
+        sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.add_column(
+        'local_profiles',
+        sa.Column('rating_count', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # One-time backfill; afterwards the trigger applies deltas
+    op.execute("""
+        UPDATE local_profiles lp
+        SET rating_sum = s.total,
+            rating_count = s.n,
+            average_rating = s.total::float / s.n
+        FROM (
+            SELECT reviewee_id, sum(rating) AS total, count(*) AS n
+            FROM reviews GROUP BY reviewee_id
+        ) s
+        WHERE lp.user_id = s.reviewee_id
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION upd_local_rating() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE local_profiles
+                SET rating_sum = rating_sum - OLD.rating,
+                    rating_count = rating_count - 1,
+                    average_rating = CASE WHEN rating_count - 1 > 0
+                        THEN (rating_sum - OLD.rating)::float / (rating_count - 1)
+                        ELSE 0 END
+                WHERE user_id = OLD.reviewee_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                UPDATE local_profiles
+                SET rating_sum = rating_sum + NEW.rating,
+                    rating_count = rating_count + 1,
+                    average_rating = (rating_sum + NEW.rating)::float / (rating_count + 1)
+                WHERE user_id = NEW.reviewee_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_reviews_rating
+        AFTER INSERT OR DELETE OR UPDATE OF rating, reviewee_id ON reviews
+        FOR EACH ROW EXECUTE FUNCTION upd_local_rating();
+    """)
+
+
+def downgrade() -> None:
+    """Drop rating trigger, function and running-total columns"""
+    op.execute("DROP TRIGGER IF EXISTS trg_reviews_rating ON reviews")
+    op.execute("DROP FUNCTION IF EXISTS upd_local_rating()")
+    op.drop_column('local_profiles', 'rating_count')
+    op.drop_column('local_profiles', 'rating_sum')
@@ -0,0 +1,34 @@
+"""Store itinerary_requests.duration_days as a generated column
+
+Revision ID: 2026_10_15_1020_duration_days
+Revises: 2026_10_15_1010_rating_trigger
+Create Date: 2026-10-15 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1020_duration_days'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1010_rating_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# timestamptz::date depends on the session time zone and is not allowed in a
+# generated column; pinning to UTC keeps the expression immutable
+DURATION_DAYS_SQL = "((end_date AT TIME ZONE 'UTC')::date - (start_date AT TIME ZONE 'UTC')::date) + 1"
+
+
+def upgrade() -> None:
+    """Add stored duration_days generated from start_date/end_date"""
+    op.add_column(
+        'itinerary_requests',
+        sa.Column('duration_days', sa.Integer(), sa.Computed(DURATION_DAYS_SQL, persisted=True))
+    )
+
+
+def downgrade() -> None:
+    """Remove generated duration_days column"""
+    op.drop_column('itinerary_requests', 'duration_days')
@@ -0,0 +1,51 @@
+"""Replace conversation list partial indexes with covering indexes
+
+Revision ID: 2026_10_15_1030_conv_covering
+Revises: 2026_10_15_1020_duration_days
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1030_conv_covering'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1020_duration_days'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIST_INCLUDE = ['last_message_content', 'last_message_sender_id']
+
+
+def upgrade() -> None:
+    """Key conversation list indexes on (participant, last_message_at) and INCLUDE the preview columns"""
+    op.create_index(
+        'ix_conv_traveler_list', 'conversations', ['traveler_id', 'last_message_at'],
+        postgresql_include=LIST_INCLUDE,
+        postgresql_where=sa.text('is_active AND NOT traveler_archived')
+    )
+    op.create_index(
+        'ix_conv_local_list', 'conversations', ['local_id', 'last_message_at'],
+        postgresql_include=LIST_INCLUDE,
+        postgresql_where=sa.text('is_active AND NOT local_archived')
+    )
+
+    # Superseded: same predicate, narrower key
+    op.drop_index('ix_conversations_local_active', table_name='conversations')
+    op.drop_index('ix_conversations_traveler_active', table_name='conversations')
+
+
+def downgrade() -> None:
+    """Restore the plain partial indexes"""
+    op.create_index(
+        'ix_conversations_traveler_active', 'conversations', ['traveler_id'],
+        postgresql_where=sa.text('is_active AND NOT traveler_archived')
+    )
+    op.create_index(
+        'ix_conversations_local_active', 'conversations', ['local_id'],
+        postgresql_where=sa.text('is_active AND NOT local_archived')
+    )
+    op.drop_index('ix_conv_local_list', table_name='conversations')
+    op.drop_index('ix_conv_traveler_list', table_name='conversations')
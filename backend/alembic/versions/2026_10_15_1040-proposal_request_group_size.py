@@ -0,0 +1,56 @@
+"""Denormalize request group_size onto itinerary_proposals
+
+Revision ID: 2026_10_15_1040_group_size
+Revises: 2026_10_15_1030_conv_covering
+Create Date: 2026-10-15 10:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1040_group_size'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1030_conv_covering'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add request_group_size, backfill it and propagate request group_size changes"""
+    op.add_column(
+        'itinerary_proposals',
+        sa.Column('request_group_size', sa.Integer(), nullable=True)
+    )
+
+    op.execute("""
+        UPDATE itinerary_proposals p
+        SET request_group_size = r.group_size
+        FROM itinerary_requests r
+        WHERE r.id = p.request_id
+    """)
+
+    op.execute("""
+        CREATE OR REPLACE FUNCTION sync_proposal_group_size() RETURNS trigger AS $$
+        BEGIN
+            UPDATE itinerary_proposals
+            SET request_group_size = NEW.group_size
+            WHERE request_id = NEW.id;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+    op.execute("""
+        CREATE TRIGGER trg_requests_group_size
+        AFTER UPDATE OF group_size ON itinerary_requests
+        FOR EACH ROW WHEN (OLD.group_size IS DISTINCT FROM NEW.group_size)
+        EXECUTE FUNCTION sync_proposal_group_size();
+    """)
+
+
+def downgrade() -> None:
+    """Drop group size trigger, function and column"""
+    op.execute("DROP TRIGGER IF EXISTS trg_requests_group_size ON itinerary_requests")
+    op.execute("DROP FUNCTION IF EXISTS sync_proposal_group_size()")
+    op.drop_column('itinerary_proposals', 'request_group_size')
@@ -0,0 +1,144 @@
+"""Range-partition messages and notifications by month on created_at
+
+Revision ID: 2026_10_15_1050_partitions
+Revises: 2026_10_15_1040_group_size
+Create Date: 2026-10-15 10:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1050_partitions'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1040_group_size'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PARTITIONED_TABLES = ['messages', 'notifications']
+
+# Months of partitions created ahead of the current one
+MONTHS_AHEAD = 3
+
+ENSURE_PARTITIONS_SQL = """
+    CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+        parent text, months_ahead int, from_month date DEFAULT NULL
+    ) RETURNS void AS $$
+    DECLARE
+        part_start date := date_trunc('month', coalesce(from_month, now()::date))::date;
+        last_start date := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+        part_name text;
+    BEGIN
+        WHILE part_start <= last_start LOOP
+            part_name := format('%s_%s', parent, to_char(part_start, 'YYYY_MM'));
+            IF to_regclass(part_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part_name, parent, part_start, (part_start + interval '1 month')::date
+                );
+            END IF;
+            part_start := (part_start + interval '1 month')::date;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+LAST_MESSAGE_TRIGGER_SQL = """
+    CREATE TRIGGER trg_messages_last_msg
+    AFTER INSERT ON messages
+    FOR EACH ROW EXECUTE FUNCTION upd_conv_last_msg();
+"""
+
+
+def _secondary_index_defs(conn, table):
+    """CREATE INDEX statements for every non-primary-key index on table"""
+    return conn.execute(sa.text("""
+        SELECT pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = CAST(:table AS regclass) AND NOT i.indisprimary
+    """), {'table': table}).scalars().all()
+
+
+def _primary_key_name(conn, table):
+    return conn.execute(sa.text("""
+        SELECT conname FROM pg_constraint
+        WHERE conrelid = CAST(:table AS regclass) AND contype = 'p'
+    """), {'table': table}).scalar_one()
+
+
+def _foreign_key_defs(conn, table):
+    """(name, definition) for every foreign key on table"""
+    return conn.execute(sa.text("""
+        SELECT conname, pg_get_constraintdef(oid)
+        FROM pg_constraint
+        WHERE conrelid = CAST(:table AS regclass) AND contype = 'f'
+    """), {'table': table}).all()
+
+
+def _rebuild(table, partitioned):
+    """Copy table into a freshly created (un)partitioned table of the same shape and swap it in"""
+    conn = op.get_bind()
+    # Indexes on a partitioned parent are reported as "ON ONLY"; recreate them on the whole tree
+    index_defs = [
+        index_def.replace(' ON ONLY ', ' ON ')
+        for index_def in _secondary_index_defs(conn, table)
+    ]
+    foreign_keys = _foreign_key_defs(conn, table)
+    primary_key = _primary_key_name(conn, table)
+    old_table = f'{table}_old'
+
+    # Free the table and primary key index names for the rebuilt table
+    op.execute(f'ALTER TABLE {table} RENAME TO {old_table}')
+    op.execute(f'ALTER TABLE {old_table} RENAME CONSTRAINT {primary_key} TO {old_table}_pkey')
+
+    if partitioned:
+        op.execute(f'UPDATE {old_table} SET created_at = now() WHERE created_at IS NULL')
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE (created_at)'
+        )
+        op.execute(f'ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL')
+        # Partitioned tables require the partition key in the primary key
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)')
+
+        # Monthly partitions covering existing rows, plus a catch-all default
+        op.execute(
+            f"SELECT ensure_monthly_partitions('{table}', {MONTHS_AHEAD}, "
+            f"(SELECT min(created_at)::date FROM {old_table}))"
+        )
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+    else:
+        op.execute(
+            f'CREATE TABLE {table} (LIKE {old_table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)')
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old_table}')
+    op.execute(f'DROP TABLE {old_table} CASCADE')
+
+    for index_def in index_defs:
+        op.execute(index_def)
+    for name, definition in foreign_keys:
+        op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+
+
+def upgrade() -> None:
+    """Rebuild messages and notifications as monthly RANGE (created_at) partitioned tables"""
+    op.execute(ENSURE_PARTITIONS_SQL)
+
+    for table in PARTITIONED_TABLES:
+        _rebuild(table, partitioned=True)
+
+    # Dropped along with the old messages table
+    op.execute(LAST_MESSAGE_TRIGGER_SQL)
+
+
+def downgrade() -> None:
+    """Rebuild messages and notifications as plain tables keyed on id"""
+    for table in PARTITIONED_TABLES:
+        # Dropping the partitioned parent drops its monthly partitions as well
+        _rebuild(table, partitioned=False)
+
+    op.execute(LAST_MESSAGE_TRIGGER_SQL)
+    op.execute('DROP FUNCTION IF EXISTS ensure_monthly_partitions(text, int, date)')
@@ -0,0 +1,42 @@
+"""Cover the unread notification listing with a partial index
+
+Revision ID: 2026_10_15_1100_notif_unread
+Revises: 2026_10_15_1050_partitions
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1100_notif_unread'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1050_partitions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UNREAD_INCLUDE = ['type', 'title', 'priority']
+
+
+def upgrade() -> None:
+    """Key unread notifications on (user_id, created_at DESC) and INCLUDE the badge columns"""
+    # Plain CREATE INDEX: CONCURRENTLY is not supported on a partitioned parent,
+    # and now() cannot appear in an index predicate, so expiry stays in the query
+    op.create_index(
+        'ix_notif_user_unread', 'notifications', ['user_id', sa.text('created_at DESC')],
+        postgresql_include=UNREAD_INCLUDE,
+        postgresql_where=sa.text('is_read = false')
+    )
+
+    # Superseded: same predicate, narrower key
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
+
+
+def downgrade() -> None:
+    """Restore the user_id-only partial index"""
+    op.create_index(
+        'ix_notifications_user_unread', 'notifications', ['user_id'],
+        postgresql_where=sa.text('is_read = false')
+    )
+    op.drop_index('ix_notif_user_unread', table_name='notifications')
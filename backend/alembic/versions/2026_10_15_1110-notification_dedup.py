@@ -0,0 +1,32 @@
+"""Add notification_dedup for idempotent proposal notifications
+
+Revision ID: 2026_10_15_1110_notif_dedup
+Revises: 2026_10_15_1100_notif_unread
+Create Date: 2026-10-15 11:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1110_notif_dedup'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1100_notif_unread'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the claimed-key table used by INSERT ... ON CONFLICT DO NOTHING"""
+    op.create_table(
+        'notification_dedup',
+        sa.Column('key', sa.String(length=200), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('key')
+    )
+
+
+def downgrade() -> None:
+    """Drop notification_dedup"""
+    op.drop_table('notification_dedup')
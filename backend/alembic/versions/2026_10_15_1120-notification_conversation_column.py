@@ -0,0 +1,61 @@
+"""Move notification conversation_id out of extra_data into a column
+
+Revision ID: 2026_10_15_1120_notif_conv
+Revises: 2026_10_15_1110_notif_dedup
+Create Date: 2026-10-15 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1120_notif_conv'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1110_notif_dedup'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add related_conversation_id, backfill it from extra_data and drop the JSON key"""
+    op.add_column(
+        'notifications',
+        sa.Column('related_conversation_id', postgresql.UUID(as_uuid=True), nullable=True)
+    )
+
+    # Keys pointing at deleted conversations would fail the foreign key
+    op.execute("""
+        UPDATE notifications n
+        SET related_conversation_id = c.id,
+            extra_data = NULLIF(n.extra_data - 'conversation_id', '{}'::jsonb)
+        FROM conversations c
+        WHERE n.extra_data ? 'conversation_id'
+          AND c.id::text = n.extra_data->>'conversation_id'
+    """)
+
+    op.create_foreign_key(
+        'notifications_related_conversation_id_fkey', 'notifications', 'conversations',
+        ['related_conversation_id'], ['id'], ondelete='CASCADE'
+    )
+
+    # Plain CREATE INDEX: CONCURRENTLY is not supported on a partitioned parent
+    op.create_index(
+        'ix_notifications_related_conversation', 'notifications', ['related_conversation_id'],
+        postgresql_where=sa.text('related_conversation_id IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    """Fold related_conversation_id back into extra_data and drop the column"""
+    op.execute("""
+        UPDATE notifications
+        SET extra_data = COALESCE(extra_data, '{}'::jsonb)
+            || jsonb_build_object('conversation_id', related_conversation_id::text)
+        WHERE related_conversation_id IS NOT NULL
+    """)
+
+    op.drop_index('ix_notifications_related_conversation', table_name='notifications')
+    op.drop_constraint('notifications_related_conversation_id_fkey', 'notifications', type_='foreignkey')
+    op.drop_column('notifications', 'related_conversation_id')
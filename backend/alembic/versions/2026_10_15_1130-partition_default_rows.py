@@ -0,0 +1,97 @@
+"""Move default-partition rows into new monthly partitions as they are created
+
+Revision ID: 2026_10_15_1130_part_default
+Revises: 2026_10_15_1120_notif_conv
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '2026_10_15_1130_part_default'
+down_revision: Union[str, Sequence[str], None] = '2026_10_15_1120_notif_conv'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# CREATE TABLE ... PARTITION OF fails once the default partition holds rows for
+# the new range, so each month is built detached, the matching rows are moved
+# out of the default partition, and the table is then attached
+ENSURE_PARTITIONS_SQL = """
+    CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+        parent text, months_ahead int, from_month date DEFAULT NULL
+    ) RETURNS void AS $$
+    DECLARE
+        part_start date := date_trunc('month', coalesce(from_month, now()::date))::date;
+        last_start date := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+        default_part text := format('%s_default', parent);
+        part_end date;
+        part_name text;
+    BEGIN
+        WHILE part_start <= last_start LOOP
+            part_name := format('%s_%s', parent, to_char(part_start, 'YYYY_MM'));
+            part_end := (part_start + interval '1 month')::date;
+            IF to_regclass(part_name) IS NULL THEN
+                IF to_regclass(default_part) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                        part_name, parent, part_start, part_end
+                    );
+                ELSE
+                    -- Hold off inserts into the default partition until the range is attached
+                    EXECUTE format('LOCK TABLE %I IN ACCESS EXCLUSIVE MODE', default_part);
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                        part_name, parent
+                    );
+                    EXECUTE format(
+                        'WITH moved AS (DELETE FROM %I WHERE created_at >= %L AND created_at < %L RETURNING *) '
+                        'INSERT INTO %I SELECT * FROM moved',
+                        default_part, part_start, part_end, part_name
+                    );
+                    EXECUTE format(
+                        'ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        parent, part_name, part_start, part_end
+                    );
+                END IF;
+            END IF;
+            part_start := part_end;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+# As created by 2026_10_15_1050_partitions
+PREVIOUS_ENSURE_PARTITIONS_SQL = """
+    CREATE OR REPLACE FUNCTION ensure_monthly_partitions(
+        parent text, months_ahead int, from_month date DEFAULT NULL
+    ) RETURNS void AS $$
+    DECLARE
+        part_start date := date_trunc('month', coalesce(from_month, now()::date))::date;
+        last_start date := (date_trunc('month', now()) + make_interval(months => months_ahead))::date;
+        part_name text;
+    BEGIN
+        WHILE part_start <= last_start LOOP
+            part_name := format('%s_%s', parent, to_char(part_start, 'YYYY_MM'));
+            IF to_regclass(part_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+                    part_name, parent, part_start, (part_start + interval '1 month')::date
+                );
+            END IF;
+            part_start := (part_start + interval '1 month')::date;
+        END LOOP;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    """Replace ensure_monthly_partitions with a version that drains the default partition"""
+    op.execute(ENSURE_PARTITIONS_SQL)
+
+
+def downgrade() -> None:
+    """Restore the create-only ensure_monthly_partitions"""
+    op.execute(PREVIOUS_ENSURE_PARTITIONS_SQL)
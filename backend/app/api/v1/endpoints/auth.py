@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
 from app.schemas.auth import UserSignup, UserLogin, TokenResponse, LogoutResponse
-from app.services.auth_service import AuthService, ACCESS_TOKEN_EXPIRE_HOURS
+from app.services.auth_service import AuthService
 
 router = APIRouter()
 
@@ -52,7 +52,7 @@ async def get_current_user_info(
     from app.schemas.auth import UserResponse
     
     user_response = UserResponse(
-        id=str(current_user.id),
+        id=current_user.id,
         email=current_user.email,
         full_name=current_user.full_name,
         role=current_user.role,
@@ -60,39 +60,14 @@ async def get_current_user_info(
         bio=current_user.bio,
         onboarding_completed=current_user.onboarding_completed,
         is_active=current_user.is_active,
-        created_at=current_user.created_at.isoformat()
+        created_at=current_user.created_at
     )
     
-    return {"user": user_response.dict()}
+    return {"user": user_response}
 
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     current_user = Depends(get_current_active_user)
 ):
     """Refresh the current user's access token."""
-    from app.core.security import create_access_token
-    from app.schemas.auth import UserResponse
-    
-    # Generate a new access token for the current user
-    access_token = create_access_token(
-        data={"sub": str(current_user.id), "email": current_user.email, "role": current_user.role}
-    )
-    
-    # Return new token with user data
-    user_response = UserResponse(
-        id=str(current_user.id),
-        email=current_user.email,
-        full_name=current_user.full_name,
-        role=current_user.role,
-        profile_picture_url=current_user.profile_picture_url,
-        bio=current_user.bio,
-        onboarding_completed=current_user.onboarding_completed,
-        is_active=current_user.is_active,
-        created_at=current_user.created_at.isoformat()
-    )
-    
-    return TokenResponse(
-        access_token=access_token,
-        expires_in=ACCESS_TOKEN_EXPIRE_HOURS * 3600,
-        user=user_response
-    )
\ No newline at end of file
+    return AuthService.build_token_response(current_user)
\ No newline at end of file
@@ -7,7 +7,7 @@ from app.core.database import get_db
 from app.core.dependencies import get_current_user_websocket
 from app.models.user import User
 from app.models.conversation import Conversation
-from app.models.message import Message, MessageStatus
+from app.models.message import Message
 from typing import Dict, Set, List, Optional
 import json
 import asyncio
@@ -261,14 +261,8 @@ async def handle_send_message(
             message_type=message_data.get("message_type", "text")
         )
 
+        # Conversation last message info is updated by the messages trigger
         db.add(message)
-        await db.flush()  # Get the message ID
-
-        # Update conversation last message info
-        conversation.last_message_at = message.created_at
-        conversation.last_message_content = content[:100]
-        conversation.last_message_sender_id = user.id
-
         await db.commit()
         await db.refresh(message)
 
@@ -311,24 +305,10 @@ async def handle_mark_as_read(
         if not message_ids:
             return
 
-        # Mark messages as read
-        from sqlalchemy import update
-        stmt = (
-            update(Message)
-            .where(
-                and_(
-                    Message.id.in_([UUID(mid) for mid in message_ids]),
-                    Message.conversation_id == conversation.id,
-                    Message.sender_id != user.id,  # Can't mark own messages as read
-                    Message.status != MessageStatus.READ
-                )
-            )
-            .values(
-                status=MessageStatus.READ,
-                read_at=datetime.utcnow()
-            )
+        # Mark messages as read (own messages are excluded)
+        await Message.mark_conversation_read(
+            db, conversation.id, user.id, [UUID(mid) for mid in message_ids]
         )
-        await db.execute(stmt)
         await db.commit()
 
         # Broadcast read status to conversation participants
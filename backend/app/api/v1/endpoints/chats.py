@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, insert, delete, and_, or_, desc, func
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy import select, update, insert, delete, and_, or_, desc, func, case
+from sqlalchemy.orm import Bundle, selectinload, joinedload, raiseload, load_only
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
+from app.core.responses import struct_json_response
 from app.models.user import User
 from app.models.conversation import Conversation
 from app.models.message import Message, MessageStatus
@@ -11,12 +12,21 @@ from app.schemas.chat import (
     ConversationCreate, ConversationResponse, MessageCreate, MessageUpdate,
     MessageResponse, ChatListResponse, MessageListResponse
 )
+from app.schemas.fast import (
+    MessageResponseFast, ConversationResponseFast, MessageListFast, ChatListFast
+)
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
 
 router = APIRouter()
 
+# Participant columns read by the chat serializers; skips bio, password_hash etc.
+_PARTICIPANT_COLUMNS = (User.id, User.full_name, User.profile_picture_url)
+
+# Same columns projected straight into the list queries as a named row
+_PARTICIPANT = Bundle('participant', *_PARTICIPANT_COLUMNS)
+
 @router.get("/", response_model=ChatListResponse)
 async def get_conversations(
     limit: int = Query(20, ge=1, le=100),
@@ -26,12 +36,23 @@ async def get_conversations(
 ):
     """Get user's conversations with pagination"""
     try:
-        # Build query for conversations where user is participant
+        # Build query for conversations where user is participant, joined to the other participant
+        other_participant_id = case(
+            (Conversation.traveler_id == current_user.id, Conversation.local_id),
+            else_=Conversation.traveler_id
+        )
         stmt = (
-            select(Conversation)
+            select(Conversation, _PARTICIPANT)
+            .join(User, User.id == other_participant_id)
             .options(
-                selectinload(Conversation.traveler),
-                selectinload(Conversation.local)
+                load_only(
+                    Conversation.id, Conversation.traveler_id, Conversation.local_id,
+                    Conversation.last_message_at, Conversation.last_message_content,
+                    Conversation.last_message_sender_id, Conversation.is_active,
+                    Conversation.created_at, Conversation.updated_at,
+                    raiseload=True
+                ),
+                raiseload('*')
             )
             .where(
                 and_(
@@ -59,7 +80,8 @@ async def get_conversations(
         )
 
         result = await db.execute(stmt)
-        conversations = result.scalars().all()
+        rows = result.all()
+        conversations = [conversation for conversation, _ in rows]
 
         # Get total count
         count_stmt = (
@@ -87,34 +109,37 @@ async def get_conversations(
         total_result = await db.execute(count_stmt)
         total = total_result.scalar() or 0
 
-        # Get unread counts for each conversation
-        conversation_responses = []
-        for conversation in conversations:
-            # Count unread messages
+        # Get unread counts for all listed conversations in one grouped query
+        unread_counts = {}
+        if conversations:
             unread_stmt = (
-                select(func.count(Message.id))
+                select(Message.conversation_id, func.count(Message.id))
                 .where(
                     and_(
-                        Message.conversation_id == conversation.id,
+                        Message.conversation_id.in_([c.id for c in conversations]),
                         Message.sender_id != current_user.id,
                         Message.status != MessageStatus.READ
                     )
                 )
+                .group_by(Message.conversation_id)
             )
             unread_result = await db.execute(unread_stmt)
-            unread_count = unread_result.scalar() or 0
-
-            other_participant = conversation.get_other_participant(current_user.id)
-            conversation_response = ConversationResponse.from_orm_with_participant(
-                conversation, current_user.id, other_participant, unread_count
-            )
-            conversation_responses.append(conversation_response)
+            unread_counts = dict(unread_result.all())
+
+        # Read-only rows go straight to JSON via msgspec; no Pydantic models materialized
+        conversation_responses = [
+            ConversationResponseFast(**ConversationResponse.orm_row(
+                conversation, current_user.id, participant,
+                unread_count=unread_counts.get(conversation.id, 0)
+            ))
+            for conversation, participant in rows
+        ]
 
-        return ChatListResponse(
+        return struct_json_response(ChatListFast(
             conversations=conversation_responses,
             total=total,
             has_more=(offset + len(conversations)) < total
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(
@@ -167,12 +192,10 @@ async def create_conversation(
                 existing_conversation, current_user.id, local_user
             )
 
-        # Create new conversation
+        # Create new conversation (last_message_* is filled in by the messages trigger)
         conversation = Conversation(
             traveler_id=current_user.id,
-            local_id=conversation_data.local_id,
-            last_message_content=conversation_data.initial_message[:100],
-            last_message_sender_id=current_user.id
+            local_id=conversation_data.local_id
         )
 
         db.add(conversation)
@@ -236,10 +259,10 @@ async def get_messages(
                 detail="Conversation not found or access denied"
             )
 
-        # Get messages with sender information
+        # Get messages with sender name/avatar projected from a single join
         stmt = (
-            select(Message)
-            .options(selectinload(Message.sender))
+            select(Message, _PARTICIPANT)
+            .join(User, User.id == Message.sender_id)
             .where(Message.conversation_id == conversation_id)
             .order_by(desc(Message.created_at))
             .limit(limit)
@@ -247,7 +270,7 @@ async def get_messages(
         )
 
         result = await db.execute(stmt)
-        messages = result.scalars().all()
+        messages = result.all()
 
         # Get total count
         count_stmt = (
@@ -258,39 +281,21 @@ async def get_messages(
         total = total_result.scalar() or 0
 
         # Mark unread messages as read (for messages sent to current user)
-        unread_messages_stmt = (
-            select(Message.id)
-            .where(
-                and_(
-                    Message.conversation_id == conversation_id,
-                    Message.sender_id != current_user.id,
-                    Message.status != MessageStatus.READ
-                )
-            )
-        )
-        unread_result = await db.execute(unread_messages_stmt)
-        unread_message_ids = [row[0] for row in unread_result.fetchall()]
-
-        if unread_message_ids:
-            mark_read_stmt = (
-                update(Message)
-                .where(Message.id.in_(unread_message_ids))
-                .values(status=MessageStatus.READ, read_at=func.now())
-            )
-            await db.execute(mark_read_stmt)
+        if await Message.mark_conversation_read(db, conversation_id, current_user.id):
             await db.commit()
 
         # Convert to response format
+        # Read-only rows go straight to JSON via msgspec; no Pydantic models materialized
         message_responses = [
-            MessageResponse.from_orm_with_sender(message)
-            for message in reversed(messages)  # Reverse to show oldest first
+            MessageResponseFast(**MessageResponse.orm_row(message, sender))
+            for message, sender in reversed(messages)  # Reverse to show oldest first
         ]
 
-        return MessageListResponse(
+        return struct_json_response(MessageListFast(
             messages=message_responses,
             total=total,
             has_more=(offset + len(messages)) < total
-        )
+        ))
 
     except HTTPException:
         raise
@@ -340,20 +345,8 @@ async def send_message(
             message_type=message_data.message_type
         )
 
+        # Conversation last message info is updated by the messages trigger
         db.add(message)
-        await db.flush()  # Get the message ID
-
-        # Update conversation last message info
-        update_conversation_stmt = (
-            update(Conversation)
-            .where(Conversation.id == conversation_id)
-            .values(
-                last_message_at=func.now(),
-                last_message_content=message_data.content[:100],
-                last_message_sender_id=current_user.id
-            )
-        )
-        await db.execute(update_conversation_stmt)
         await db.commit()
 
         # Refresh to get relationships
@@ -1,9 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, and_, or_, desc, func
-from sqlalchemy.orm import selectinload, joinedload
+from sqlalchemy.orm import Bundle, aliased, selectinload, joinedload
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
+from app.core.responses import model_json_response
 from app.models.user import User
 from app.models.itinerary_request import ItineraryRequest, ItineraryRequestStatus
 from app.models.itinerary_proposal import ItineraryProposal, ProposalStatus
@@ -12,7 +13,7 @@ from app.schemas.itinerary import (
     ItineraryProposalCreate, ItineraryProposalUpdate, ItineraryProposalResponse,
     ItineraryRequestListResponse, ItineraryProposalListResponse,
     ItineraryRequestStatusUpdate, ItineraryProposalStatusUpdate,
-    ItineraryRequestFilters
+    ItineraryRequestFilters, REQUEST_LIST_ADAPTER
 )
 from typing import List, Optional
 from uuid import UUID
@@ -37,13 +38,17 @@ async def get_itinerary_requests(
     """Get itinerary requests with filtering and pagination"""
     try:
         # Build base query
+        # Traveler/local name and avatar projected from aliased users; aliased per
+        # call because aliasing at import configures mappers before all models load
+        traveler_user, local_user = aliased(User), aliased(User)
         stmt = (
-            select(ItineraryRequest)
-            .options(
-                selectinload(ItineraryRequest.traveler),
-                selectinload(ItineraryRequest.local),
-                selectinload(ItineraryRequest.proposals)
+            select(
+                ItineraryRequest,
+                Bundle('traveler', traveler_user.full_name, traveler_user.profile_picture_url),
+                Bundle('local', local_user.full_name, local_user.profile_picture_url)
             )
+            .join(traveler_user, traveler_user.id == ItineraryRequest.traveler_id)
+            .outerjoin(local_user, local_user.id == ItineraryRequest.local_id)
         )
 
         # Apply filters
@@ -79,7 +84,7 @@ async def get_itinerary_requests(
         stmt = stmt.order_by(desc(ItineraryRequest.created_at)).limit(limit).offset(offset)
 
         result = await db.execute(stmt)
-        requests = result.scalars().all()
+        requests = result.all()
 
         # Get total count
         count_stmt = select(func.count(ItineraryRequest.id))
@@ -90,25 +95,17 @@ async def get_itinerary_requests(
         total = total_result.scalar() or 0
 
         # Convert to response format
-        request_responses = []
-        for request in requests:
-            request_response = ItineraryRequestResponse.from_orm(request)
-            request_response.duration_days = request.duration_days
-            request_response.proposal_count = request.proposal_count
-            request_response.traveler_name = request.traveler.full_name
-            request_response.traveler_avatar = request.traveler.profile_picture_url
+        request_responses = REQUEST_LIST_ADAPTER.validate_python([
+            ItineraryRequestResponse.orm_row(request, traveler, local)
+            for request, traveler, local in requests
+        ])
 
-            if request.local:
-                request_response.local_name = request.local.full_name
-                request_response.local_avatar = request.local.profile_picture_url
-
-            request_responses.append(request_response)
-
-        return ItineraryRequestListResponse(
+        # Items are already validated; serialize the page in one pass
+        return model_json_response(ItineraryRequestListResponse.model_construct(
             requests=request_responses,
             total=total,
             has_more=(offset + len(requests)) < total
-        )
+        ))
 
     except Exception as e:
         raise HTTPException(
@@ -174,8 +171,7 @@ async def get_itinerary_request(
             select(ItineraryRequest)
             .options(
                 selectinload(ItineraryRequest.traveler),
-                selectinload(ItineraryRequest.local),
-                selectinload(ItineraryRequest.proposals)
+                selectinload(ItineraryRequest.local)
             )
             .where(ItineraryRequest.id == request_id)
         )
@@ -1,15 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update, delete, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Bundle, aliased, selectinload, raiseload
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
+from app.core.responses import model_json_response
 from app.models.user import User
 from app.models.itinerary_request import ItineraryRequest, ItineraryRequestStatus
 from app.models.itinerary_proposal import ItineraryProposal, ProposalStatus
 from app.schemas.itinerary import (
     ItineraryProposalCreate, ItineraryProposalUpdate, ItineraryProposalResponse,
-    ItineraryProposalStatusUpdate, ItineraryProposalListResponse, ItineraryRequestListResponse
+    ItineraryProposalStatusUpdate, ItineraryProposalListResponse, ItineraryRequestListResponse,
+    ItineraryRequestResponse, REQUEST_LIST_ADAPTER, DAILY_ITINERARY_ADAPTER
 )
 from uuid import UUID
 from datetime import datetime
@@ -70,12 +72,16 @@ async def create_itinerary_proposal(
             )
 
         # Create proposal
-        proposal_dict = proposal_data.dict()
-        proposal_dict.pop('request_id')  # Remove to avoid duplicate
+        proposal_dict = proposal_data.model_dump(exclude={'request_id', 'daily_itinerary'})
+        # Only the JSONB day plan needs JSON mode, so dates/times are stored as ISO strings
+        proposal_dict['daily_itinerary'] = DAILY_ITINERARY_ADAPTER.dump_python(
+            proposal_data.daily_itinerary, mode='json'
+        )
 
         proposal = ItineraryProposal(
             request_id=proposal_data.request_id,
             local_id=current_user.id,
+            request_group_size=request.group_size,
             **proposal_dict
         )
 
@@ -203,7 +209,11 @@ async def update_itinerary_proposal(
             )
 
         # Update fields
-        update_data = proposal_data.dict(exclude_unset=True)
+        update_data = proposal_data.model_dump(exclude_unset=True, exclude={'daily_itinerary'})
+        if proposal_data.daily_itinerary is not None:
+            update_data['daily_itinerary'] = DAILY_ITINERARY_ADAPTER.dump_python(
+                proposal_data.daily_itinerary, mode='json'
+            )
         for field, value in update_data.items():
             setattr(proposal, field, value)
 
@@ -401,8 +411,9 @@ async def get_my_proposals(
         stmt = (
             select(ItineraryProposal)
             .options(
-                selectinload(ItineraryProposal.local),
-                selectinload(ItineraryProposal.request)
+                selectinload(ItineraryProposal.local).selectinload(User.local_profile),
+                selectinload(ItineraryProposal.request),
+                raiseload('*')
             )
             .where(ItineraryProposal.local_id == current_user.id)
         )
@@ -473,12 +484,18 @@ async def get_available_requests_for_locals(
             )
 
         # Build base query - only show public requests that can receive proposals
+        # Traveler/local name and avatar projected from aliased users; aliased per
+        # call because aliasing at import configures mappers before all models load
+        traveler_user, local_user = aliased(User), aliased(User)
         stmt = (
-            select(ItineraryRequest)
-            .options(
-                selectinload(ItineraryRequest.traveler),
-                selectinload(ItineraryRequest.proposals)
+            select(
+                ItineraryRequest,
+                Bundle('traveler', traveler_user.full_name, traveler_user.profile_picture_url),
+                Bundle('local', local_user.full_name, local_user.profile_picture_url)
             )
+            .join(traveler_user, traveler_user.id == ItineraryRequest.traveler_id)
+            .outerjoin(local_user, local_user.id == ItineraryRequest.local_id)
+            .options(selectinload(ItineraryRequest.proposals))
             .where(
                 and_(
                     ItineraryRequest.is_public == True,
@@ -512,7 +529,7 @@ async def get_available_requests_for_locals(
         stmt = stmt.order_by(desc(ItineraryRequest.created_at)).limit(limit).offset(offset)
 
         result = await db.execute(stmt)
-        requests = result.scalars().all()
+        requests = result.all()
 
         # Get total count
         count_stmt = select(func.count(ItineraryRequest.id)).where(
@@ -531,14 +548,8 @@ async def get_available_requests_for_locals(
         total = total_result.scalar() or 0
 
         # Convert to response format and check if local already has a proposal
-        request_responses = []
-        for request in requests:
-            request_response = ItineraryRequestResponse.from_orm(request)
-            request_response.duration_days = request.duration_days
-            request_response.proposal_count = request.proposal_count
-            request_response.traveler_name = request.traveler.full_name
-            request_response.traveler_avatar = request.traveler.profile_picture_url
-
+        rows = []
+        for request, traveler, local in requests:
             # Check if current local already has a proposal for this request
             existing_proposal = None
             for proposal in request.proposals:
@@ -547,18 +558,23 @@ async def get_available_requests_for_locals(
                     break
 
             # Add custom field to indicate if local can create proposal
-            request_response.can_propose = existing_proposal is None
-            if existing_proposal:
-                request_response.my_proposal_id = str(existing_proposal.id)
-                request_response.my_proposal_status = existing_proposal.status.value
-
-            request_responses.append(request_response)
-
-        return ItineraryRequestListResponse(
+            rows.append(ItineraryRequestResponse.orm_row(
+                request,
+                traveler,
+                local,
+                can_propose=existing_proposal is None,
+                my_proposal_id=str(existing_proposal.id) if existing_proposal else None,
+                my_proposal_status=existing_proposal.status.value if existing_proposal else None
+            ))
+
+        request_responses = REQUEST_LIST_ADAPTER.validate_python(rows)
+
+        # Items are already validated; serialize the page in one pass
+        return model_json_response(ItineraryRequestListResponse.model_construct(
             requests=request_responses,
             total=total,
             has_more=(offset + len(requests)) < total
-        )
+        ))
 
     except HTTPException:
         raise
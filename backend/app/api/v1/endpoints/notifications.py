@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, raiseload
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
 from app.models.user import User
@@ -18,6 +18,9 @@ from typing import Optional, List
 
 router = APIRouter()
 
+# Related user columns read by notification serialization
+_RELATED_USER_COLUMNS = (User.id, User.full_name, User.profile_picture_url)
+
 @router.get("/", response_model=NotificationListResponse)
 async def get_my_notifications(
     limit: int = Query(20, ge=1, le=100),
@@ -41,7 +44,7 @@ async def get_my_notifications(
     # Get notifications with pagination
     result = await db.execute(
         select(Notification)
-        .options(selectinload(Notification.related_user))
+        .options(selectinload(Notification.related_user).load_only(*_RELATED_USER_COLUMNS), raiseload('*'))
         .where(and_(*conditions))
         .order_by(Notification.created_at.desc())
         .limit(limit)
@@ -102,7 +105,7 @@ async def get_notification_stats(
     # Get recent notifications
     recent_result = await db.execute(
         select(Notification)
-        .options(selectinload(Notification.related_user))
+        .options(selectinload(Notification.related_user).load_only(*_RELATED_USER_COLUMNS), raiseload('*'))
         .where(Notification.user_id == current_user.id)
         .order_by(Notification.created_at.desc())
         .limit(5)
@@ -123,29 +126,23 @@ async def mark_notifications_as_read(
 ):
     """Mark specific notifications as read"""
 
-    # Get notifications that belong to current user
-    result = await db.execute(
-        select(Notification).where(
-            and_(
-                Notification.id.in_(request.notification_ids),
-                Notification.user_id == current_user.id
-            )
-        )
-    )
-    notifications = result.scalars().all()
+    marked_count = await Notification.mark_all_read(db, current_user.id, request.notification_ids)
 
-    if not notifications:
-        raise HTTPException(
-            status_code=404,
-            detail="No notifications found"
+    if not marked_count:
+        # Nothing was unread; distinguish "already read" from "not found"
+        owned_result = await db.execute(
+            select(func.count(Notification.id)).where(
+                and_(
+                    Notification.id.in_(request.notification_ids),
+                    Notification.user_id == current_user.id
+                )
+            )
         )
-
-    # Mark as read
-    marked_count = 0
-    for notification in notifications:
-        if not notification.is_read:
-            notification.mark_as_read()
-            marked_count += 1
+        if not owned_result.scalar():
+            raise HTTPException(
+                status_code=404,
+                detail="No notifications found"
+            )
 
     await db.commit()
 
@@ -161,26 +158,12 @@ async def mark_all_notifications_as_read(
 ):
     """Mark all notifications as read for current user"""
 
-    # Get all unread notifications
-    result = await db.execute(
-        select(Notification).where(
-            and_(
-                Notification.user_id == current_user.id,
-                Notification.is_read == False
-            )
-        )
-    )
-    notifications = result.scalars().all()
-
-    # Mark as read
-    for notification in notifications:
-        notification.mark_as_read()
-
+    marked_count = await Notification.mark_all_read(db, current_user.id)
     await db.commit()
 
     return {
-        "message": f"Marked {len(notifications)} notifications as read",
-        "marked_count": len(notifications)
+        "message": f"Marked {marked_count} notifications as read",
+        "marked_count": marked_count
     }
 
 @router.delete("/{notification_id}")
@@ -221,8 +204,8 @@ async def clear_all_notifications(
 ):
     """Clear old notifications for current user"""
 
-    from datetime import timedelta
-    cutoff_date = datetime.utcnow() - timedelta(days=older_than_days)
+    from datetime import timedelta, timezone
+    cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
 
     # Get old notifications
     result = await db.execute(
@@ -253,9 +236,9 @@ async def create_test_notification(
 ):
     """Create a test notification for development"""
 
-    notification = await NotificationService.notify_system_announcement(
+    [(notification_id, _)] = await NotificationService.notify_system_announcement(
         db=db,
-        user_id=current_user.id,
+        user_ids=[current_user.id],
         title="Test Notification",
         message="This is a test notification to verify the notification system is working correctly.",
         action_url="/dashboard"
@@ -264,7 +247,7 @@ async def create_test_notification(
     result = await db.execute(
         select(Notification)
         .options(selectinload(Notification.related_user))
-        .where(Notification.id == notification.id)
+        .where(Notification.id == notification_id)
     )
     notification = result.scalar_one()
 
@@ -284,6 +267,7 @@ def _notification_to_response(notification: Notification) -> NotificationBase:
         related_proposal_id=notification.related_proposal_id,
         related_request_id=notification.related_request_id,
         related_user_id=notification.related_user_id,
+        related_conversation_id=notification.related_conversation_id,
         is_read=notification.is_read,
         read_at=notification.read_at,
         is_sent=notification.is_sent,
@@ -292,5 +276,5 @@ def _notification_to_response(notification: Notification) -> NotificationBase:
         created_at=notification.created_at,
         expires_at=notification.expires_at,
         related_user_name=notification.related_user.full_name if notification.related_user else None,
-        related_user_avatar=notification.related_user.avatar_url if notification.related_user else None
+        related_user_avatar=notification.related_user.profile_picture_url if notification.related_user else None
     )
\ No newline at end of file
@@ -5,6 +5,7 @@ from app.core.dependencies import get_current_active_user
 from app.models.user import User
 from app.schemas.profile import ProfileUpdate, ProfileResponse
 from app.services.profile_service import ProfileService
+from uuid import UUID
 
 router = APIRouter()
 
@@ -61,7 +62,7 @@ async def complete_onboarding(
 
 @router.get("/{user_id}", response_model=ProfileResponse)
 async def get_user_profile(
-    user_id: str,
+    user_id: UUID,
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
@@ -214,56 +214,66 @@ async def get_user_review_stats(
 ):
     """Get review statistics for a user"""
 
-    # Get all public reviews for the user
-    result = await db.execute(
-        select(Review)
-        .options(
-            selectinload(Review.reviewer),
-            selectinload(Review.reviewee),
-            selectinload(Review.proposal)
-        )
-        .where(
-            and_(
-                Review.reviewee_id == user_id,
-                Review.is_public == True
-            )
+    public_reviews = and_(
+        Review.reviewee_id == user_id,
+        Review.is_public == True
+    )
+
+    # Totals, per-rating counts and aspect averages in one aggregate query
+    stats_result = await db.execute(
+        select(
+            func.count(Review.id),
+            func.avg(Review.rating),
+            *(func.count(Review.id).filter(Review.rating == rating) for rating in range(1, 6)),
+            func.avg(Review.communication_rating),
+            func.avg(Review.knowledge_rating),
+            func.avg(Review.reliability_rating),
+            func.avg(Review.value_rating)
         )
-        .order_by(Review.created_at.desc())
+        .where(public_reviews)
     )
-    reviews = result.scalars().all()
+    total, average_rating, *counts = stats_result.one()
+    rating_counts, aspect_averages = tuple(counts[:5]), counts[5:]
 
-    if not reviews:
+    if not total:
         return ReviewStatsResponse(
             total_reviews=0,
             average_rating=0.0,
-            rating_distribution={1: 0, 2: 0, 3: 0, 4: 0, 5: 0},
+            average_communication=None,
+            average_knowledge=None,
+            average_reliability=None,
+            average_value=None,
             recent_reviews=[]
         )
 
-    # Calculate statistics
-    ratings = [review.rating for review in reviews]
-    average_rating = sum(ratings) / len(ratings)
-
-    # Rating distribution
-    distribution = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-    for rating in ratings:
-        distribution[rating] += 1
+    # Only the latest few reviews are needed as full rows
+    recent_result = await db.execute(
+        select(Review)
+        .options(
+            selectinload(Review.reviewer),
+            selectinload(Review.reviewee),
+            selectinload(Review.proposal)
+        )
+        .where(public_reviews)
+        .order_by(Review.created_at.desc())
+        .limit(5)
+    )
+    recent_reviews = recent_result.scalars().all()
 
-    # Aspect averages
-    communication_ratings = [r.communication_rating for r in reviews if r.communication_rating]
-    knowledge_ratings = [r.knowledge_rating for r in reviews if r.knowledge_rating]
-    reliability_ratings = [r.reliability_rating for r in reviews if r.reliability_rating]
-    value_ratings = [r.value_rating for r in reviews if r.value_rating]
+    communication, knowledge, reliability, value = (
+        round(float(average), 2) if average is not None else None
+        for average in aspect_averages
+    )
 
     return ReviewStatsResponse(
-        total_reviews=len(reviews),
-        average_rating=round(average_rating, 2),
-        rating_distribution=distribution,
-        average_communication=round(sum(communication_ratings) / len(communication_ratings), 2) if communication_ratings else None,
-        average_knowledge=round(sum(knowledge_ratings) / len(knowledge_ratings), 2) if knowledge_ratings else None,
-        average_reliability=round(sum(reliability_ratings) / len(reliability_ratings), 2) if reliability_ratings else None,
-        average_value=round(sum(value_ratings) / len(value_ratings), 2) if value_ratings else None,
-        recent_reviews=[_review_to_response(review) for review in reviews[:5]]
+        total_reviews=total,
+        average_rating=round(float(average_rating), 2),
+        rating_counts=rating_counts,
+        average_communication=communication,
+        average_knowledge=knowledge,
+        average_reliability=reliability,
+        average_value=value,
+        recent_reviews=[_review_to_response(review) for review in recent_reviews]
     )
 
 @router.post("/{review_id}/respond", response_model=ReviewBase)
@@ -3,7 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from app.core.database import get_db
 from app.core.dependencies import get_current_active_user
-from app.core.caching import cache_manager, user_cache_key, cache_result, invalidate_cache_pattern
+from app.core.caching import cache_manager, user_cache_key, user_row_cache_key, cache_result, invalidate_cache_pattern
 from app.core.error_handlers import ResourceNotFoundException, ValidationException
 from app.models.user import User
 from app.schemas.profile import UserProfileUpdate, UserProfileResponse
@@ -67,8 +67,9 @@ async def update_my_profile(
         updated_user = result.scalar_one()
         await db.commit()
         
-        # Invalidate user cache
+        # Invalidate user caches
         await cache_manager.delete(user_cache_key(str(current_user.id)))
+        await cache_manager.delete(user_row_cache_key(str(current_user.id)))
         
         logger.info("User profile updated", user_id=current_user.id, updated_fields=list(filtered_data.keys()))
         return UserProfileResponse.from_orm(updated_user)
@@ -175,6 +176,9 @@ async def deactivate_my_account(
         await db.execute(stmt)
         await db.commit()
         
+        # Drop the cached row so is_active=False is seen immediately
+        await cache_manager.delete(user_row_cache_key(str(current_user.id)))
+        
         return {"message": "Account deactivated successfully"}
         
     except Exception as e:
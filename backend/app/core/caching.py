@@ -3,7 +3,10 @@ Redis-based caching system for LocalGhost API performance optimization.
 """
 import json
 import asyncio
-from typing import Any, Optional, Union
+import socket
+import orjson
+from blake3 import blake3
+from typing import Any, Dict, Optional, Tuple, Union
 from datetime import timedelta
 import redis.asyncio as redis
 from app.core.config import settings
@@ -11,23 +14,39 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Keep idle pooled connections alive through NAT/load balancer idle timeouts
+_KEEPALIVE_OPTIONS = {
+    opt: value
+    for opt, value in (
+        (getattr(socket, "TCP_KEEPIDLE", None), 60),
+        (getattr(socket, "TCP_KEEPINTVL", None), 10),
+        (getattr(socket, "TCP_KEEPCNT", None), 3),
+    )
+    if opt is not None
+}
+
 class CacheManager:
     """Redis-based cache manager with connection pooling and error handling."""
     
     def __init__(self):
         self.redis: Optional[redis.Redis] = None
-        self._connection_pool: Optional[redis.ConnectionPool] = None
+        self._connection_pool: Optional[redis.BlockingConnectionPool] = None
     
     async def connect(self):
         """Initialize Redis connection."""
         try:
             if not self.redis:
-                self._connection_pool = redis.ConnectionPool.from_url(
+                # Blocking pool waits for a free connection instead of failing
+                # under contention; hiredis is picked up automatically if installed
+                self._connection_pool = redis.BlockingConnectionPool.from_url(
                     settings.REDIS_URL,
-                    max_connections=20,
-                    retry_on_timeout=True
+                    max_connections=50,
+                    timeout=5,
+                    retry_on_timeout=True,
+                    socket_keepalive=True,
+                    socket_keepalive_options=_KEEPALIVE_OPTIONS
                 )
-                self.redis = redis.Redis(connection_pool=self._connection_pool)
+                self.redis = redis.Redis(connection_pool=self._connection_pool, decode_responses=False)
                 
                 # Test connection
                 await self.redis.ping()
@@ -45,13 +64,13 @@ class CacheManager:
                 await self._connection_pool.disconnect()
             logger.info("Redis cache disconnected")
     
-    def _serialize(self, data: Any) -> str:
+    def _serialize(self, data: Any) -> bytes:
         """Serialize data for Redis storage."""
-        return json.dumps(data, default=str)
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
     
-    def _deserialize(self, data: str) -> Any:
+    def _deserialize(self, data: Union[bytes, str]) -> Any:
         """Deserialize data from Redis storage."""
-        return json.loads(data)
+        return orjson.loads(data)
     
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
@@ -139,6 +158,47 @@ class CacheManager:
             logger.warning("Cache increment error", key=key, error=str(e))
             return None
     
+    async def zset_trim_and_count(
+        self,
+        key: str,
+        min_score: float
+    ) -> Optional[Tuple[int, Optional[float]]]:
+        """Drop sorted set members scored <= min_score; return (size, lowest score)."""
+        if not self.redis:
+            return None
+        
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(key, "-inf", min_score)
+                pipe.zcard(key)
+                pipe.zrange(key, 0, 0, withscores=True)
+                _, count, lowest = await pipe.execute()
+            return count, (lowest[0][1] if lowest else None)
+        except Exception as e:
+            logger.warning("Cache zset trim error", key=key, error=str(e))
+            return None
+    
+    async def zadd(
+        self,
+        key: str,
+        mapping: Dict[str, float],
+        expire: Optional[Union[int, timedelta]] = None
+    ) -> bool:
+        """Add scored members to a sorted set with optional expiration."""
+        if not self.redis:
+            return False
+        
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.zadd(key, mapping)
+                if expire:
+                    pipe.expire(key, expire)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning("Cache zadd error", key=key, error=str(e))
+            return False
+    
     async def ping(self) -> bool:
         """Test Redis connection."""
         if not self.redis:
@@ -159,6 +219,10 @@ def user_cache_key(user_id: str) -> str:
     """Generate cache key for user data."""
     return f"user:{user_id}"
 
+def user_row_cache_key(user_id: str) -> str:
+    """Generate cache key for a user's stored columns."""
+    return f"user_row:{user_id}"
+
 def local_profile_cache_key(user_id: str) -> str:
     """Generate cache key for local profile data."""
     return f"local_profile:{user_id}"
@@ -174,7 +238,9 @@ def itinerary_request_cache_key(request_id: str) -> str:
 def search_cache_key(query: str, filters: dict) -> str:
     """Generate cache key for search results."""
     filter_str = json.dumps(filters, sort_keys=True)
-    return f"search:{hash(query + filter_str)}"
+    # Stable digest so every worker process derives the same key
+    digest = blake3((query + filter_str).encode()).hexdigest(length=16)
+    return f"search:{digest}"
 
 def analytics_cache_key(user_id: str, period: str) -> str:
     """Generate cache key for analytics data."""
@@ -232,6 +298,7 @@ async def invalidate_user_cache(user_id: str):
     """Invalidate all cache entries for a user."""
     patterns = [
         f"user:{user_id}",
+        f"user_row:{user_id}",
         f"local_profile:{user_id}",
         f"analytics:{user_id}:*"
     ]
@@ -17,8 +17,11 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str = Field(env="DATABASE_URL")
-    DATABASE_POOL_SIZE: int = Field(default=10, env="DATABASE_POOL_SIZE")
-    DATABASE_MAX_OVERFLOW: int = Field(default=20, env="DATABASE_MAX_OVERFLOW")
+    DATABASE_POOL_SIZE: int = Field(default=20, env="DATABASE_POOL_SIZE")
+    DATABASE_MAX_OVERFLOW: int = Field(default=40, env="DATABASE_MAX_OVERFLOW")
+    DATABASE_POOL_TIMEOUT: int = Field(default=2, env="DATABASE_POOL_TIMEOUT")  # seconds
+    # Set when connecting through PgBouncer in transaction mode (no prepared statement caching)
+    DATABASE_USE_PGBOUNCER: bool = Field(default=False, env="DATABASE_USE_PGBOUNCER")
     
     # Redis Cache
     REDIS_URL: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
@@ -29,6 +32,7 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_HOURS: int = Field(default=24, env="ACCESS_TOKEN_EXPIRE_HOURS")
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7, env="REFRESH_TOKEN_EXPIRE_DAYS")
     ALGORITHM: str = Field(default="HS256", env="ALGORITHM")
+    BCRYPT_ROUNDS: int = Field(default=12, env="BCRYPT_ROUNDS")
     
     # CORS
     ALLOWED_ORIGINS: List[str] = Field(
@@ -54,6 +58,7 @@ class Settings(BaseSettings):
     SMTP_USERNAME: Optional[str] = Field(default=None, env="SMTP_USERNAME")
     SMTP_PASSWORD: Optional[str] = Field(default=None, env="SMTP_PASSWORD")
     SMTP_USE_TLS: bool = Field(default=True, env="SMTP_USE_TLS")
+    SMTP_FROM_ADDRESS: Optional[str] = Field(default=None, env="SMTP_FROM_ADDRESS")  # Defaults to SMTP_USERNAME
     
     # Monitoring
     SENTRY_DSN: Optional[str] = Field(default=None, env="SENTRY_DSN")
@@ -81,8 +86,9 @@ def get_database_config():
         "url": settings.DATABASE_URL,
         "pool_size": settings.DATABASE_POOL_SIZE,
         "max_overflow": settings.DATABASE_MAX_OVERFLOW,
-        "pool_timeout": 30,
-        "pool_recycle": 3600,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": 1800,
+        "statement_cache_size": 0 if settings.DATABASE_USE_PGBOUNCER else 1024,
         "echo": settings.DEBUG,
     }
 
@@ -99,7 +105,8 @@ def get_redis_config():
 def get_cors_config():
     """Get CORS configuration."""
     return {
-        "allow_origins": settings.ALLOWED_ORIGINS,
+        # CORSMiddleware checks `origin in allow_origins` per request; a set makes it O(1)
+        "allow_origins": frozenset(settings.ALLOWED_ORIGINS),
         "allow_credentials": True,
         "allow_methods": ["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
         "allow_headers": ["*"],
@@ -1,6 +1,6 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData, event
+from sqlalchemy import Enum, MetaData, event, text
 import asyncio
 import structlog
 from app.core.config import settings, get_database_config
@@ -17,14 +17,24 @@ engine = create_async_engine(
     max_overflow=db_config["max_overflow"],
     pool_timeout=db_config["pool_timeout"],
     pool_recycle=db_config["pool_recycle"],
-    pool_pre_ping=True,
+    # No ping per checkout: recycling and server-side keepalives (below) cut down on
+    # stale connections, but one the server has already dropped still fails the
+    # request that checks it out
+    pool_pre_ping=False,
     echo=db_config["echo"],
     # Connection arguments for better performance
     connect_args={
         "command_timeout": settings.QUERY_TIMEOUT,
+        # asyncpg's and SQLAlchemy's prepared statement caches; both must be off behind PgBouncer
+        "statement_cache_size": db_config["statement_cache_size"],
+        "prepared_statement_cache_size": db_config["statement_cache_size"],
         "server_settings": {
             "application_name": "localghost_api",
             "jit": "off",  # Disable JIT for better performance in some cases
+            # Keep idle pooled connections alive through NAT/firewall idle timeouts
+            "tcp_keepalives_idle": "60",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "5",
         }
     }
 )
@@ -42,6 +52,21 @@ AsyncSessionLocal = async_sessionmaker(
 class Base(DeclarativeBase):
     metadata = MetaData()
 
+def _enum_values(enum_cls):
+    return [member.value for member in enum_cls]
+
+def str_enum(enum_cls, name: str) -> Enum:
+    """VARCHAR-backed Enum storing member values, guarded by the named CHECK constraint"""
+    return Enum(
+        enum_cls,
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        name=name,
+        values_callable=_enum_values,
+        validate_strings=True
+    )
+
 # Database connection event handlers
 @event.listens_for(engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
@@ -54,11 +79,35 @@ def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor.execute("SET effective_cache_size = '1GB'")
 
 # Dependency to get database session with proper error handling
+# Session.info key holding notification rows staged for the next commit
+NOTIFICATION_OUTBOX_KEY = "notification_outbox"
+
+def _report_uncommitted_notifications(session: AsyncSession) -> int:
+    """Drop notification rows a handler staged but never committed; returns how many"""
+    rows = session.info.pop(NOTIFICATION_OUTBOX_KEY, None)
+    if not rows:
+        return 0
+
+    # Imported here: app.core.monitoring imports this module
+    from app.core.monitoring import metrics_collector
+    metrics_collector.increment_counter("notifications_dropped_uncommitted", len(rows))
+    logger.error(
+        "Staged notifications dropped: the handler returned without committing",
+        count=len(rows),
+        types=sorted({str(row.get("type")) for row in rows})
+    )
+    return len(rows)
+
 async def get_db() -> AsyncSession:
     """Get database session with proper connection management."""
     session = AsyncSessionLocal()
     try:
         yield session
+        # Staged notifications are written by the handler's own commit, before
+        # the response goes out. Rows still staged here were never committed;
+        # this runs after the response is sent, so report them instead of
+        # writing them behind the client's back
+        _report_uncommitted_notifications(session)
     except Exception as e:
         logger.error("Database session error", error=str(e), exc_info=True)
         await session.rollback()
@@ -66,13 +115,52 @@ async def get_db() -> AsyncSession:
     finally:
         await session.close()
 
+# Tables range-partitioned by month on created_at, and how far ahead to provision
+PARTITIONED_TABLES = ("messages", "notifications")
+PARTITION_MONTHS_AHEAD = 3
+
+# How often partitions are topped up; well inside PARTITION_MONTHS_AHEAD
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 6 * 3600
+
+# Advisory lock key serializing partition maintenance across workers
+PARTITION_MAINTENANCE_LOCK_KEY = 0x70617274  # "part"
+
+async def ensure_partitions():
+    """Create upcoming monthly partitions so new rows never land in the default partition."""
+    async with engine.begin() as conn:
+        # Workers queue up here; the ones after the first find nothing left to create
+        await conn.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": PARTITION_MAINTENANCE_LOCK_KEY}
+        )
+        for table in PARTITIONED_TABLES:
+            # Also moves any rows that already landed in the default partition
+            await conn.execute(
+                text("SELECT ensure_monthly_partitions(:table, :months)"),
+                {"table": table, "months": PARTITION_MONTHS_AHEAD}
+            )
+
+async def run_partition_maintenance():
+    """Background loop provisioning monthly partitions every PARTITION_MAINTENANCE_INTERVAL_SECONDS"""
+    while True:
+        try:
+            await ensure_partitions()
+        except Exception as e:
+            # Rows past the horizon pile up in the default partition until this succeeds
+            logger.error("Failed to provision monthly partitions", error=str(e), exc_info=True)
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+
 # Database initialization
 async def init_db():
     """Initialize database connection and verify connectivity."""
+    # Models are imported lazily; register them all before mappers configure
+    from app.models import load_all_models
+    load_all_models()
+    
     try:
         # Test database connection
         async with engine.begin() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         
         logger.info("Database connection established successfully")
         return True
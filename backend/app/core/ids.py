@@ -0,0 +1,23 @@
+"""
+Time-ordered identifiers for primary keys
+"""
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Generate an RFC 9562 version 7 UUID (48-bit ms timestamp + 74 random bits).
+
+    Successive values sort by creation time, so B-tree primary key inserts land
+    near the right edge of the index instead of on random leaf pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 62) & 0xFFF) << 64       # rand_a
+    value |= 0b10 << 62                         # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    return uuid.UUID(int=value)
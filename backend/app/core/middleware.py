@@ -13,6 +13,7 @@ from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from app.core.config import settings, get_rate_limit_config
+from app.core.security import SECURITY_HEADER_ITEMS
 
 logger = structlog.get_logger()
 
@@ -78,16 +79,11 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         response = await call_next(request)
         
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-        
-        # Add HSTS header in production
-        if settings.ENVIRONMENT == "production":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        # Add precomputed security headers, keeping any the route set itself
+        present = {name for name, _ in response.raw_headers}
+        response.raw_headers.extend(
+            item for item in SECURITY_HEADER_ITEMS if item[0] not in present
+        )
         
         return response
 
@@ -3,20 +3,32 @@ Advanced rate limiting implementation using Redis.
 """
 import time
 import json
+import uuid
 from typing import Optional, Dict, Any
-from fastapi import Request, HTTPException, status
+from cachetools import TTLCache
+from fastapi import Depends, Request, HTTPException, status
+from redis.exceptions import ResponseError
 from app.core.caching import cache_manager
 from app.core.config import settings
+from app.core.dependencies import get_current_user_optional
+from app.core.security import get_client_ip
+from app.models.user import User
 import structlog
 
 logger = structlog.get_logger()
 
+# Locally remembered denials: (strategy, key, limit, window) -> reset_time.
+# Repeat requests from a throttled key are rejected without a Redis round trip.
+_deny_cache: TTLCache = TTLCache(maxsize=100_000, ttl=300)
+
 class RateLimiter:
     """Redis-based rate limiter with multiple strategies."""
     
     def __init__(self):
         self.default_limit = settings.RATE_LIMIT_REQUESTS
         self.default_window = settings.RATE_LIMIT_WINDOW
+        # Whether the redis-cell module (CL.THROTTLE) is loaded; None until probed
+        self._cell_available: Optional[bool] = None
     
     async def is_allowed(
         self,
@@ -40,47 +52,60 @@ class RateLimiter:
         limit = limit or self.default_limit
         window = window or self.default_window
         
+        now = time.time()
+        deny_key = (strategy, key, limit, window)
+        reset_time = _deny_cache.get(deny_key)
+        if reset_time is not None and reset_time > now:
+            return {
+                "allowed": False,
+                "limit": limit,
+                "remaining": 0,
+                "reset_time": reset_time,
+                "retry_after": int(reset_time - now)
+            }
+        
         if strategy == "sliding_window":
-            return await self._sliding_window(key, limit, window)
+            result = await self._sliding_window(key, limit, window)
         elif strategy == "fixed_window":
-            return await self._fixed_window(key, limit, window)
+            result = await self._fixed_window(key, limit, window)
         elif strategy == "token_bucket":
-            return await self._token_bucket(key, limit, window)
+            result = await self._token_bucket(key, limit, window)
         else:
             raise ValueError(f"Unknown rate limiting strategy: {strategy}")
+        
+        if not result["allowed"]:
+            _deny_cache[deny_key] = result["reset_time"]
+        return result
     
     async def _sliding_window(self, key: str, limit: int, window: int) -> Dict[str, Any]:
         """Sliding window rate limiting implementation."""
         now = time.time()
         window_start = now - window
         
-        # Get current requests
-        cache_key = f"rate_limit:sliding:{key}"
-        requests_data = await cache_manager.get(cache_key) or []
-        
-        # Filter requests within the window
-        valid_requests = [req_time for req_time in requests_data if req_time > window_start]
+        # Request timestamps live in a sorted set scored by time, so trimming
+        # and counting happen in Redis instead of decoding a list here
+        cache_key = f"rate_limit:sliding_zset:{key}"
+        window_state = await cache_manager.zset_trim_and_count(cache_key, window_start)
+        request_count, oldest = window_state or (0, None)
         
         # Check if under limit
-        if len(valid_requests) >= limit:
+        if request_count >= limit:
+            reset_time = (oldest if oldest is not None else now) + window
             return {
                 "allowed": False,
                 "limit": limit,
                 "remaining": 0,
-                "reset_time": min(valid_requests) + window,
-                "retry_after": int(min(valid_requests) + window - now)
+                "reset_time": reset_time,
+                "retry_after": int(reset_time - now)
             }
         
-        # Add current request
-        valid_requests.append(now)
-        
-        # Store updated requests
-        await cache_manager.set(cache_key, valid_requests, expire=window)
+        # Add current request (random suffix keeps same-timestamp members distinct)
+        await cache_manager.zadd(cache_key, {f"{now}:{uuid.uuid4().hex[:8]}": now}, expire=window)
         
         return {
             "allowed": True,
             "limit": limit,
-            "remaining": limit - len(valid_requests),
+            "remaining": limit - (request_count + 1),
             "reset_time": now + window,
             "retry_after": 0
         }
@@ -116,8 +141,39 @@ class RateLimiter:
             "retry_after": 0
         }
     
+    async def _cell_throttle(self, key: str, limit: int, window: int) -> Optional[Dict[str, Any]]:
+        """Token bucket via redis-cell's CL.THROTTLE; returns None if unavailable."""
+        try:
+            limited, total, remaining, retry_after, reset_after = await cache_manager.redis.execute_command(
+                "CL.THROTTLE", f"rate_limit:cell:{key}", limit - 1, limit, window, 1
+            )
+        except ResponseError as e:
+            if "unknown command" in str(e).lower():
+                self._cell_available = False
+                logger.info("redis-cell not loaded, using fallback token bucket")
+            else:
+                logger.warning("CL.THROTTLE error", key=key, error=str(e))
+            return None
+        except Exception as e:
+            logger.warning("CL.THROTTLE error", key=key, error=str(e))
+            return None
+        
+        self._cell_available = True
+        return {
+            "allowed": limited == 0,
+            "limit": total,
+            "remaining": remaining,
+            "reset_time": time.time() + reset_after,
+            "retry_after": max(retry_after, 0)
+        }
+    
     async def _token_bucket(self, key: str, limit: int, window: int) -> Dict[str, Any]:
         """Token bucket rate limiting implementation."""
+        if cache_manager.redis and self._cell_available is not False:
+            result = await self._cell_throttle(key, limit, window)
+            if result is not None:
+                return result
+        
         now = time.time()
         cache_key = f"rate_limit:bucket:{key}"
         
@@ -168,13 +224,7 @@ def get_rate_limit_key(request: Request, user_id: Optional[str] = None) -> str:
         return f"user:{user_id}"
     
     # Use IP address as fallback
-    client_ip = request.headers.get("X-Forwarded-For", "").split(",")[0].strip()
-    if not client_ip:
-        client_ip = request.headers.get("X-Real-IP", "")
-    if not client_ip and request.client:
-        client_ip = request.client.host
-    
-    return f"ip:{client_ip}"
+    return f"ip:{get_client_ip(request)}"
 
 async def check_rate_limit(
     request: Request,
@@ -210,46 +260,38 @@ def create_rate_limit_response(rate_limit_info: Dict[str, Any]) -> HTTPException
         }
     )
 
-# Rate limit decorators for different endpoints
+# Rate limit dependencies for different endpoints
 def rate_limit(
     limit: Optional[int] = None,
     window: Optional[int] = None,
     strategy: str = "sliding_window",
     per_user: bool = True
 ):
-    """Decorator for rate limiting endpoints."""
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            # Extract request and user from function arguments
-            request = None
-            user = None
-            
-            for arg in args:
-                if isinstance(arg, Request):
-                    request = arg
-                elif hasattr(arg, 'id'):  # User object
-                    user = arg
-            
-            for value in kwargs.values():
-                if isinstance(value, Request):
-                    request = value
-                elif hasattr(value, 'id'):  # User object
-                    user = value
-            
-            if not request:
-                # If no request found, skip rate limiting
-                return await func(*args, **kwargs)
-            
-            user_id = str(user.id) if user and per_user else None
-            rate_limit_info = await check_rate_limit(request, user_id, limit, window, strategy)
-            
-            if not rate_limit_info["allowed"]:
-                raise create_rate_limit_response(rate_limit_info)
-            
-            return await func(*args, **kwargs)
+    """
+    Build a FastAPI dependency that enforces a rate limit.
+    
+    Usage: ``@router.post(..., dependencies=[Depends(API_RATE_LIMIT)])``.
+    The request and (optional) current user are resolved by FastAPI during
+    routing, so no argument scanning happens on the request path.
+    """
+    async def enforce(request: Request, user_id: Optional[str]) -> None:
+        rate_limit_info = await check_rate_limit(request, user_id, limit, window, strategy)
+        if not rate_limit_info["allowed"]:
+            raise create_rate_limit_response(rate_limit_info)
+    
+    if not per_user:
+        async def ip_rate_limit_dependency(request: Request) -> None:
+            await enforce(request, None)
         
-        return wrapper
-    return decorator
+        return ip_rate_limit_dependency
+    
+    async def user_rate_limit_dependency(
+        request: Request,
+        user: Optional[User] = Depends(get_current_user_optional)
+    ) -> None:
+        await enforce(request, str(user.id) if user else None)
+    
+    return user_rate_limit_dependency
 
 # Predefined rate limits for different endpoint types
 AUTH_RATE_LIMIT = rate_limit(limit=5, window=300, strategy="sliding_window", per_user=False)  # 5 per 5 minutes
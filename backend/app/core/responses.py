@@ -0,0 +1,28 @@
+"""
+Pre-serialized JSON responses for list endpoints.
+"""
+import msgspec
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_json_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a response model in one pydantic-core pass and bypass FastAPI's re-encoding.
+
+    The route's response_model still documents the schema; returning a Response
+    skips FastAPI's per-item validation and jsonable_encoder walk.
+    """
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def struct_json_response(obj: msgspec.Struct, status_code: int = 200) -> Response:
+    """Encode a msgspec Struct straight to JSON bytes for read-only outbound payloads."""
+    return Response(
+        content=msgspec.json.encode(obj),
+        status_code=status_code,
+        media_type="application/json"
+    )
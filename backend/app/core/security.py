@@ -1,11 +1,18 @@
 """
 Security utilities and middleware for LocalGhost API.
 """
+import os
 import re
+import time
+import base64
+import asyncio
+import uuid
 import hashlib
 import secrets
-from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from collections import OrderedDict, defaultdict, deque
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Deque, Mapping, Tuple
+from datetime import datetime, timedelta, timezone
 from fastapi import Request, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
@@ -16,7 +23,11 @@ import structlog
 logger = structlog.get_logger()
 
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 # Security headers
 SECURITY_HEADERS = {
@@ -28,26 +39,62 @@ SECURITY_HEADERS = {
     "Content-Security-Policy": "default-src 'self'; script-src 'self' 'unsafe-inline'; style-src 'self' 'unsafe-inline'; img-src 'self' data: https:; font-src 'self' data:; connect-src 'self' https:; frame-ancestors 'none';",
 }
 
+# Common attack patterns, keyed by the group name reported when they match
+_SQL_INJECTION_NAMED_PATTERNS = (
+    ("sqli_keyword", r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION|SCRIPT)\b)"),
+    ("sqli_numeric_tautology", r"(\b(OR|AND)\s+\d+\s*=\s*\d+)"),
+    ("sqli_string_tautology", r"(\b(OR|AND)\s+'.*'\s*=\s*'.*')"),
+    ("sqli_comment", r"(--|#|\/\*|\*\/)"),
+    ("sqli_union", r"(\b(UNION|UNION ALL)\b)"),
+)
+
+_XSS_NAMED_PATTERNS = (
+    ("xss_script", r"<script[^>]*>.*?</script>"),
+    ("xss_javascript_uri", r"javascript:"),
+    ("xss_event_handler", r"on\w+\s*="),
+    ("xss_iframe", r"<iframe[^>]*>.*?</iframe>"),
+    ("xss_object", r"<object[^>]*>.*?</object>"),
+    ("xss_embed", r"<embed[^>]*>.*?</embed>"),
+)
+
+SQL_INJECTION_PATTERNS = [pattern for _, pattern in _SQL_INJECTION_NAMED_PATTERNS]
+XSS_PATTERNS = [pattern for _, pattern in _XSS_NAMED_PATTERNS]
+
+
+def _combine_patterns(named_patterns, flags: int) -> "re.Pattern[str]":
+    """Fuse patterns into one alternation so the input is scanned once."""
+    return re.compile(
+        "|".join(f"(?P<{name}>{pattern})" for name, pattern in named_patterns),
+        flags,
+    )
+
+
+# Patterns are compiled once at import so the hot validation paths skip the
+# per-call lookup in the ``re`` module cache. ``Match.lastgroup`` names the
+# pattern that fired.
+_SQL_INJECTION_RE = _combine_patterns(_SQL_INJECTION_NAMED_PATTERNS, re.IGNORECASE)
+_XSS_RE = _combine_patterns(_XSS_NAMED_PATTERNS, re.IGNORECASE | re.DOTALL)
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_WEAK_PASSWORD_RE = (
+    re.compile(r'^[0-9]+$'),  # Only numbers
+    re.compile(r'^[a-zA-Z]+$'),  # Only letters
+    re.compile(r'^[^a-zA-Z0-9]+$'),  # Only special characters
+    re.compile(r'(.)\1{3,}'),  # Repeated characters
+)
+
+_SUSPICIOUS_FILENAME_RE = (
+    re.compile(r'\.\.', re.IGNORECASE),  # Directory traversal
+    re.compile(r'[<>:"|?*]', re.IGNORECASE),  # Invalid filename characters
+    re.compile(r'^(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])$', re.IGNORECASE),  # Windows reserved names
+)
+
 class SecurityValidator:
     """Input validation and sanitization utilities."""
     
     # Common attack patterns
-    SQL_INJECTION_PATTERNS = [
-        r"(\b(SELECT|INSERT|UPDATE|DELETE|DROP|CREATE|ALTER|EXEC|UNION|SCRIPT)\b)",
-        r"(\b(OR|AND)\s+\d+\s*=\s*\d+)",
-        r"(\b(OR|AND)\s+'.*'\s*=\s*'.*')",
-        r"(--|#|\/\*|\*\/)",
-        r"(\b(UNION|UNION ALL)\b)",
-    ]
-    
-    XSS_PATTERNS = [
-        r"<script[^>]*>.*?</script>",
-        r"javascript:",
-        r"on\w+\s*=",
-        r"<iframe[^>]*>.*?</iframe>",
-        r"<object[^>]*>.*?</object>",
-        r"<embed[^>]*>.*?</embed>",
-    ]
+    SQL_INJECTION_PATTERNS = SQL_INJECTION_PATTERNS
+    XSS_PATTERNS = XSS_PATTERNS
     
     @classmethod
     def validate_email(cls, email: str) -> bool:
@@ -55,24 +102,16 @@ class SecurityValidator:
         if not email or len(email) > 254:
             return False
         
-        # Basic email regex
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
+        # Reject suspicious shapes with plain string ops before the regex:
+        # missing or multiple @, consecutive dots, and a dot next to the @
+        at = email.find("@")
+        if at < 1 or email.find("@", at + 1) != -1:
+            return False
+        if ".." in email or email[at - 1] == "." or email[at + 1:at + 2] == ".":
             return False
         
-        # Check for suspicious patterns
-        suspicious_patterns = [
-            r'\.{2,}',  # Multiple consecutive dots
-            r'@.*@',    # Multiple @ symbols
-            r'\.@',     # Dot before @
-            r'@\.',     # @ before dot
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, email):
-                return False
-        
-        return True
+        # Basic email regex
+        return bool(_EMAIL_RE.match(email))
     
     @classmethod
     def validate_password(cls, password: str) -> Dict[str, Any]:
@@ -87,15 +126,8 @@ class SecurityValidator:
             return {"valid": False, "message": "Password must be less than 128 characters"}
         
         # Check for common weak patterns
-        weak_patterns = [
-            r'^[0-9]+$',  # Only numbers
-            r'^[a-zA-Z]+$',  # Only letters
-            r'^[^a-zA-Z0-9]+$',  # Only special characters
-            r'(.)\1{3,}',  # Repeated characters
-        ]
-        
-        for pattern in weak_patterns:
-            if re.match(pattern, password):
+        for pat in _WEAK_PASSWORD_RE:
+            if pat.match(password):
                 return {"valid": False, "message": "Password is too weak"}
         
         # Check for common passwords
@@ -123,24 +155,29 @@ class SecurityValidator:
         input_string = input_string.replace('\x00', '')
         
         # Check for XSS patterns
-        for pattern in cls.XSS_PATTERNS:
-            if re.search(pattern, input_string, re.IGNORECASE):
-                logger.warning("XSS pattern detected in input", pattern=pattern, input=input_string[:100])
-                return ""
+        match = _XSS_RE.search(input_string)
+        if match:
+            logger.warning("XSS pattern detected in input", pattern=match.lastgroup, input=input_string[:100])
+            return ""
         
         # Check for SQL injection patterns
-        for pattern in cls.SQL_INJECTION_PATTERNS:
-            if re.search(pattern, input_string, re.IGNORECASE):
-                logger.warning("SQL injection pattern detected in input", pattern=pattern, input=input_string[:100])
-                return ""
+        match = _SQL_INJECTION_RE.search(input_string)
+        if match:
+            logger.warning("SQL injection pattern detected in input", pattern=match.lastgroup, input=input_string[:100])
+            return ""
         
         return input_string.strip()
     
     @classmethod
     def validate_uuid(cls, uuid_string: str) -> bool:
         """Validate UUID format."""
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, uuid_string, re.IGNORECASE))
+        try:
+            parsed = uuid.UUID(uuid_string)
+        except (ValueError, TypeError, AttributeError):
+            return False
+        # uuid.UUID also accepts braces, URNs and unhyphenated hex; only the
+        # canonical hyphenated form is valid here.
+        return str(parsed) == uuid_string.lower()
     
     @classmethod
     def validate_file_upload(cls, filename: str, content_type: str, file_size: int) -> Dict[str, Any]:
@@ -170,14 +207,8 @@ class SecurityValidator:
             }
         
         # Check for suspicious filename patterns
-        suspicious_patterns = [
-            r'\.\.',  # Directory traversal
-            r'[<>:"|?*]',  # Invalid filename characters
-            r'^(CON|PRN|AUX|NUL|COM[1-9]|LPT[1-9])$',  # Windows reserved names
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
+        for pat in _SUSPICIOUS_FILENAME_RE:
+            if pat.search(filename):
                 return {
                     "valid": False,
                     "message": "Filename contains invalid characters or patterns"
@@ -188,61 +219,81 @@ class SecurityValidator:
 class RateLimiter:
     """Simple in-memory rate limiter."""
     
+    # Seconds between sweeps that drop keys with no requests left in their window
+    EVICTION_INTERVAL = 60
+    
     def __init__(self):
-        self.requests: Dict[str, List[float]] = {}
+        self.requests: Dict[str, Deque[float]] = defaultdict(deque)
+        self._max_window = 0
+        self._last_eviction = time.time()
     
     def is_allowed(self, key: str, limit: int, window: int) -> bool:
         """Check if request is allowed based on rate limit."""
         now = time.time()
         
-        # Clean old requests
-        if key in self.requests:
-            self.requests[key] = [
-                req_time for req_time in self.requests[key]
-                if now - req_time < window
-            ]
-        else:
-            self.requests[key] = []
+        # Clean old requests; timestamps are appended in order so expired
+        # entries are always at the left end
+        dq = self.requests[key]
+        cutoff = now - window
+        while dq and dq[0] <= cutoff:
+            dq.popleft()
+        
+        if window > self._max_window:
+            self._max_window = window
+        if now - self._last_eviction >= self.EVICTION_INTERVAL:
+            self._evict_idle(now)
         
         # Check if under limit
-        if len(self.requests[key]) >= limit:
+        if len(dq) >= limit:
             return False
         
         # Add current request
-        self.requests[key].append(now)
+        dq.append(now)
+        self.requests[key] = dq
         return True
+    
+    def _evict_idle(self, now: float) -> None:
+        """Drop keys whose newest request is older than any active window."""
+        cutoff = now - self._max_window
+        idle_keys = [key for key, dq in self.requests.items() if not dq or dq[-1] <= cutoff]
+        for key in idle_keys:
+            del self.requests[key]
+        self._last_eviction = now
 
 # Global rate limiter instance
 rate_limiter = RateLimiter()
 
 def get_client_ip(request: Request) -> str:
     """Get client IP address from request."""
-    # Check for forwarded headers first
-    forwarded_for = request.headers.get("X-Forwarded-For")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
-    
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip
+    # Reuse the address resolved earlier in this request, if any
+    if (client_ip := getattr(request.state, "client_ip", None)) is not None:
+        return client_ip
     
+    # Check for forwarded headers first
+    if forwarded_for := request.headers.get("X-Forwarded-For"):
+        client_ip = forwarded_for.split(",", 1)[0].strip()
+    elif real_ip := request.headers.get("X-Real-IP"):
+        client_ip = real_ip
     # Fallback to direct connection
-    if request.client:
-        return request.client.host
+    elif request.client:
+        client_ip = request.client.host
+    else:
+        client_ip = "unknown"
     
-    return "unknown"
+    request.state.client_ip = client_ip
+    return client_ip
 
-def hash_password(password: str) -> str:
-    """Hash password using bcrypt."""
-    return pwd_context.hash(password)
+async def hash_password(password: str) -> str:
+    """Hash password using bcrypt in a worker thread."""
+    return await asyncio.to_thread(pwd_context.hash, password)
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash in a worker thread."""
+    return await asyncio.to_thread(pwd_context.verify, plain_password, hashed_password)
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate cryptographically secure random token."""
-    return secrets.token_urlsafe(length)
+    return base64.urlsafe_b64encode(os.urandom(length)).rstrip(b"=").decode("ascii")
 
 def generate_csrf_token() -> str:
     """Generate CSRF token."""
@@ -288,24 +339,70 @@ def validate_request_headers(request: Request) -> bool:
     
     return True
 
-def get_security_headers() -> Dict[str, str]:
-    """Get security headers for response."""
-    headers = SECURITY_HEADERS.copy()
+def _build_security_headers() -> Mapping[str, str]:
+    """Build the response security headers for the current environment."""
+    headers = dict(SECURITY_HEADERS)
     
     # Add HSTS in production
     if settings.ENVIRONMENT == "production":
         headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains; preload"
     
-    return headers
+    return MappingProxyType(headers)
+
+def _build_response_header_items() -> Tuple[Tuple[bytes, bytes], ...]:
+    """Pre-encode the headers SecurityMiddleware adds to every response."""
+    # Responses carry no CSP, and HSTS without preload
+    headers = {
+        name: value for name, value in SECURITY_HEADERS.items()
+        if name != "Content-Security-Policy"
+    }
+    
+    if settings.ENVIRONMENT == "production":
+        headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+    
+    return tuple(
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in headers.items()
+    )
+
+# Environment is fixed per process, so the final header sets are built once
+_FROZEN_SECURITY_HEADERS = _build_security_headers()
+SECURITY_HEADER_ITEMS = _build_response_header_items()
+
+def get_security_headers() -> Mapping[str, str]:
+    """Get security headers for response (shared, read-only)."""
+    return _FROZEN_SECURITY_HEADERS
 
 # JWT Token Functions
+# Verified payloads keyed by a 128-bit blake2b digest of the token, so repeat
+# requests with the same bearer token skip the HMAC verify and JSON parse.
+TOKEN_CACHE_MAX_SIZE = 4096
+_verified_tokens: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Decode and verify a JWT, reusing the payload of a recently verified token."""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _verified_tokens.get(key)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > datetime.now(timezone.utc).timestamp():
+            _verified_tokens.move_to_end(key)
+            return dict(payload)
+        del _verified_tokens[key]
+    
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    _verified_tokens[key] = payload
+    if len(_verified_tokens) > TOKEN_CACHE_MAX_SIZE:
+        _verified_tokens.popitem(last=False)
+    return dict(payload)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token."""
     to_encode = data.copy()
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = datetime.now(timezone.utc) + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(hours=settings.ACCESS_TOKEN_EXPIRE_HOURS)
+        expire = datetime.now(timezone.utc) + timedelta(hours=settings.ACCESS_TOKEN_EXPIRE_HOURS)
     
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -314,15 +411,14 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify JWT token and return payload."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
+        return _decode_token(token)
     except JWTError:
         return None
 
 def create_refresh_token(data: dict) -> str:
     """Create JWT refresh token."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    expire = datetime.now(timezone.utc) + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     to_encode.update({"exp": expire, "type": "refresh"})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
@@ -330,7 +426,7 @@ def create_refresh_token(data: dict) -> str:
 def verify_refresh_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify JWT refresh token and return payload."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         if payload.get("type") != "refresh":
             return None
         return payload
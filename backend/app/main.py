@@ -1,7 +1,10 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 import os
 import asyncio
+import orjson
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
@@ -13,7 +16,17 @@ from app.core.config import settings, get_cors_config
 from app.core.error_handlers import setup_error_handlers
 from app.core.middleware import setup_middleware, health_check_with_metrics
 from app.core.caching import cache_manager
-from app.core.database import init_db
+from app.core.database import init_db, run_partition_maintenance
+from app.services.notification_service import NotificationService
+from app.services.notification_delivery import email_delivery
+
+def _openapi_bytes(app: FastAPI) -> bytes:
+    """OpenAPI spec encoded on first use and kept on app.state"""
+    spec = getattr(app.state, "openapi_bytes", None)
+    if spec is None:
+        # FastAPI caches the dict; encode it once
+        spec = app.state.openapi_bytes = orjson.dumps(app.openapi())
+    return spec
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -29,16 +42,39 @@ async def lifespan(app: FastAPI):
     await cache_manager.connect()
     print("✅ Cache system initialized")
     
+    # Hourly sweep of expired notifications
+    expiry_janitor = asyncio.create_task(NotificationService.run_expiry_janitor())
+    
+    # Monthly partitions, provisioned now and topped up for as long as the process runs
+    partition_maintenance = asyncio.create_task(run_partition_maintenance())
+    
+    # Encode the OpenAPI spec up front so the first docs request doesn't pay for it
+    _openapi_bytes(app)
+    print("✅ OpenAPI spec cached")
+    
     # Initialize Sentry if configured
     if settings.SENTRY_DSN:
         import sentry_sdk
+        from sentry_sdk.integrations.atexit import AtexitIntegration
+        from sentry_sdk.integrations.dedupe import DedupeIntegration
+        from sentry_sdk.integrations.excepthook import ExcepthookIntegration
         from sentry_sdk.integrations.fastapi import FastApiIntegration
+        from sentry_sdk.integrations.logging import LoggingIntegration
         from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
         
+        # Skip Sentry's auto-detection of every installed library and only
+        # load the integrations this app actually relies on
         sentry_sdk.init(
             dsn=settings.SENTRY_DSN,
+            default_integrations=False,
+            auto_enabling_integrations=False,
             integrations=[
-                FastApiIntegration(auto_enabling_instrumentations=False),
+                # Flush buffered events at shutdown and report uncaught exceptions
+                AtexitIntegration(),
+                ExcepthookIntegration(),
+                LoggingIntegration(),
+                DedupeIntegration(),
+                FastApiIntegration(),
                 SqlalchemyIntegration(),
             ],
             traces_sample_rate=0.1 if settings.ENVIRONMENT == "production" else 1.0,
@@ -54,6 +90,9 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     print("🛑 Shutting down LocalGhost API...")
+    expiry_janitor.cancel()
+    partition_maintenance.cancel()
+    await email_delivery.close()
     await cache_manager.disconnect()
     print("✅ Cache system disconnected")
     print("👋 LocalGhost API shutdown complete")
@@ -64,6 +103,10 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="A peer-to-peer travel connection platform API",
     debug=settings.DEBUG,
+    # orjson encodes UUID/datetime natively in C
+    default_response_class=ORJSONResponse,
+    # Spec and docs are served below from bytes encoded once
+    openapi_url=None,
     lifespan=lifespan
 )
 
@@ -99,4 +142,25 @@ async def health_check():
 
 # Include API routes
 from app.api.v1.router import api_router
-app.include_router(api_router, prefix="/api/v1")
\ No newline at end of file
+app.include_router(api_router, prefix="/api/v1")
+
+# OpenAPI spec and docs
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json():
+    return Response(content=_openapi_bytes(app), media_type="application/json")
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(
+        openapi_url="/openapi.json",
+        title=f"{settings.APP_NAME} - Swagger UI",
+        oauth2_redirect_url="/docs/oauth2-redirect"
+    )
+
+@app.get("/docs/oauth2-redirect", include_in_schema=False)
+async def swagger_ui_redirect():
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc():
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{settings.APP_NAME} - ReDoc")
\ No newline at end of file
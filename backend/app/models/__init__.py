@@ -1,14 +1,47 @@
-from .user import User, UserRole
-from .local_profile import LocalProfile
-from .user_location import UserLocation
-from .conversation import Conversation
-from .message import Message, MessageType, MessageStatus
-from .itinerary_request import ItineraryRequest, ItineraryRequestStatus
-from .itinerary_proposal import ItineraryProposal, ProposalStatus
-
-__all__ = [
-    "User", "UserRole", "LocalProfile", "UserLocation",
-    "Conversation", "Message", "MessageType", "MessageStatus",
-    "ItineraryRequest", "ItineraryRequestStatus",
-    "ItineraryProposal", "ProposalStatus"
-]
\ No newline at end of file
+"""
+Model package with lazily imported members (PEP 562).
+
+Importing ``app.models`` no longer configures every mapper up front; each
+model module is loaded on first attribute access. Code that needs the full
+metadata (startup, Alembic) calls ``load_all_models()``.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "User": "user",
+    "UserRole": "enums",
+    "LocalProfile": "local_profile",
+    "UserLocation": "user_location",
+    "Conversation": "conversation",
+    "Message": "message",
+    "MessageType": "enums",
+    "MessageStatus": "enums",
+    "ItineraryRequest": "itinerary_request",
+    "ItineraryRequestStatus": "enums",
+    "ItineraryProposal": "itinerary_proposal",
+    "ProposalStatus": "enums",
+    "Review": "review",
+    "Notification": "notification",
+    "NotificationType": "notification",
+    "NotificationPriority": "notification",
+    "NotificationDedup": "notification",
+}
+
+__all__ = list(_LAZY)
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+def load_all_models() -> None:
+    """Import every model module so relationships and metadata are complete."""
+    for module_name in set(_LAZY.values()):
+        importlib.import_module(f"{__name__}.{module_name}")
@@ -1,18 +1,32 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
+from app.core.ids import uuid7
 import uuid
 
+def _as_uuid(value):
+    """Coerce a user id to UUID once so participant checks compare UUIDs directly"""
+    return value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
+
 class Conversation(Base):
     __tablename__ = "conversations"
+    __table_args__ = (
+        # Covering indexes for each side's conversation list (ordered by last message)
+        Index('ix_conv_traveler_list', 'traveler_id', 'last_message_at',
+              postgresql_include=['last_message_content', 'last_message_sender_id'],
+              postgresql_where=text('is_active AND NOT traveler_archived')),
+        Index('ix_conv_local_list', 'local_id', 'last_message_at',
+              postgresql_include=['last_message_content', 'last_message_sender_id'],
+              postgresql_where=text('is_active AND NOT local_archived')),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     traveler_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
     local_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
 
-    # Conversation metadata
+    # Conversation metadata (maintained by the trg_messages_last_msg trigger on messages)
     last_message_at = Column(DateTime(timezone=True), server_default=func.now())
     last_message_content = Column(Text, nullable=True)
     last_message_sender_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=True)
@@ -30,27 +44,30 @@ class Conversation(Base):
     traveler = relationship("User", foreign_keys=[traveler_id], back_populates="traveler_conversations")
     local = relationship("User", foreign_keys=[local_id], back_populates="local_conversations")
     last_message_sender = relationship("User", foreign_keys=[last_message_sender_id])
-    messages = relationship("Message", back_populates="conversation", lazy="dynamic", cascade="all, delete-orphan")
+    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<Conversation {self.id}>"
 
     def get_other_participant(self, user_id):
         """Get the other participant in the conversation"""
-        if str(user_id) == str(self.traveler_id):
+        user_id = _as_uuid(user_id)
+        if user_id == self.traveler_id:
             return self.local
-        elif str(user_id) == str(self.local_id):
+        elif user_id == self.local_id:
             return self.traveler
         return None
 
     def is_participant(self, user_id):
         """Check if user is a participant in this conversation"""
-        return str(user_id) in [str(self.traveler_id), str(self.local_id)]
+        user_id = _as_uuid(user_id)
+        return user_id == self.traveler_id or user_id == self.local_id
 
     def is_archived_for_user(self, user_id):
         """Check if conversation is archived for specific user"""
-        if str(user_id) == str(self.traveler_id):
+        user_id = _as_uuid(user_id)
+        if user_id == self.traveler_id:
             return self.traveler_archived
-        elif str(user_id) == str(self.local_id):
+        elif user_id == self.local_id:
             return self.local_archived
         return False
\ No newline at end of file
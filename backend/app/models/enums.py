@@ -0,0 +1,44 @@
+"""
+Plain enums shared by models and schemas.
+
+Kept free of SQLAlchemy imports so schema-only consumers don't build the ORM
+metadata; the model modules re-export these names.
+"""
+import enum
+
+class UserRole(str, enum.Enum):
+    TRAVELER = "traveler"
+    LOCAL = "local"
+
+class AvailabilityStatus(str, enum.Enum):
+    AVAILABLE = "available"
+    BUSY = "busy"
+    UNAVAILABLE = "unavailable"
+
+class ItineraryRequestStatus(str, enum.Enum):
+    DRAFT = "draft"
+    PENDING = "pending"
+    IN_REVIEW = "in_review"
+    ACCEPTED = "accepted"
+    DECLINED = "declined"
+    CANCELLED = "cancelled"
+    COMPLETED = "completed"
+
+class ProposalStatus(str, enum.Enum):
+    DRAFT = "draft"
+    SUBMITTED = "submitted"
+    UNDER_REVIEW = "under_review"
+    ACCEPTED = "accepted"
+    DECLINED = "declined"
+    WITHDRAWN = "withdrawn"
+
+class MessageType(str, enum.Enum):
+    TEXT = "text"
+    SYSTEM = "system"
+    BOOKING_REQUEST = "booking_request"
+    BOOKING_CONFIRMATION = "booking_confirmation"
+
+class MessageStatus(str, enum.Enum):
+    SENT = "sent"
+    DELIVERED = "delivered"
+    READ = "read"
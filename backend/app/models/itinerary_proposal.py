@@ -1,23 +1,36 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Integer, Float, Enum
-from sqlalchemy.dialects.postgresql import UUID, JSON
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Integer, Float, Index, event, inspect, update
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
-import uuid
-import enum
-
-class ProposalStatus(str, enum.Enum):
-    DRAFT = "draft"
-    SUBMITTED = "submitted"
-    UNDER_REVIEW = "under_review"
-    ACCEPTED = "accepted"
-    DECLINED = "declined"
-    WITHDRAWN = "withdrawn"
+from sqlalchemy.orm.base import NO_VALUE
+from app.core.database import Base, str_enum
+from app.models.enums import ProposalStatus
+from app.core.ids import uuid7
+from app.models.itinerary_request import ItineraryRequest, _ACCEPTABLE_REQUEST_STATUSES, _status_set
+from functools import cached_property
+from itertools import islice
+
+_ACTIVE_PROPOSAL_STATUSES = _status_set(
+    ProposalStatus.SUBMITTED,
+    ProposalStatus.UNDER_REVIEW,
+    ProposalStatus.ACCEPTED
+)
+_EDITABLE_PROPOSAL_STATUSES = _status_set(
+    ProposalStatus.DRAFT,
+    ProposalStatus.SUBMITTED
+)
 
 class ItineraryProposal(Base):
     __tablename__ = "itinerary_proposals"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Containment (@>) lookups on the structured JSON fields
+        Index('ix_proposals_daily_itinerary_gin', 'daily_itinerary',
+              postgresql_using='gin', postgresql_ops={'daily_itinerary': 'jsonb_path_ops'}),
+        Index('ix_proposals_price_breakdown_gin', 'price_breakdown',
+              postgresql_using='gin', postgresql_ops={'price_breakdown': 'jsonb_path_ops'}),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     request_id = Column(UUID(as_uuid=True), ForeignKey("itinerary_requests.id"), nullable=False)
     local_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
 
@@ -28,13 +41,14 @@ class ItineraryProposal(Base):
 
     # Pricing
     total_price = Column(Float, nullable=False)
+    request_group_size = Column(Integer, nullable=True)  # Copied from the request; kept in sync by trigger
     currency = Column(String(3), nullable=False, default='USD')
-    price_breakdown = Column(JSON, nullable=True)  # Detailed cost breakdown
+    price_breakdown = Column(JSONB, nullable=True)  # Detailed cost breakdown
     includes = Column(Text, nullable=True)  # What's included in the price
     excludes = Column(Text, nullable=True)  # What's not included
 
     # Itinerary details
-    daily_itinerary = Column(JSON, nullable=False)  # Structured day-by-day plan
+    daily_itinerary = Column(JSONB, nullable=False)  # Structured day-by-day plan
     highlights = Column(Text, nullable=True)  # Key highlights of the itinerary
     estimated_duration_hours = Column(Integer, nullable=True)  # Total duration in hours
 
@@ -51,7 +65,11 @@ class ItineraryProposal(Base):
     special_notes = Column(Text, nullable=True)
 
     # Status and metadata
-    status = Column(Enum(ProposalStatus), default=ProposalStatus.DRAFT, nullable=False)
+    status = Column(
+        str_enum(ProposalStatus, "ck_itinerary_proposals_status"),
+        default=ProposalStatus.DRAFT,
+        nullable=False
+    )
     is_featured = Column(Boolean, default=False)  # Whether this is a featured proposal
 
     # Timestamps
@@ -64,7 +82,7 @@ class ItineraryProposal(Base):
     # Relationships
     request = relationship("ItineraryRequest", back_populates="proposals")
     local = relationship("User", back_populates="itinerary_proposals")
-    reviews = relationship("Review", back_populates="proposal", lazy="dynamic")
+    reviews = relationship("Review", back_populates="proposal")
 
     def __repr__(self):
         return f"<ItineraryProposal {self.id}: {self.title}>"
@@ -72,49 +90,66 @@ class ItineraryProposal(Base):
     @property
     def is_active(self):
         """Check if proposal is in an active state"""
-        return self.status in [
-            ProposalStatus.SUBMITTED,
-            ProposalStatus.UNDER_REVIEW,
-            ProposalStatus.ACCEPTED
-        ]
+        return self.status in _ACTIVE_PROPOSAL_STATUSES
+
+    def _loaded_request(self):
+        """Return the request if already loaded, without emitting a lazy load"""
+        request = inspect(self).attrs.request.loaded_value
+        return None if request is NO_VALUE else request
 
     @property
     def price_per_person(self):
         """Calculate price per person if group size is available"""
-        if self.request and self.request.group_size and self.request.group_size > 0:
-            return self.total_price / self.request.group_size
+        group_size = self.request_group_size
+        if group_size and group_size > 0:
+            return self.total_price / group_size
         return self.total_price
 
     @property
     def duration_days(self):
         """Get duration in days from the associated request"""
-        return self.request.duration_days if self.request else None
+        request = self._loaded_request()
+        return request.duration_days if request else None
 
     def can_be_edited_by(self, user_id):
         """Check if user can edit this proposal"""
-        return str(self.local_id) == str(user_id) and self.status in [
-            ProposalStatus.DRAFT,
-            ProposalStatus.SUBMITTED
-        ]
+        return str(self.local_id) == str(user_id) and self.status in _EDITABLE_PROPOSAL_STATUSES
+
+    def can_be_accepted(self, request=None):
+        """Check if proposal can be accepted (request must be passed or preloaded)"""
+        request = request or self._loaded_request()
+        return self.status == ProposalStatus.SUBMITTED and request is not None and request.status in _ACCEPTABLE_REQUEST_STATUSES
+
+    @cached_property
+    def daily_summary(self):
+        """Get a summary of daily activities (computed once per loaded instance)"""
+        daily = self.daily_itinerary
+        if not isinstance(daily, dict):
+            return []
 
-    def can_be_accepted(self):
-        """Check if proposal can be accepted"""
-        return self.status == ProposalStatus.SUBMITTED and self.request.status in [
-            "pending", "in_review"
+        return [
+            {
+                'day': day,
+                'activity_count': len(activities),
+                'activities': [activity.get('title', 'Activity') for activity in islice(activities, 3)]
+            }
+            for day, activities in daily.items()
+            if isinstance(activities, list)
         ]
 
-    def get_daily_summary(self):
-        """Get a summary of daily activities"""
-        if not self.daily_itinerary:
-            return []
-
-        summary = []
-        if isinstance(self.daily_itinerary, dict):
-            for day, activities in self.daily_itinerary.items():
-                if isinstance(activities, list):
-                    summary.append({
-                        'day': day,
-                        'activity_count': len(activities),
-                        'activities': [activity.get('title', 'Activity') for activity in activities[:3]]
-                    })
-        return summary
\ No newline at end of file
+def _adjust_proposal_count(connection, request_id, delta):
+    """Apply a +/- delta to the parent request's denormalized proposal_count."""
+    requests = ItineraryRequest.__table__
+    connection.execute(
+        update(requests)
+        .where(requests.c.id == request_id)
+        .values(proposal_count=requests.c.proposal_count + delta)
+    )
+
+@event.listens_for(ItineraryProposal, "after_insert")
+def _increment_proposal_count(mapper, connection, target):
+    _adjust_proposal_count(connection, target.request_id, 1)
+
+@event.listens_for(ItineraryProposal, "after_delete")
+def _decrement_proposal_count(mapper, connection, target):
+    _adjust_proposal_count(connection, target.request_id, -1)
@@ -1,24 +1,44 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Integer, Float, Enum
+from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Integer, Float, Index, Computed, text
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
-import uuid
-import enum
+from app.core.database import Base, str_enum
+from app.models.enums import ItineraryRequestStatus
+from app.core.ids import uuid7
 
-class ItineraryRequestStatus(str, enum.Enum):
-    DRAFT = "draft"
-    PENDING = "pending"
-    IN_REVIEW = "in_review"
-    ACCEPTED = "accepted"
-    DECLINED = "declined"
-    CANCELLED = "cancelled"
-    COMPLETED = "completed"
+def _status_set(*statuses):
+    """Frozen membership set; enum members hash by name, so raw values are included too"""
+    return frozenset(value for status in statuses for value in (status, status.value))
+
+_ACTIVE_REQUEST_STATUSES = _status_set(
+    ItineraryRequestStatus.PENDING,
+    ItineraryRequestStatus.IN_REVIEW,
+    ItineraryRequestStatus.ACCEPTED
+)
+_EDITABLE_REQUEST_STATUSES = _status_set(
+    ItineraryRequestStatus.DRAFT,
+    ItineraryRequestStatus.PENDING
+)
+_ACCEPTABLE_REQUEST_STATUSES = _status_set(
+    ItineraryRequestStatus.PENDING,
+    ItineraryRequestStatus.IN_REVIEW
+)
+
+# Inclusive trip length in calendar days
+DURATION_DAYS_SQL = "((end_date AT TIME ZONE 'UTC')::date - (start_date AT TIME ZONE 'UTC')::date) + 1"
 
 class ItineraryRequest(Base):
     __tablename__ = "itinerary_requests"
+    __table_args__ = (
+        # Open public requests browsed by locals
+        Index('ix_itinerary_requests_open', 'destination_city', 'status',
+              postgresql_where=text("status IN ('pending', 'in_review') AND is_public")),
+        # Array overlap/containment when matching locals to requests
+        Index('ix_requests_interests_gin', 'interests', postgresql_using='gin'),
+        Index('ix_requests_diet_gin', 'dietary_restrictions', postgresql_using='gin'),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     traveler_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
     local_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=True)  # Can be null for open requests
 
@@ -31,6 +51,8 @@ class ItineraryRequest(Base):
     # Trip details
     start_date = Column(DateTime(timezone=True), nullable=False)
     end_date = Column(DateTime(timezone=True), nullable=False)
+    # Generated by Postgres; dates are taken in UTC so the expression stays immutable
+    duration_days = Column(Integer, Computed(DURATION_DAYS_SQL, persisted=True))
     group_size = Column(Integer, nullable=False, default=1)
     budget_min = Column(Float, nullable=True)
     budget_max = Column(Float, nullable=True)
@@ -45,9 +67,14 @@ class ItineraryRequest(Base):
     special_requirements = Column(Text, nullable=True)
 
     # Status and metadata
-    status = Column(Enum(ItineraryRequestStatus), default=ItineraryRequestStatus.DRAFT, nullable=False)
+    status = Column(
+        str_enum(ItineraryRequestStatus, "ck_itinerary_requests_status"),
+        default=ItineraryRequestStatus.DRAFT,
+        nullable=False
+    )
     is_public = Column(Boolean, default=True)  # Whether other locals can see this request
     urgency_level = Column(String(50), nullable=True)  # low, medium, high
+    proposal_count = Column(Integer, nullable=False, default=0, server_default="0")  # Maintained by ItineraryProposal events
 
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -58,42 +85,20 @@ class ItineraryRequest(Base):
     # Relationships
     traveler = relationship("User", foreign_keys=[traveler_id], back_populates="itinerary_requests")
     local = relationship("User", foreign_keys=[local_id], back_populates="assigned_itinerary_requests")
-    proposals = relationship("ItineraryProposal", back_populates="request", lazy="dynamic", cascade="all, delete-orphan")
+    proposals = relationship("ItineraryProposal", back_populates="request", cascade="all, delete-orphan")
 
     def __repr__(self):
         return f"<ItineraryRequest {self.id}: {self.title}>"
 
-    @property
-    def duration_days(self):
-        """Calculate trip duration in days"""
-        if self.start_date and self.end_date:
-            return (self.end_date - self.start_date).days + 1
-        return None
-
     @property
     def is_active(self):
         """Check if request is in an active state"""
-        return self.status in [
-            ItineraryRequestStatus.PENDING,
-            ItineraryRequestStatus.IN_REVIEW,
-            ItineraryRequestStatus.ACCEPTED
-        ]
-
-    @property
-    def proposal_count(self):
-        """Get number of proposals for this request"""
-        return self.proposals.count()
+        return self.status in _ACTIVE_REQUEST_STATUSES
 
     def can_be_edited_by(self, user_id):
         """Check if user can edit this request"""
-        return str(self.traveler_id) == str(user_id) and self.status in [
-            ItineraryRequestStatus.DRAFT,
-            ItineraryRequestStatus.PENDING
-        ]
+        return str(self.traveler_id) == str(user_id) and self.status in _EDITABLE_REQUEST_STATUSES
 
     def can_receive_proposals(self):
         """Check if request can receive new proposals"""
-        return self.status in [
-            ItineraryRequestStatus.PENDING,
-            ItineraryRequestStatus.IN_REVIEW
-        ] and self.is_public
\ No newline at end of file
+        return self.status in _ACCEPTABLE_REQUEST_STATUSES and self.is_public
\ No newline at end of file
@@ -1,28 +1,35 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, Float, ForeignKey, Enum
+from sqlalchemy import Column, String, Boolean, DateTime, Text, Integer, Float, ForeignKey, Index, literal
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
+from sqlalchemy.ext.hybrid import hybrid_property
+from app.core.database import Base, str_enum
+from app.models.enums import AvailabilityStatus
 import uuid
-import enum
-
-class AvailabilityStatus(str, enum.Enum):
-    AVAILABLE = "available"
-    BUSY = "busy"
-    UNAVAILABLE = "unavailable"
 
 class LocalProfile(Base):
     __tablename__ = "local_profiles"
+    __table_args__ = (
+        # Array overlap/containment when matching locals to requests
+        Index('ix_local_profiles_specialties_gin', 'specialties', postgresql_using='gin'),
+        Index('ix_local_profiles_languages_gin', 'languages', postgresql_using='gin'),
+    )
     
     # Only fields that exist in the current database
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     specialties = Column(ARRAY(String), nullable=True)  # Maps to expertise_areas
     languages = Column(ARRAY(String), nullable=True, default=['English'])
     response_time_hours = Column(Integer, default=24)
-    availability_status = Column(Enum(AvailabilityStatus), default=AvailabilityStatus.AVAILABLE)
+    availability_status = Column(
+        str_enum(AvailabilityStatus, "ck_local_profiles_availability_status"),
+        default=AvailabilityStatus.AVAILABLE
+    )
     total_conversations = Column(Integer, default=0)
     total_completed_itineraries = Column(Integer, default=0)
     average_rating = Column(Float, default=0.0)
+    # Running totals maintained by the trg_reviews_rating trigger; average_rating = sum / count
+    rating_sum = Column(Integer, nullable=False, server_default="0")
+    rating_count = Column(Integer, nullable=False, server_default="0")
     is_verified = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -34,75 +41,35 @@ class LocalProfile(Base):
     def __repr__(self):
         return f"<LocalProfile {self.id}>"
         
-    # Properties for missing fields to maintain compatibility
-    @property
-    def title(self):
-        return "Local Guide"
-        
-    @property
-    def description(self):
-        return "Experienced local guide"
-        
-    @property
+    # Constants for fields missing from the database, kept for compatibility
+    title = "Local Guide"
+    description = "Experienced local guide"
+    max_group_size = 4
+    background_check_status = 'pending'
+    base_hourly_rate = None
+    currency = 'USD'
+    services_offered = None
+    home_city = "Unknown"
+    home_country = "Unknown"
+    travel_radius_km = 50
+    response_rate_percent = 100
+    fun_fact = None
+    why_local_guide = None
+    instagram_handle = None
+    website_url = None
+
+    @hybrid_property
     def expertise_areas(self):
         return self.specialties or []
+
+    @expertise_areas.expression
+    def expertise_areas(cls):
+        return func.coalesce(cls.specialties, literal([], type_=ARRAY(String)))
         
     @property
     def is_available(self):
         return self.availability_status == AvailabilityStatus.AVAILABLE
         
-    @property
-    def max_group_size(self):
-        return 4
-        
-    @property
-    def background_check_status(self):
-        return 'pending'
-        
-    @property
-    def base_hourly_rate(self):
-        return None
-        
-    @property
-    def currency(self):
-        return 'USD'
-        
-    @property
-    def services_offered(self):
-        return None
-        
-    @property
-    def home_city(self):
-        return "Unknown"
-        
-    @property
-    def home_country(self):
-        return "Unknown"
-        
-    @property
-    def travel_radius_km(self):
-        return 50
-        
     @property
     def total_bookings(self):
-        return self.total_completed_itineraries
-        
-    @property
-    def response_rate_percent(self):
-        return 100
-        
-    @property
-    def fun_fact(self):
-        return None
-        
-    @property
-    def why_local_guide(self):
-        return None
-        
-    @property
-    def instagram_handle(self):
-        return None
-        
-    @property
-    def website_url(self):
-        return None
\ No newline at end of file
+        return self.total_completed_itineraries
\ No newline at end of file
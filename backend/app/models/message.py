@@ -1,46 +1,53 @@
-from sqlalchemy import Column, String, DateTime, Boolean, ForeignKey, Text, Enum
+from sqlalchemy import Column, PrimaryKeyConstraint, String, DateTime, Boolean, ForeignKey, Text, Index, update
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from app.core.database import Base
-import uuid
-import enum
-
-class MessageType(str, enum.Enum):
-    TEXT = "text"
-    SYSTEM = "system"
-    BOOKING_REQUEST = "booking_request"
-    BOOKING_CONFIRMATION = "booking_confirmation"
-
-class MessageStatus(str, enum.Enum):
-    SENT = "sent"
-    DELIVERED = "delivered"
-    READ = "read"
+from app.core.database import Base, str_enum
+from app.models.enums import MessageType, MessageStatus
+from app.core.ids import uuid7
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Message pagination within a conversation
+        Index('ix_messages_conv_created', 'conversation_id', 'created_at'),
+        # Monthly RANGE partitions; the partition key has to be part of the primary key
+        PrimaryKeyConstraint('id', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), default=uuid7)
     conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id"), nullable=False)
     sender_id = Column(UUID(as_uuid=True), ForeignKey("profiles.id"), nullable=False)
 
     # Message content
     content = Column(Text, nullable=False)
-    message_type = Column(Enum(MessageType), default=MessageType.TEXT, nullable=False)
+    message_type = Column(
+        str_enum(MessageType, "ck_messages_message_type"),
+        default=MessageType.TEXT,
+        nullable=False
+    )
 
     # Message status and metadata
-    status = Column(Enum(MessageStatus), default=MessageStatus.SENT, nullable=False)
+    status = Column(
+        str_enum(MessageStatus, "ck_messages_status"),
+        default=MessageStatus.SENT,
+        nullable=False
+    )
     is_edited = Column(Boolean, default=False)
     edited_at = Column(DateTime(timezone=True), nullable=True)
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Read status tracking
     read_at = Column(DateTime(timezone=True), nullable=True)
     delivered_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Identity stays on id alone; ids are unique across partitions
+    __mapper_args__ = {"primary_key": [id]}
+
     # Relationships
     conversation = relationship("Conversation", back_populates="messages")
     sender = relationship("User", back_populates="sent_messages")
@@ -58,4 +65,23 @@ class Message(Base):
         """Mark message as delivered"""
         if self.status == MessageStatus.SENT:
             self.status = MessageStatus.DELIVERED
-            self.delivered_at = func.now()
\ No newline at end of file
+            self.delivered_at = func.now()
+
+    @classmethod
+    async def mark_conversation_read(cls, db, conversation_id, reader_id, message_ids=None):
+        """Mark messages sent to reader_id in a conversation as read with one UPDATE; returns row count"""
+        conditions = [
+            cls.conversation_id == conversation_id,
+            cls.sender_id != reader_id,
+            cls.status != MessageStatus.READ
+        ]
+        if message_ids is not None:
+            conditions.append(cls.id.in_(message_ids))
+
+        result = await db.execute(
+            update(cls)
+            .where(*conditions)
+            .values(status=MessageStatus.READ, read_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,9 +1,11 @@
-from sqlalchemy import Column, String, Text, DateTime, Boolean, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, PrimaryKeyConstraint, String, Text, DateTime, Boolean, ForeignKey, Index, text, update
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 from app.core.database import Base
-import uuid
+from app.core.ids import uuid7
 from datetime import datetime
+from typing import Optional
 from enum import Enum
 
 class NotificationType(str, Enum):
@@ -37,8 +39,24 @@ class NotificationPriority(str, Enum):
 
 class Notification(Base):
     __tablename__ = "notifications"
-
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        # Unread badge / unread-only listing, newest first, answered from the index
+        Index('ix_notif_user_unread', 'user_id', text('created_at DESC'),
+              postgresql_include=['type', 'title', 'priority'],
+              postgresql_where=text('is_read = false')),
+        # Containment lookups and proposal_id lookups inside extra_data
+        Index('ix_notifications_extra_data_gin', 'extra_data',
+              postgresql_using='gin', postgresql_ops={'extra_data': 'jsonb_path_ops'}),
+        Index('ix_notifications_extra_proposal', text("(extra_data->>'proposal_id')")),
+        # Message notifications per conversation; most rows have no conversation
+        Index('ix_notifications_related_conversation', 'related_conversation_id',
+              postgresql_where=text('related_conversation_id IS NOT NULL')),
+        # Monthly RANGE partitions; the partition key has to be part of the primary key
+        PrimaryKeyConstraint('id', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
+    )
+
+    id = Column(UUID(as_uuid=True), default=uuid7)
 
     # Target user
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -54,12 +72,13 @@ class Notification(Base):
     action_label = Column(String(100), nullable=True)  # Button text
 
     # Metadata and context
-    extra_data = Column(JSON, nullable=True)  # Additional data (proposal_id, request_id, etc.)
+    extra_data = Column(JSONB, nullable=True)  # Additional data (proposal_id, request_id, etc.)
 
     # Related entities (for easy querying)
     related_proposal_id = Column(UUID(as_uuid=True), ForeignKey("itinerary_proposals.id", ondelete="CASCADE"), nullable=True)
     related_request_id = Column(UUID(as_uuid=True), ForeignKey("itinerary_requests.id", ondelete="CASCADE"), nullable=True)
     related_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=True)  # User who triggered the notification
+    related_conversation_id = Column(UUID(as_uuid=True), ForeignKey("conversations.id", ondelete="CASCADE"), nullable=True)
 
     # Status
     is_read = Column(Boolean, default=False, nullable=False)
@@ -71,9 +90,13 @@ class Notification(Base):
     delivery_method = Column(String(50), nullable=True)  # 'in_app', 'email', 'push', etc.
 
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at = Column(DateTime, nullable=True)  # Optional expiration
 
+    # Identity stays on id alone; ids are unique across partitions.
+    # eager_defaults fetches created_at via INSERT ... RETURNING on flush
+    __mapper_args__ = {"primary_key": [id], "eager_defaults": True}
+
     # Relationships
     user = relationship("User", foreign_keys=[user_id], back_populates="notifications")
     related_user = relationship("User", foreign_keys=[related_user_id])
@@ -83,12 +106,11 @@ class Notification(Base):
     def __repr__(self):
         return f"<Notification(id={self.id}, type={self.type}, user={self.user_id})>"
 
-    @property
-    def is_expired(self):
-        """Check if notification has expired"""
+    def is_expired(self, now: Optional[datetime] = None):
+        """Check if notification has expired as of `now` (defaults to current UTC time)"""
         if not self.expires_at:
             return False
-        return datetime.utcnow() > self.expires_at
+        return (now or datetime.utcnow()) > self.expires_at
 
     def mark_as_read(self):
         """Mark notification as read"""
@@ -96,9 +118,37 @@ class Notification(Base):
             self.is_read = True
             self.read_at = datetime.utcnow()
 
+    @classmethod
+    async def mark_all_read(cls, db, user_id, notification_ids=None):
+        """Mark a user's unread notifications as read with one UPDATE; returns row count"""
+        conditions = [cls.user_id == user_id, cls.is_read == False]
+        if notification_ids is not None:
+            conditions.append(cls.id.in_(notification_ids))
+
+        result = await db.execute(
+            update(cls)
+            .where(*conditions)
+            .values(is_read=True, read_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
     def mark_as_sent(self, delivery_method: str = "in_app"):
         """Mark notification as sent"""
         if not self.is_sent:
             self.is_sent = True
             self.sent_at = datetime.utcnow()
-            self.delivery_method = delivery_method
\ No newline at end of file
+            self.delivery_method = delivery_method
+
+class NotificationDedup(Base):
+    """Claimed dedup keys for recent notifications.
+
+    Uniqueness can't live on notifications itself: unique indexes on a
+    partitioned table must include created_at.
+    """
+    __tablename__ = "notification_dedup"
+
+    # "{user_id}:{type}:{related_proposal_id}"
+    key = Column(String(200), primary_key=True)
+    # When the key was last claimed, i.e. the last delivery it let through
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
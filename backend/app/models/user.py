@@ -1,14 +1,11 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Enum, Text, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, Enum, Text, Integer, literal
 from sqlalchemy.dialects.postgresql import UUID, ARRAY
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from app.core.database import Base
+from app.models.enums import UserRole
 import uuid
-import enum
-
-class UserRole(str, enum.Enum):
-    TRAVELER = "traveler"
-    LOCAL = "local"
 
 class User(Base):
     __tablename__ = "profiles"
@@ -32,70 +29,57 @@ class User(Base):
     locations = relationship("UserLocation", back_populates="user", lazy="select")
 
     # Conversation relationships
-    traveler_conversations = relationship("Conversation", foreign_keys="Conversation.traveler_id", back_populates="traveler", lazy="dynamic")
-    local_conversations = relationship("Conversation", foreign_keys="Conversation.local_id", back_populates="local", lazy="dynamic")
-    sent_messages = relationship("Message", back_populates="sender", lazy="dynamic")
+    traveler_conversations = relationship("Conversation", foreign_keys="Conversation.traveler_id", back_populates="traveler")
+    local_conversations = relationship("Conversation", foreign_keys="Conversation.local_id", back_populates="local")
+    sent_messages = relationship("Message", back_populates="sender")
 
     # Itinerary relationships
-    itinerary_requests = relationship("ItineraryRequest", foreign_keys="ItineraryRequest.traveler_id", back_populates="traveler", lazy="dynamic")
-    assigned_itinerary_requests = relationship("ItineraryRequest", foreign_keys="ItineraryRequest.local_id", back_populates="local", lazy="dynamic")
-    itinerary_proposals = relationship("ItineraryProposal", back_populates="local", lazy="dynamic")
+    itinerary_requests = relationship("ItineraryRequest", foreign_keys="ItineraryRequest.traveler_id", back_populates="traveler")
+    assigned_itinerary_requests = relationship("ItineraryRequest", foreign_keys="ItineraryRequest.local_id", back_populates="local")
+    itinerary_proposals = relationship("ItineraryProposal", back_populates="local")
 
     # Review relationships
-    reviews_given = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer", lazy="dynamic")
-    reviews_received = relationship("Review", foreign_keys="Review.reviewee_id", back_populates="reviewee", lazy="dynamic")
+    reviews_given = relationship("Review", foreign_keys="Review.reviewer_id", back_populates="reviewer")
+    reviews_received = relationship("Review", foreign_keys="Review.reviewee_id", back_populates="reviewee")
 
     # Notification relationships
-    notifications = relationship("Notification", foreign_keys="Notification.user_id", back_populates="user", lazy="dynamic")
+    notifications = relationship("Notification", foreign_keys="Notification.user_id", back_populates="user")
 
     def __repr__(self):
         return f"<User {self.email}>"
     
-    # Properties for missing fields to maintain compatibility
-    @property
-    def phone_number(self):
-        return None
-    
-    @property
-    def nationality(self):
-        return None
-        
-    @property
+    # Constants for fields missing from the database, kept for compatibility
+    phone_number = None
+    nationality = None
+    travel_style = None
+    is_email_verified = False
+    is_phone_verified = False
+    emergency_contact_name = None
+    emergency_contact_phone = None
+    show_age = True
+    show_location = True
+
+    # Hybrids so these can also be used in SQL filters
+    @hybrid_property
     def languages_spoken(self):
         return ['English']
-        
-    @property
+
+    @languages_spoken.expression
+    def languages_spoken(cls):
+        return literal(['English'], type_=ARRAY(String))
+
+    @hybrid_property
     def interests(self):
         return []
-        
-    @property
-    def travel_style(self):
-        return None
-        
-    @property
-    def is_email_verified(self):
-        return False
-        
-    @property
-    def is_phone_verified(self):
-        return False
-        
-    @property
-    def emergency_contact_name(self):
-        return None
-        
-    @property
-    def emergency_contact_phone(self):
-        return None
-        
-    @property
+
+    @interests.expression
+    def interests(cls):
+        return literal([], type_=ARRAY(String))
+
+    @hybrid_property
     def profile_visibility(self):
         return 'public'
-        
-    @property
-    def show_age(self):
-        return True
-        
-    @property
-    def show_location(self):
-        return True
\ No newline at end of file
+
+    @profile_visibility.expression
+    def profile_visibility(cls):
+        return literal('public')
\ No newline at end of file
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, EmailStr, field_validator
+from pydantic import BaseModel, EmailStr, field_serializer, field_validator
 from typing import Optional
-from app.models.user import UserRole
+from datetime import datetime
+from uuid import UUID
+from app.models.enums import UserRole
+from app.schemas.types import ORM_CONFIG
 
 class UserSignup(BaseModel):
     email: EmailStr
@@ -9,7 +12,8 @@ class UserSignup(BaseModel):
     role: UserRole
     
     @field_validator('password')
-    def validate_password(cls, v):
+    @classmethod
+    def validate_password(cls, v: str) -> str:
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
         if not any(c.isupper() for c in v):
@@ -21,7 +25,8 @@ class UserSignup(BaseModel):
         return v
     
     @field_validator('full_name')
-    def validate_full_name(cls, v):
+    @classmethod
+    def validate_full_name(cls, v: str) -> str:
         if len(v.strip()) < 2:
             raise ValueError('Full name must be at least 2 characters long')
         return v.strip()
@@ -31,7 +36,7 @@ class UserLogin(BaseModel):
     password: str
 
 class UserResponse(BaseModel):
-    id: str
+    id: UUID
     email: str
     full_name: str
     role: UserRole
@@ -39,10 +44,14 @@ class UserResponse(BaseModel):
     bio: Optional[str] = None
     onboarding_completed: bool
     is_active: bool
-    created_at: str
+    created_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
+
+    @field_serializer('created_at', when_used='json')
+    def format_created_at(self, v: datetime) -> str:
+        # Keep the isoformat() "+00:00" offset clients got when this was a str
+        return v.isoformat()
 
 class TokenResponse(BaseModel):
     access_token: str
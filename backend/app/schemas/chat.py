@@ -1,8 +1,9 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from uuid import UUID
-from app.models.message import MessageType, MessageStatus
+from app.models.enums import MessageType, MessageStatus
+from app.schemas.types import ORM_CONFIG
 
 # Message Schemas
 class MessageCreate(BaseModel):
@@ -30,16 +31,15 @@ class MessageResponse(BaseModel):
     sender_name: str
     sender_avatar: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
-    @classmethod
-    def from_orm_with_sender(cls, message, sender=None):
-        """Create MessageResponse with sender information"""
+    @staticmethod
+    def orm_row(message: Any, sender: Any = None) -> Dict[str, Any]:
+        """Flatten a message and its sender into response fields"""
         if sender is None:
             sender = message.sender
 
-        return cls(
+        return dict(
             id=message.id,
             conversation_id=message.conversation_id,
             sender_id=message.sender_id,
@@ -56,6 +56,12 @@ class MessageResponse(BaseModel):
             sender_avatar=sender.profile_picture_url if sender else None
         )
 
+    @classmethod
+    def from_orm_with_sender(cls, message: Any, sender: Any = None) -> "MessageResponse":
+        """Create MessageResponse with sender information"""
+        # Trusted ORM data; skip field validation
+        return cls.model_construct(**cls.orm_row(message, sender))
+
 # Conversation Schemas
 class ConversationCreate(BaseModel):
     local_id: UUID
@@ -80,16 +86,17 @@ class ConversationResponse(BaseModel):
     # Unread count
     unread_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
-    @classmethod
-    def from_orm_with_participant(cls, conversation, current_user_id, other_participant=None, unread_count=0):
-        """Create ConversationResponse with other participant information"""
+    @staticmethod
+    def orm_row(
+        conversation: Any, current_user_id: Any, other_participant: Any = None, unread_count: int = 0
+    ) -> Dict[str, Any]:
+        """Flatten a conversation and the other participant into response fields"""
         if other_participant is None:
             other_participant = conversation.get_other_participant(current_user_id)
 
-        return cls(
+        return dict(
             id=conversation.id,
             traveler_id=conversation.traveler_id,
             local_id=conversation.local_id,
@@ -105,6 +112,16 @@ class ConversationResponse(BaseModel):
             unread_count=unread_count
         )
 
+    @classmethod
+    def from_orm_with_participant(
+        cls, conversation: Any, current_user_id: Any, other_participant: Any = None, unread_count: int = 0
+    ) -> "ConversationResponse":
+        """Create ConversationResponse with other participant information"""
+        # Trusted ORM data; skip field validation
+        return cls.model_construct(
+            **cls.orm_row(conversation, current_user_id, other_participant, unread_count)
+        )
+
 # Chat list and pagination
 class ChatListResponse(BaseModel):
     conversations: List[ConversationResponse]
@@ -0,0 +1,58 @@
+"""
+msgspec twins of the read-only chat response schemas.
+
+Used only on the outbound list path: rows read from the database are encoded
+straight into a JSON buffer without materializing Pydantic models. The Pydantic
+classes in chat.py remain the documented response_model and the inbound types.
+Field names and order mirror MessageResponse/ConversationResponse.orm_row().
+"""
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+import msgspec
+
+
+class MessageResponseFast(msgspec.Struct, frozen=True):
+    id: UUID
+    conversation_id: UUID
+    sender_id: UUID
+    content: str
+    message_type: str
+    status: str
+    is_edited: bool
+    edited_at: Optional[datetime]
+    created_at: datetime
+    updated_at: datetime
+    read_at: Optional[datetime]
+    delivered_at: Optional[datetime]
+    sender_name: str
+    sender_avatar: Optional[str]
+
+
+class ConversationResponseFast(msgspec.Struct, frozen=True):
+    id: UUID
+    traveler_id: UUID
+    local_id: UUID
+    last_message_at: datetime
+    last_message_content: Optional[str]
+    last_message_sender_id: Optional[UUID]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    other_participant_id: UUID
+    other_participant_name: str
+    other_participant_avatar: Optional[str]
+    unread_count: int = 0
+
+
+class MessageListFast(msgspec.Struct, frozen=True):
+    messages: List[MessageResponseFast]
+    total: int
+    has_more: bool
+
+
+class ChatListFast(msgspec.Struct, frozen=True):
+    conversations: List[ConversationResponseFast]
+    total: int
+    has_more: bool
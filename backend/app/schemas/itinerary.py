@@ -1,63 +1,72 @@
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
-from datetime import datetime, date
+from pydantic import BaseModel, Field, StringConstraints, TypeAdapter, ValidationInfo, field_serializer, field_validator
+from typing import Annotated, List, Optional, Dict, Any
+from datetime import datetime, date, time as _time
 from uuid import UUID
-from app.models.itinerary_request import ItineraryRequestStatus
-from app.models.itinerary_proposal import ProposalStatus
+from app.schemas.types import ORM_CONFIG, Title, PlaceName, Description, CurrencyCode, Text100, Text300, Text500, Text1000, Text2000
+from app.models.enums import ItineraryRequestStatus, ProposalStatus
+
+ActivityLevel = Annotated[str, StringConstraints(pattern="^(low|moderate|high)$")]
+UrgencyLevel = Annotated[str, StringConstraints(pattern="^(low|medium|high)$")]
 
 # Itinerary Request Schemas
 class ItineraryRequestCreate(BaseModel):
-    title: str = Field(..., min_length=5, max_length=255)
-    description: str = Field(..., min_length=20, max_length=2000)
-    destination_city: str = Field(..., min_length=2, max_length=255)
-    destination_country: str = Field(..., min_length=2, max_length=255)
+    title: Title
+    description: Description
+    destination_city: PlaceName
+    destination_country: PlaceName
     start_date: datetime
     end_date: datetime
     group_size: int = Field(1, ge=1, le=20)
     budget_min: Optional[float] = Field(None, ge=0)
     budget_max: Optional[float] = Field(None, ge=0)
-    currency: str = Field("USD", min_length=3, max_length=3)
-    interests: Optional[List[str]] = []
-    activity_level: Optional[str] = Field(None, pattern="^(low|moderate|high)$")
-    accommodation_preference: Optional[str] = Field(None, max_length=100)
-    transportation_preference: Optional[str] = Field(None, max_length=100)
-    dietary_restrictions: Optional[List[str]] = []
-    special_requirements: Optional[str] = Field(None, max_length=1000)
+    currency: CurrencyCode = "USD"
+    interests: Optional[List[str]] = Field(default_factory=list)
+    activity_level: Optional[ActivityLevel] = None
+    accommodation_preference: Optional[Text100] = None
+    transportation_preference: Optional[Text100] = None
+    dietary_restrictions: Optional[List[str]] = Field(default_factory=list)
+    special_requirements: Optional[Text1000] = None
     is_public: bool = True
-    urgency_level: Optional[str] = Field(None, pattern="^(low|medium|high)$")
+    urgency_level: Optional[UrgencyLevel] = None
 
-    @validator('end_date')
-    def end_date_after_start_date(cls, v, values):
-        if 'start_date' in values and v <= values['start_date']:
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v: datetime, info: ValidationInfo) -> datetime:
+        start_date = info.data.get('start_date')
+        if start_date is not None and v <= start_date:
             raise ValueError('End date must be after start date')
         return v
 
-    @validator('budget_max')
-    def budget_max_greater_than_min(cls, v, values):
-        if v is not None and 'budget_min' in values and values['budget_min'] is not None:
-            if v <= values['budget_min']:
-                raise ValueError('Maximum budget must be greater than minimum budget')
+    @field_validator('budget_max')
+    @classmethod
+    def budget_max_greater_than_min(cls, v: Optional[float], info: ValidationInfo) -> Optional[float]:
+        # Open-ended budget; nothing to compare against
+        if v is None:
+            return v
+        budget_min = info.data.get('budget_min')
+        if budget_min is not None and v <= budget_min:
+            raise ValueError('Maximum budget must be greater than minimum budget')
         return v
 
 class ItineraryRequestUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=5, max_length=255)
-    description: Optional[str] = Field(None, min_length=20, max_length=2000)
-    destination_city: Optional[str] = Field(None, min_length=2, max_length=255)
-    destination_country: Optional[str] = Field(None, min_length=2, max_length=255)
+    title: Optional[Title] = None
+    description: Optional[Description] = None
+    destination_city: Optional[PlaceName] = None
+    destination_country: Optional[PlaceName] = None
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
     group_size: Optional[int] = Field(None, ge=1, le=20)
     budget_min: Optional[float] = Field(None, ge=0)
     budget_max: Optional[float] = Field(None, ge=0)
-    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+    currency: Optional[CurrencyCode] = None
     interests: Optional[List[str]] = None
-    activity_level: Optional[str] = Field(None, pattern="^(low|moderate|high)$")
-    accommodation_preference: Optional[str] = Field(None, max_length=100)
-    transportation_preference: Optional[str] = Field(None, max_length=100)
+    activity_level: Optional[ActivityLevel] = None
+    accommodation_preference: Optional[Text100] = None
+    transportation_preference: Optional[Text100] = None
     dietary_restrictions: Optional[List[str]] = None
-    special_requirements: Optional[str] = Field(None, max_length=1000)
+    special_requirements: Optional[Text1000] = None
     is_public: Optional[bool] = None
-    urgency_level: Optional[str] = Field(None, pattern="^(low|medium|high)$")
+    urgency_level: Optional[UrgencyLevel] = None
 
 class ItineraryRequestResponse(BaseModel):
     id: UUID
@@ -104,25 +113,66 @@ class ItineraryRequestResponse(BaseModel):
     my_proposal_id: Optional[str] = None
     my_proposal_status: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
+
+    @staticmethod
+    def orm_row(request: Any, traveler: Any = None, local: Any = None, **extra: Any) -> Dict[str, Any]:
+        """Flatten a request and its traveler/local (or projected rows of them) into response fields"""
+        if traveler is None:
+            traveler = request.traveler
+        if local is None:
+            local = request.local
+
+        row = {name: getattr(request, name) for name in _REQUEST_COLUMN_FIELDS}
+        row['traveler_name'] = traveler.full_name
+        row['traveler_avatar'] = traveler.profile_picture_url
+        # An unassigned local projects as a row of NULLs
+        row['local_name'] = local.full_name if local else None
+        row['local_avatar'] = local.profile_picture_url if local else None
+        row.update(extra)
+        return row
+
+# Response fields read straight off the ItineraryRequest row
+_REQUEST_COLUMN_FIELDS = tuple(
+    name for name in ItineraryRequestResponse.model_fields
+    if name not in {
+        'traveler_name', 'traveler_avatar', 'local_name', 'local_avatar',
+        'can_propose', 'my_proposal_id', 'my_proposal_status'
+    }
+)
 
 # Itinerary Proposal Schemas
 class DailyActivity(BaseModel):
-    time: str = Field(..., description="Time of activity (e.g., '09:00')")
+    time: _time = Field(..., description="Activity start time (e.g., '09:00')")
     title: str = Field(..., min_length=3, max_length=200)
     description: str = Field(..., min_length=10, max_length=500)
     location: Optional[str] = Field(None, max_length=200)
     duration_minutes: Optional[int] = Field(None, ge=15, le=480)
     cost_per_person: Optional[float] = Field(None, ge=0)
-    notes: Optional[str] = Field(None, max_length=300)
+    notes: Optional[Text300] = None
+
+    @field_validator('time', mode='before')
+    @classmethod
+    def pad_short_hour(cls, v: Any) -> Any:
+        # Accept legacy "9:00" alongside ISO "09:00"
+        if isinstance(v, str) and len(v) == 4 and v[1] == ':':
+            return f"0{v}"
+        return v
+
+    @field_serializer('time')
+    def format_time(self, v: _time) -> str:
+        # Keep the "HH:MM" wire format clients got before times were parsed
+        return v.strftime('%H:%M')
 
 class DailyItinerary(BaseModel):
     day: int = Field(..., ge=1, le=30)
     date: Optional[date] = None
     title: str = Field(..., min_length=3, max_length=100)
-    overview: Optional[str] = Field(None, max_length=300)
-    activities: List[DailyActivity] = Field(..., min_items=1)
+    overview: Optional[Text300] = None
+    activities: List[DailyActivity] = Field(..., min_length=1)
+
+# Day-plan adapter, built once; validates or dumps a whole plan in a single call
+DAILY_ITINERARY_ADAPTER = TypeAdapter(List[DailyItinerary])
 
 class PriceBreakdown(BaseModel):
     guides_fee: Optional[float] = Field(None, ge=0)
@@ -135,46 +185,46 @@ class PriceBreakdown(BaseModel):
 
 class ItineraryProposalCreate(BaseModel):
     request_id: UUID
-    title: str = Field(..., min_length=5, max_length=255)
-    description: str = Field(..., min_length=20, max_length=2000)
-    cover_message: Optional[str] = Field(None, max_length=1000)
+    title: Title
+    description: Description
+    cover_message: Optional[Text1000] = None
     total_price: float = Field(..., ge=0)
-    currency: str = Field("USD", min_length=3, max_length=3)
+    currency: CurrencyCode = "USD"
     price_breakdown: Optional[Dict[str, float]] = None
-    includes: Optional[str] = Field(None, max_length=1000)
-    excludes: Optional[str] = Field(None, max_length=1000)
-    daily_itinerary: List[DailyItinerary] = Field(..., min_items=1)
-    highlights: Optional[str] = Field(None, max_length=1000)
+    includes: Optional[Text1000] = None
+    excludes: Optional[Text1000] = None
+    daily_itinerary: List[DailyItinerary] = Field(..., min_length=1)
+    highlights: Optional[Text1000] = None
     estimated_duration_hours: Optional[int] = Field(None, ge=1, le=240)
-    meeting_point: Optional[str] = Field(None, max_length=500)
+    meeting_point: Optional[Text500] = None
     transportation_included: bool = False
     accommodation_included: bool = False
     meals_included: bool = False
-    equipment_provided: Optional[str] = Field(None, max_length=500)
-    cancellation_policy: Optional[str] = Field(None, max_length=1000)
-    terms_and_conditions: Optional[str] = Field(None, max_length=2000)
-    special_notes: Optional[str] = Field(None, max_length=1000)
+    equipment_provided: Optional[Text500] = None
+    cancellation_policy: Optional[Text1000] = None
+    terms_and_conditions: Optional[Text2000] = None
+    special_notes: Optional[Text1000] = None
 
 class ItineraryProposalUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=5, max_length=255)
-    description: Optional[str] = Field(None, min_length=20, max_length=2000)
-    cover_message: Optional[str] = Field(None, max_length=1000)
+    title: Optional[Title] = None
+    description: Optional[Description] = None
+    cover_message: Optional[Text1000] = None
     total_price: Optional[float] = Field(None, ge=0)
-    currency: Optional[str] = Field(None, min_length=3, max_length=3)
+    currency: Optional[CurrencyCode] = None
     price_breakdown: Optional[Dict[str, float]] = None
-    includes: Optional[str] = Field(None, max_length=1000)
-    excludes: Optional[str] = Field(None, max_length=1000)
-    daily_itinerary: Optional[List[DailyItinerary]] = Field(None, min_items=1)
-    highlights: Optional[str] = Field(None, max_length=1000)
+    includes: Optional[Text1000] = None
+    excludes: Optional[Text1000] = None
+    daily_itinerary: Optional[List[DailyItinerary]] = Field(None, min_length=1)
+    highlights: Optional[Text1000] = None
     estimated_duration_hours: Optional[int] = Field(None, ge=1, le=240)
-    meeting_point: Optional[str] = Field(None, max_length=500)
+    meeting_point: Optional[Text500] = None
     transportation_included: Optional[bool] = None
     accommodation_included: Optional[bool] = None
     meals_included: Optional[bool] = None
-    equipment_provided: Optional[str] = Field(None, max_length=500)
-    cancellation_policy: Optional[str] = Field(None, max_length=1000)
-    terms_and_conditions: Optional[str] = Field(None, max_length=2000)
-    special_notes: Optional[str] = Field(None, max_length=1000)
+    equipment_provided: Optional[Text500] = None
+    cancellation_policy: Optional[Text1000] = None
+    terms_and_conditions: Optional[Text2000] = None
+    special_notes: Optional[Text1000] = None
 
 class ItineraryProposalResponse(BaseModel):
     id: UUID
@@ -185,10 +235,10 @@ class ItineraryProposalResponse(BaseModel):
     cover_message: Optional[str]
     total_price: float
     currency: str
-    price_breakdown: Optional[Dict[str, Any]]
+    price_breakdown: Any  # Stored JSONB; passed through unvalidated
     includes: Optional[str]
     excludes: Optional[str]
-    daily_itinerary: Dict[str, Any]
+    daily_itinerary: Any
     highlights: Optional[str]
     estimated_duration_hours: Optional[int]
     meeting_point: Optional[str]
@@ -217,8 +267,7 @@ class ItineraryProposalResponse(BaseModel):
     local_rating: Optional[float]
     local_verified: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 # List responses with pagination
 class ItineraryRequestListResponse(BaseModel):
@@ -231,6 +280,9 @@ class ItineraryProposalListResponse(BaseModel):
     total: int
     has_more: bool
 
+# Page adapter, built once; validates a whole page of request rows in a single call
+REQUEST_LIST_ADAPTER = TypeAdapter(List[ItineraryRequestResponse])
+
 # Status update schemas
 class ItineraryRequestStatusUpdate(BaseModel):
     status: ItineraryRequestStatus
@@ -2,6 +2,7 @@ from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from uuid import UUID
+from app.schemas.types import ORM_CONFIG
 
 class NotificationCreate(BaseModel):
     user_id: UUID
@@ -15,6 +16,7 @@ class NotificationCreate(BaseModel):
     related_proposal_id: Optional[UUID] = None
     related_request_id: Optional[UUID] = None
     related_user_id: Optional[UUID] = None
+    related_conversation_id: Optional[UUID] = None
     expires_at: Optional[datetime] = None
 
 class NotificationUpdate(BaseModel):
@@ -30,11 +32,12 @@ class NotificationBase(BaseModel):
     message: str
     action_url: Optional[str]
     action_label: Optional[str]
-    extra_data: Optional[Dict[str, Any]]
+    extra_data: Any  # Stored JSONB; passed through unvalidated
 
     related_proposal_id: Optional[UUID]
     related_request_id: Optional[UUID]
     related_user_id: Optional[UUID]
+    related_conversation_id: Optional[UUID]
 
     is_read: bool
     read_at: Optional[datetime]
@@ -49,8 +52,7 @@ class NotificationBase(BaseModel):
     related_user_name: Optional[str]
     related_user_avatar: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class NotificationListResponse(BaseModel):
     notifications: List[NotificationBase]
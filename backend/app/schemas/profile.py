@@ -1,31 +1,34 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
+from app.schemas.types import (
+    ORM_CONFIG, Title, PlaceName, CurrencyCode, InstagramHandle, ProfileVisibility, Text100, Text500, Text1000
+)
+
+# Stored lowercase; inputs are compared case-insensitively
+_ALLOWED_EXPERTISE = frozenset({
+    'food', 'art', 'history', 'culture', 'nightlife', 'shopping',
+    'nature', 'architecture', 'music', 'photography', 'adventure',
+    'family-friendly', 'luxury', 'budget', 'hidden-gems', 'local-life'
+})
 
 class UserProfileUpdate(BaseModel):
     full_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    bio: Optional[str] = Field(None, max_length=1000)
+    bio: Optional[Text1000] = None
     phone_number: Optional[str] = Field(None, max_length=20)
-    nationality: Optional[str] = Field(None, max_length=100)
+    nationality: Optional[Text100] = None
     languages_spoken: Optional[List[str]] = None
     interests: Optional[List[str]] = None
-    travel_style: Optional[str] = Field(None, max_length=100)
+    travel_style: Optional[Text100] = None
     profile_picture_url: Optional[str] = None
-    profile_visibility: Optional[str] = Field("public")
+    profile_visibility: Optional[ProfileVisibility] = "public"
     show_age: Optional[bool] = True
     show_location: Optional[bool] = True
     emergency_contact_name: Optional[str] = Field(None, max_length=255)
     emergency_contact_phone: Optional[str] = Field(None, max_length=20)
     onboarding_completed: Optional[bool] = None
 
-    @field_validator('profile_visibility')
-    def validate_visibility(cls, v):
-        if v and v not in ['public', 'friends', 'private']:
-            raise ValueError('Profile visibility must be public, friends, or private')
-        return v
-
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class UserProfileResponse(BaseModel):
     id: str
@@ -51,60 +54,55 @@ class UserProfileResponse(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class LocalProfileCreate(BaseModel):
     title: str = Field(..., min_length=5, max_length=255, description="Professional title")
     description: str = Field(..., min_length=50, max_length=2000, description="Service description")
-    expertise_areas: List[str] = Field(..., min_items=1, max_items=10)
-    languages: List[str] = Field(default=["English"], min_items=1, max_items=10)
+    expertise_areas: List[str] = Field(..., min_length=1, max_length=10)
+    languages: List[str] = Field(default_factory=lambda: ["English"], min_length=1, max_length=10)
     max_group_size: int = Field(default=4, ge=1, le=20)
     base_hourly_rate: Optional[float] = Field(None, ge=0, le=1000)
-    currency: str = Field(default="USD", max_length=3)
-    home_city: str = Field(..., min_length=2, max_length=255)
-    home_country: str = Field(..., min_length=2, max_length=255)
+    currency: CurrencyCode = "USD"
+    home_city: PlaceName
+    home_country: PlaceName
     travel_radius_km: int = Field(default=50, ge=0, le=500)
-    services_offered: Optional[str] = Field(None, max_length=1000)
-    fun_fact: Optional[str] = Field(None, max_length=500)
-    why_local_guide: Optional[str] = Field(None, max_length=1000)
-    instagram_handle: Optional[str] = Field(None, max_length=100)
-    website_url: Optional[str] = Field(None, max_length=500)
+    services_offered: Optional[Text1000] = None
+    fun_fact: Optional[Text500] = None
+    why_local_guide: Optional[Text1000] = None
+    instagram_handle: Optional[InstagramHandle] = None
+    website_url: Optional[Text500] = None
 
     @field_validator('expertise_areas')
-    def validate_expertise_areas(cls, v):
-        allowed = ['food', 'art', 'history', 'culture', 'nightlife', 'shopping', 
-                  'nature', 'architecture', 'music', 'photography', 'adventure',
-                  'family-friendly', 'luxury', 'budget', 'hidden-gems', 'local-life']
-        for area in v:
-            if area.lower() not in allowed:
-                raise ValueError(f"Invalid expertise area: {area}")
+    @classmethod
+    def validate_expertise_areas(cls, v: List[str]) -> List[str]:
+        bad = [area for area in v if area.lower() not in _ALLOWED_EXPERTISE]
+        if bad:
+            raise ValueError(f"Invalid expertise area: {bad[0]}")
         return v
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class LocalProfileUpdate(BaseModel):
-    title: Optional[str] = Field(None, min_length=5, max_length=255)
+    title: Optional[Title] = None
     description: Optional[str] = Field(None, min_length=50, max_length=2000)
-    expertise_areas: Optional[List[str]] = Field(None, min_items=1, max_items=10)
-    languages: Optional[List[str]] = Field(None, min_items=1, max_items=10)
+    expertise_areas: Optional[List[str]] = Field(None, min_length=1, max_length=10)
+    languages: Optional[List[str]] = Field(None, min_length=1, max_length=10)
     is_available: Optional[bool] = None
     max_group_size: Optional[int] = Field(None, ge=1, le=20)
     response_time_hours: Optional[int] = Field(None, ge=1, le=168)
     base_hourly_rate: Optional[float] = Field(None, ge=0, le=1000)
-    currency: Optional[str] = Field(None, max_length=3)
-    home_city: Optional[str] = Field(None, min_length=2, max_length=255)
-    home_country: Optional[str] = Field(None, min_length=2, max_length=255)
+    currency: Optional[CurrencyCode] = None
+    home_city: Optional[PlaceName] = None
+    home_country: Optional[PlaceName] = None
     travel_radius_km: Optional[int] = Field(None, ge=0, le=500)
-    services_offered: Optional[str] = Field(None, max_length=1000)
-    fun_fact: Optional[str] = Field(None, max_length=500)
-    why_local_guide: Optional[str] = Field(None, max_length=1000)
-    instagram_handle: Optional[str] = Field(None, max_length=100)
-    website_url: Optional[str] = Field(None, max_length=500)
+    services_offered: Optional[Text1000] = None
+    fun_fact: Optional[Text500] = None
+    why_local_guide: Optional[Text1000] = None
+    instagram_handle: Optional[InstagramHandle] = None
+    website_url: Optional[Text500] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class LocalProfileResponse(BaseModel):
     id: str
@@ -135,8 +133,7 @@ class LocalProfileResponse(BaseModel):
     updated_at: Optional[datetime] = None
     user: Optional[UserProfileResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 # Legacy support for existing code
 ProfileUpdate = UserProfileUpdate
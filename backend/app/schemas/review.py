@@ -1,7 +1,8 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from pydantic import BaseModel, Field, computed_field
+from typing import Optional, List, Dict, Tuple
 from datetime import datetime
 from uuid import UUID
+from app.schemas.types import ORM_CONFIG
 
 class ReviewCreate(BaseModel):
     proposal_id: UUID
@@ -66,8 +67,7 @@ class ReviewBase(BaseModel):
     # Proposal info
     proposal_title: str
 
-    class Config:
-        from_attributes = True
+    model_config = ORM_CONFIG
 
 class ReviewListResponse(BaseModel):
     reviews: List[ReviewBase]
@@ -77,7 +77,8 @@ class ReviewListResponse(BaseModel):
 class ReviewStatsResponse(BaseModel):
     total_reviews: int
     average_rating: float
-    rating_distribution: dict  # {1: count, 2: count, ...}
+    # Review counts for ratings 1-5, indexed by rating - 1
+    rating_counts: Tuple[int, int, int, int, int] = Field((0, 0, 0, 0, 0), exclude=True)
 
     # Aspect averages
     average_communication: Optional[float]
@@ -88,6 +89,12 @@ class ReviewStatsResponse(BaseModel):
     # Recent reviews
     recent_reviews: List[ReviewBase]
 
+    @computed_field
+    @property
+    def rating_distribution(self) -> Dict[int, int]:
+        """API shape: {1: count, 2: count, ...}"""
+        return {rating: count for rating, count in enumerate(self.rating_counts, start=1)}
+
 class ReviewEligibilityResponse(BaseModel):
     can_review: bool
     reason: Optional[str] = None
@@ -0,0 +1,33 @@
+"""
+Shared constrained string types and model config for schemas.
+
+Reusing one Annotated alias per constraint set lets pydantic-core build the
+validator once instead of once per field.
+"""
+from typing import Annotated
+from pydantic import ConfigDict, StringConstraints
+
+Title = Annotated[str, StringConstraints(min_length=5, max_length=255)]
+PlaceName = Annotated[str, StringConstraints(min_length=2, max_length=255)]
+Description = Annotated[str, StringConstraints(min_length=20, max_length=2000)]
+CurrencyCode = Annotated[str, StringConstraints(pattern="^[A-Z]{3}$")]
+InstagramHandle = Annotated[str, StringConstraints(pattern="^@?[A-Za-z0-9._]{1,30}$")]
+ProfileVisibility = Annotated[str, StringConstraints(pattern="^(public|friends|private)$")]
+
+# Free text capped at a maximum length
+Text100 = Annotated[str, StringConstraints(max_length=100)]
+Text300 = Annotated[str, StringConstraints(max_length=300)]
+Text500 = Annotated[str, StringConstraints(max_length=500)]
+Text1000 = Annotated[str, StringConstraints(max_length=1000)]
+Text2000 = Annotated[str, StringConstraints(max_length=2000)]
+
+# ORM-backed schemas; every option spelled out at its fast default so the
+# validator pydantic-core builds carries no optional per-field features
+ORM_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra='ignore',
+    populate_by_name=False,
+    arbitrary_types_allowed=False,
+    validate_assignment=False,
+    revalidate_instances='never'
+)
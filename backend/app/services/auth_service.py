@@ -1,28 +1,68 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
 from app.models.user import User, UserRole
 from app.schemas.auth import UserSignup, UserLogin, UserResponse, TokenResponse
 from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.config import settings
 from datetime import timedelta
-import os
+import asyncio
+from uuid import UUID
 
-ACCESS_TOKEN_EXPIRE_HOURS = int(os.getenv("ACCESS_TOKEN_EXPIRE_HOURS", "24"))
+# Same source as create_access_token's default expiry, computed once
+ACCESS_TOKEN_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_HOURS * 3600
 
 class AuthService:
+    @staticmethod
+    def build_token_response(user: User) -> TokenResponse:
+        """Issue an access token for user and wrap it with the user's public fields."""
+        access_token = create_access_token(
+            data={"sub": str(user.id), "email": user.email, "role": user.role}
+        )
+        
+        # Fields come straight from the stored row; skip re-validation
+        user_response = UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            role=UserRole(user.role),
+            profile_picture_url=user.profile_picture_url,
+            bio=user.bio,
+            onboarding_completed=user.onboarding_completed,
+            is_active=user.is_active,
+            created_at=user.created_at
+        )
+        
+        return TokenResponse.model_construct(
+            access_token=access_token,
+            expires_in=ACCESS_TOKEN_EXPIRE_SECONDS,
+            user=user_response
+        )
+    
     @staticmethod
     async def create_user(db: AsyncSession, user_data: UserSignup) -> TokenResponse:
         """Create a new user and return authentication token."""
-        # Check if user already exists
-        result = await db.execute(select(User).where(User.email == user_data.email))
-        if result.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
+        # Hash in a worker thread while the email probe is in flight
+        hash_task = asyncio.create_task(get_password_hash(user_data.password))
+        
+        try:
+            result = await db.execute(select(User.id).where(User.email == user_data.email))
+            if result.scalar_one_or_none():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Email already registered"
+                )
+            
+            hashed_password = await hash_task
+        finally:
+            # On any early exit (taken email, failed probe) stop the hash and
+            # retrieve its outcome so it is never reported as unretrieved
+            if not hash_task.done():
+                hash_task.cancel()
+            await asyncio.gather(hash_task, return_exceptions=True)
         
         # Create new user
-        hashed_password = get_password_hash(user_data.password)
         db_user = User(
             email=user_data.email,
             password_hash=hashed_password,
@@ -30,33 +70,19 @@ class AuthService:
             role=user_data.role
         )
         
+        # The unique index still guards against a concurrent signup for the same email
         db.add(db_user)
-        await db.commit()
+        try:
+            await db.commit()
+        except IntegrityError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
         await db.refresh(db_user)
         
-        # Create access token
-        access_token = create_access_token(
-            data={"sub": str(db_user.id), "email": db_user.email, "role": db_user.role}
-        )
-        
-        # Create response
-        user_response = UserResponse(
-            id=str(db_user.id),
-            email=db_user.email,
-            full_name=db_user.full_name,
-            role=db_user.role,
-            profile_picture_url=db_user.profile_picture_url,
-            bio=db_user.bio,
-            onboarding_completed=db_user.onboarding_completed,
-            is_active=db_user.is_active,
-            created_at=db_user.created_at.isoformat()
-        )
-        
-        return TokenResponse(
-            access_token=access_token,
-            expires_in=ACCESS_TOKEN_EXPIRE_HOURS * 3600,
-            user=user_response
-        )
+        return AuthService.build_token_response(db_user)
     
     @staticmethod
     async def authenticate_user(db: AsyncSession, login_data: UserLogin) -> TokenResponse:
@@ -65,7 +91,7 @@ class AuthService:
         result = await db.execute(select(User).where(User.email == login_data.email))
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(login_data.password, user.password_hash):
+        if not user or not await verify_password(login_data.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password"
@@ -77,35 +103,18 @@ class AuthService:
                 detail="Inactive user account"
             )
         
-        # Create access token
-        access_token = create_access_token(
-            data={"sub": str(user.id), "email": user.email, "role": user.role}
-        )
-        
-        # Create response
-        user_response = UserResponse(
-            id=str(user.id),
-            email=user.email,
-            full_name=user.full_name,
-            role=user.role,
-            profile_picture_url=user.profile_picture_url,
-            bio=user.bio,
-            onboarding_completed=user.onboarding_completed,
-            is_active=user.is_active,
-            created_at=user.created_at.isoformat()
-        )
-        
-        return TokenResponse(
-            access_token=access_token,
-            expires_in=ACCESS_TOKEN_EXPIRE_HOURS * 3600,
-            user=user_response
-        )
+        return AuthService.build_token_response(user)
     
     @staticmethod
     async def get_user_by_id(db: AsyncSession, user_id: str) -> User:
         """Get user by ID."""
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        try:
+            user_key = user_id if isinstance(user_id, UUID) else UUID(str(user_id))
+        except ValueError:
+            user_key = None
+        
+        # Primary key lookup; served from the identity map when already loaded
+        user = await db.get(User, user_key) if user_key else None
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -0,0 +1,75 @@
+"""
+Outbound email delivery for notifications over one persistent SMTP connection.
+
+The connection (and its STARTTLS/login handshake) is opened on first use and
+reused for every later send in the process; it is reopened once if the server
+has dropped it.
+"""
+import asyncio
+from email.message import EmailMessage
+from typing import Optional
+import aiosmtplib
+import structlog
+from app.core.config import settings
+
+logger = structlog.get_logger()
+
+class EmailDelivery:
+    """Keeps a single SMTP session alive and serializes sends over it"""
+
+    def __init__(self):
+        self._smtp: Optional[aiosmtplib.SMTP] = None
+        # One SMTP session carries one transaction at a time
+        self._lock = asyncio.Lock()
+
+    @property
+    def configured(self) -> bool:
+        return bool(settings.SMTP_HOST)
+
+    async def _connection(self) -> aiosmtplib.SMTP:
+        if self._smtp is None or not self._smtp.is_connected:
+            self._smtp = aiosmtplib.SMTP(
+                hostname=settings.SMTP_HOST,
+                port=settings.SMTP_PORT,
+                start_tls=settings.SMTP_USE_TLS,
+                username=settings.SMTP_USERNAME,
+                password=settings.SMTP_PASSWORD
+            )
+            await self._smtp.connect()
+        return self._smtp
+
+    async def send(self, to_address: str, subject: str, body: str) -> bool:
+        """Send a plain-text email; False if SMTP is not configured or the send failed."""
+        if not self.configured:
+            return False
+
+        message = EmailMessage()
+        message["From"] = settings.SMTP_FROM_ADDRESS or settings.SMTP_USERNAME
+        message["To"] = to_address
+        message["Subject"] = subject
+        message.set_content(body)
+
+        async with self._lock:
+            try:
+                try:
+                    await (await self._connection()).send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Idle connection closed by the server; reconnect once
+                    self._smtp = None
+                    await (await self._connection()).send_message(message)
+                return True
+            except Exception as e:
+                logger.warning("Email delivery failed", to=to_address, error=str(e))
+                return False
+
+    async def close(self):
+        """Close the SMTP session if one is open."""
+        if self._smtp is not None and self._smtp.is_connected:
+            try:
+                await self._smtp.quit()
+            except aiosmtplib.SMTPException:
+                self._smtp.close()
+        self._smtp = None
+
+# Global email delivery instance
+email_delivery = EmailDelivery()
@@ -0,0 +1,79 @@
+"""
+Per-session notification outbox.
+
+notify_* calls stage rows on the request's session instead of writing them.
+The staged rows go out as one multi-row INSERT inside the same transaction,
+just before it commits, and are dropped if it rolls back.
+"""
+from datetime import timedelta
+from typing import Any, Dict, List, Optional
+from sqlalchemy import event, func, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.core.database import NOTIFICATION_OUTBOX_KEY
+from app.models.notification import Notification, NotificationDedup
+
+# A proposal notification repeating one delivered less than this long ago is dropped
+DEDUP_WINDOW_SECONDS = 300
+
+def dedup_key(row: Dict[str, Any]) -> Optional[str]:
+    """Dedup key for proposal notifications; None for rows that are never deduplicated"""
+    if row.get("related_proposal_id") is None:
+        return None
+    return f"{row['user_id']}:{row['type']}:{row['related_proposal_id']}"
+
+def _claim(session: Session, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep rows whose dedup key this transaction claimed, plus rows without a key"""
+    keyed = {}
+    unkeyed = []
+    for row in rows:
+        key = dedup_key(row)
+        if key is None:
+            unkeyed.append(row)
+        else:
+            keyed.setdefault(key, row)
+
+    if not keyed:
+        return unkeyed
+
+    # Server-side dedup, no SELECT-first round trip: a new key is inserted, a key
+    # last claimed more than a window ago is re-claimed, anything newer is skipped
+    claimed = set(session.execute(
+        pg_insert(NotificationDedup)
+        .values([{"key": key} for key in keyed])
+        .on_conflict_do_update(
+            index_elements=[NotificationDedup.key],
+            set_={"created_at": func.now()},
+            where=NotificationDedup.created_at < func.now() - timedelta(seconds=DEDUP_WINDOW_SECONDS)
+        )
+        .returning(NotificationDedup.key)
+    ).scalars())
+
+    return unkeyed + [row for key, row in keyed.items() if key in claimed]
+
+class NotificationOutbox:
+    """Stages notification rows on a session until its next commit"""
+
+    @staticmethod
+    def add(db: AsyncSession, row: Dict[str, Any]):
+        """Stage a notification row on db."""
+        db.info.setdefault(NOTIFICATION_OUTBOX_KEY, []).append(row)
+
+    @staticmethod
+    def pending(db: AsyncSession) -> bool:
+        """Whether db has staged rows that have not been written yet."""
+        return bool(db.info.get(NOTIFICATION_OUTBOX_KEY))
+
+@event.listens_for(Session, "before_commit")
+def _flush_outbox(session: Session):
+    rows = session.info.pop(NOTIFICATION_OUTBOX_KEY, None)
+    if rows:
+        # Runs inside AsyncSession.commit()'s greenlet, so sync execute is safe here
+        rows = _claim(session, rows)
+        if rows:
+            session.execute(insert(Notification), rows)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_outbox(session: Session):
+    session.info.pop(NOTIFICATION_OUTBOX_KEY, None)
@@ -1,11 +1,90 @@
+from sqlalchemy import delete, false, func, insert, inspect, literal, or_, select
+from sqlalchemy.sql import ColumnElement
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.models.notification import Notification, NotificationType, NotificationPriority
+from sqlalchemy.orm import selectinload
+from app.models.notification import Notification, NotificationDedup, NotificationType, NotificationPriority
 from app.models.user import User
 from app.models.itinerary_proposal import ItineraryProposal
 from app.models.itinerary_request import ItineraryRequest
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.ids import uuid7
+from app.services.notification_outbox import NotificationOutbox
 from uuid import UUID
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Tuple
+import orjson
+import asyncio
+import structlog
+
+logger = structlog.get_logger()
+
+# How often the janitor sweeps expired notifications
+EXPIRY_SWEEP_INTERVAL_SECONDS = 3600
+
+# Advisory lock key held for the duration of a sweep, so one worker sweeps at a time
+EXPIRY_SWEEP_LOCK_KEY = 0x6E6F7469  # "noti"
+
+# Fan-outs at or above this size are loaded with binary COPY instead of INSERT
+COPY_THRESHOLD = 1000
+
+# Column order for COPY; defaults the ORM would normally fill are supplied explicitly
+_COPY_COLUMNS = (
+    'id', 'user_id', 'type', 'priority', 'title', 'message', 'action_url', 'action_label',
+    'extra_data', 'related_proposal_id', 'related_request_id', 'related_user_id',
+    'related_conversation_id', 'is_read', 'is_sent', 'expires_at', 'created_at'
+)
+
+# (title, message) templates per notification type, formatted with format_map
+_TEMPLATES = {
+    NotificationType.PROPOSAL_RECEIVED: (
+        "New Itinerary Proposal",
+        "You received a new proposal for '{request_title}' from {local_name}."
+    ),
+    NotificationType.PROPOSAL_ACCEPTED: (
+        "Proposal Accepted! 🎉",
+        "Great news! Your proposal for '{request_title}' has been accepted by {traveler_name}."
+    ),
+    NotificationType.PROPOSAL_DECLINED: (
+        "Proposal Update",
+        "Your proposal for '{request_title}' was not selected this time. Keep creating amazing experiences!"
+    ),
+    NotificationType.NEW_MESSAGE: (
+        "New message from {sender_name}",
+        "{preview}"
+    ),
+    NotificationType.REVIEW_RECEIVED: (
+        "New {rating}-star review! {stars}",
+        "{reviewer_name} left you a {rating}-star review for '{proposal_title}'. Check it out!"
+    ),
+    NotificationType.REVIEW_RESPONSE: (
+        "Response to Your Review",
+        "{reviewee_name} responded to your review for '{proposal_title}'."
+    ),
+    NotificationType.REQUEST_ASSIGNED: (
+        "New Request Assignment",
+        "You've been assigned to help with '{request_title}' in {destination_city}."
+    ),
+}
+
+def _preview(text: str, limit: int = 100) -> str:
+    """text cut to limit characters with an ellipsis; short text is returned as is"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def _render(notification_type: NotificationType, values: Dict[str, Any]) -> Tuple[str, str]:
+    """Fill the title and message templates for notification_type"""
+    title, message = _TEMPLATES[notification_type]
+    return title.format_map(values), message.format_map(values)
+
+def _require_loaded(obj: Any, *relationships: str):
+    """In debug builds, fail fast if a notify_* caller passed obj without eager-loading relationships"""
+    if settings.DEBUG:
+        missing = inspect(obj).unloaded.intersection(relationships)
+        assert not missing, f"{type(obj).__name__} passed to notify without eager-loaded {sorted(missing)}"
+
+def _plain(value: Any) -> Any:
+    """Unwrap str enums so the driver's binary codecs see plain values"""
+    return value.value if isinstance(value, (NotificationType, NotificationPriority)) else value
 
 class NotificationService:
     """Service for creating and managing notifications"""
@@ -24,9 +103,10 @@ class NotificationService:
         related_proposal_id: Optional[UUID] = None,
         related_request_id: Optional[UUID] = None,
         related_user_id: Optional[UUID] = None,
+        related_conversation_id: Optional[UUID] = None,
         expires_at: Optional[datetime] = None
     ) -> Notification:
-        """Create a new notification"""
+        """Create a new notification in the caller's transaction (not committed)"""
 
         notification = Notification(
             user_id=user_id,
@@ -40,32 +120,202 @@ class NotificationService:
             related_proposal_id=related_proposal_id,
             related_request_id=related_request_id,
             related_user_id=related_user_id,
+            related_conversation_id=related_conversation_id,
             expires_at=expires_at
         )
 
+        # Caller owns the transaction; the flush's INSERT ... RETURNING loads
+        # created_at (eager_defaults), so no refresh SELECT is needed
         db.add(notification)
-        await db.commit()
-        await db.refresh(notification)
+        await db.flush()
 
         return notification
 
+    @staticmethod
+    def stage_notification(
+        db: AsyncSession,
+        user_id: UUID,
+        notification_type: str,
+        title: str,
+        message: str,
+        priority: str = NotificationPriority.MEDIUM,
+        action_url: Optional[str] = None,
+        action_label: Optional[str] = None,
+        extra_data: Optional[Dict[str, Any]] = None,
+        related_proposal_id: Optional[UUID] = None,
+        related_request_id: Optional[UUID] = None,
+        related_user_id: Optional[UUID] = None,
+        related_conversation_id: Optional[UUID] = None,
+        expires_at: Optional[datetime] = None
+    ) -> None:
+        """Stage a notification in db's outbox; written with the session's next commit.
+
+        The caller must commit before returning its response; rows still staged
+        when the request's session closes are dropped and reported.
+        """
+        # Same keys for every row so staged rows batch into one executemany
+        row = {
+            "user_id": user_id,
+            "type": notification_type,
+            "priority": priority,
+            "title": title,
+            "message": message,
+            "action_url": action_url,
+            "action_label": action_label,
+            "extra_data": extra_data,
+            "related_proposal_id": related_proposal_id,
+            "related_request_id": related_request_id,
+            "related_user_id": related_user_id,
+            "related_conversation_id": related_conversation_id,
+            "expires_at": expires_at
+        }
+
+        NotificationOutbox.add(db, row)
+
+    @staticmethod
+    async def create_notifications_bulk(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> List[Tuple[UUID, datetime]]:
+        """Insert many notifications and commit once; returns (id, created_at) pairs"""
+        if not rows:
+            return []
+
+        if len(rows) >= COPY_THRESHOLD:
+            inserted = await NotificationService._copy_notifications(db, rows)
+        else:
+            # Every row must carry the same keys for a single executemany batch
+            stmt = insert(Notification).returning(Notification.id, Notification.created_at)
+            result = await db.execute(stmt, rows)
+            inserted = [tuple(row) for row in result]
+
+        await db.commit()
+
+        return inserted
+
+    @staticmethod
+    async def _copy_notifications(
+        db: AsyncSession,
+        rows: List[Dict[str, Any]]
+    ) -> List[Tuple[UUID, datetime]]:
+        """Load notifications through asyncpg's binary COPY on the session's connection"""
+        created_at = datetime.now(timezone.utc)
+        records = []
+        for row in rows:
+            extra_data = row.get('extra_data')
+            records.append((
+                uuid7(),
+                row['user_id'],
+                _plain(row['type']),
+                _plain(row.get('priority', NotificationPriority.MEDIUM)),
+                row['title'],
+                row['message'],
+                row.get('action_url'),
+                row.get('action_label'),
+                # asyncpg takes jsonb as text
+                orjson.dumps(extra_data).decode() if extra_data is not None else None,
+                row.get('related_proposal_id'),
+                row.get('related_request_id'),
+                row.get('related_user_id'),
+                row.get('related_conversation_id'),
+                False,
+                False,
+                row.get('expires_at'),
+                created_at
+            ))
+
+        connection = await db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            Notification.__tablename__, records=records, columns=_COPY_COLUMNS
+        )
+
+        return [(record[0], created_at) for record in records]
+
+    @staticmethod
+    async def list_unread(db: AsyncSession, user_id: UUID, limit: int = 20) -> List[Notification]:
+        """Newest unexpired unread notifications for user_id; served by ix_notif_user_unread"""
+        result = await db.execute(
+            select(Notification)
+            .where(
+                Notification.user_id == user_id,
+                Notification.is_read == False,
+                or_(Notification.expires_at.is_(None), Notification.expires_at > datetime.utcnow())
+            )
+            .order_by(Notification.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    async def delete_expired(db: AsyncSession) -> int:
+        """Delete notifications past their expires_at; returns the number removed"""
+        result = await db.execute(
+            delete(Notification).where(Notification.expires_at <= datetime.utcnow())
+        )
+        # Dedup keys only matter within their window
+        await db.execute(
+            delete(NotificationDedup).where(
+                NotificationDedup.created_at < datetime.now(timezone.utc) - timedelta(hours=1)
+            )
+        )
+        await db.commit()
+        return result.rowcount
+
+    @staticmethod
+    async def run_expiry_janitor():
+        """Background loop deleting expired notifications every EXPIRY_SWEEP_INTERVAL_SECONDS"""
+        while True:
+            try:
+                async with AsyncSessionLocal() as db:
+                    # Every worker runs this loop; whoever misses the lock skips
+                    # this round. The xact lock is released by delete_expired's commit
+                    locked = await db.scalar(
+                        select(func.pg_try_advisory_xact_lock(EXPIRY_SWEEP_LOCK_KEY))
+                    )
+                    deleted = await NotificationService.delete_expired(db) if locked else 0
+                if deleted:
+                    logger.info("Expired notifications deleted", count=deleted)
+            except Exception as e:
+                logger.warning("Notification expiry sweep failed", error=str(e))
+            await asyncio.sleep(EXPIRY_SWEEP_INTERVAL_SECONDS)
+
+    @staticmethod
+    async def load_proposal_for_notify(db: AsyncSession, proposal_id: UUID) -> Optional[ItineraryProposal]:
+        """Load a proposal with everything the notify_proposal_* methods read, in one pass"""
+        result = await db.execute(
+            select(ItineraryProposal)
+            .options(
+                selectinload(ItineraryProposal.request).selectinload(ItineraryRequest.traveler),
+                selectinload(ItineraryProposal.local)
+            )
+            .where(ItineraryProposal.id == proposal_id)
+        )
+        return result.scalar_one_or_none()
+
     @staticmethod
     async def notify_proposal_received(
         db: AsyncSession,
         proposal: ItineraryProposal,
         traveler: User
     ):
-        """Notify traveler of a new proposal"""
-        return await NotificationService.create_notification(
+        """Notify traveler of a new proposal; proposal must come from load_proposal_for_notify"""
+        _require_loaded(proposal, 'request', 'local')
+        proposal_id = proposal.id
+        title, message = _render(NotificationType.PROPOSAL_RECEIVED, {
+            'request_title': proposal.request.title,
+            'local_name': proposal.local.full_name
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=traveler.id,
             notification_type=NotificationType.PROPOSAL_RECEIVED,
-            title="New Itinerary Proposal",
-            message=f"You received a new proposal for '{proposal.request.title}' from {proposal.local.full_name}.",
+            title=title,
+            message=message,
             priority=NotificationPriority.HIGH,
-            action_url=f"/itineraries/proposals/{proposal.id}",
+            action_url=f"/itineraries/proposals/{proposal_id}",
             action_label="View Proposal",
-            related_proposal_id=proposal.id,
+            related_proposal_id=proposal_id,
             related_request_id=proposal.request_id,
             related_user_id=proposal.local_id
         )
@@ -76,19 +326,27 @@ class NotificationService:
         proposal: ItineraryProposal,
         local_guide: User
     ):
-        """Notify local guide that their proposal was accepted"""
-        return await NotificationService.create_notification(
+        """Notify local guide that their proposal was accepted; proposal must come from load_proposal_for_notify"""
+        _require_loaded(proposal, 'request')
+        request = proposal.request
+        proposal_id = proposal.id
+        _require_loaded(request, 'traveler')
+        title, message = _render(NotificationType.PROPOSAL_ACCEPTED, {
+            'request_title': request.title,
+            'traveler_name': request.traveler.full_name
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=local_guide.id,
             notification_type=NotificationType.PROPOSAL_ACCEPTED,
-            title="Proposal Accepted! 🎉",
-            message=f"Great news! Your proposal for '{proposal.request.title}' has been accepted by {proposal.request.traveler.full_name}.",
+            title=title,
+            message=message,
             priority=NotificationPriority.HIGH,
-            action_url=f"/itineraries/proposals/{proposal.id}",
+            action_url=f"/itineraries/proposals/{proposal_id}",
             action_label="View Details",
-            related_proposal_id=proposal.id,
+            related_proposal_id=proposal_id,
             related_request_id=proposal.request_id,
-            related_user_id=proposal.request.traveler_id
+            related_user_id=request.traveler_id
         )
 
     @staticmethod
@@ -97,19 +355,23 @@ class NotificationService:
         proposal: ItineraryProposal,
         local_guide: User
     ):
-        """Notify local guide that their proposal was declined"""
-        return await NotificationService.create_notification(
+        """Notify local guide that their proposal was declined; proposal must come from load_proposal_for_notify"""
+        _require_loaded(proposal, 'request')
+        request = proposal.request
+        proposal_id = proposal.id
+        title, message = _render(NotificationType.PROPOSAL_DECLINED, {'request_title': request.title})
+        NotificationService.stage_notification(
             db=db,
             user_id=local_guide.id,
             notification_type=NotificationType.PROPOSAL_DECLINED,
-            title="Proposal Update",
-            message=f"Your proposal for '{proposal.request.title}' was not selected this time. Keep creating amazing experiences!",
+            title=title,
+            message=message,
             priority=NotificationPriority.MEDIUM,
-            action_url=f"/itineraries/proposals/{proposal.id}",
+            action_url=f"/itineraries/proposals/{proposal_id}",
             action_label="View Details",
-            related_proposal_id=proposal.id,
+            related_proposal_id=proposal_id,
             related_request_id=proposal.request_id,
-            related_user_id=proposal.request.traveler_id
+            related_user_id=request.traveler_id
         )
 
     @staticmethod
@@ -121,17 +383,21 @@ class NotificationService:
         message_preview: str
     ):
         """Notify user of a new message"""
-        return await NotificationService.create_notification(
+        title, message = _render(NotificationType.NEW_MESSAGE, {
+            'sender_name': sender.full_name,
+            'preview': _preview(message_preview)
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=recipient.id,
             notification_type=NotificationType.NEW_MESSAGE,
-            title=f"New message from {sender.full_name}",
-            message=f"{message_preview[:100]}{'...' if len(message_preview) > 100 else ''}",
+            title=title,
+            message=message,
             priority=NotificationPriority.MEDIUM,
             action_url=f"/chats?conversation_id={conversation_id}",
             action_label="Reply",
-            extra_data={"conversation_id": str(conversation_id)},
-            related_user_id=sender.id
+            related_user_id=sender.id,
+            related_conversation_id=conversation_id
         )
 
     @staticmethod
@@ -143,13 +409,18 @@ class NotificationService:
         rating: int
     ):
         """Notify user they received a review"""
-        stars = "⭐" * rating
-        return await NotificationService.create_notification(
+        title, message = _render(NotificationType.REVIEW_RECEIVED, {
+            'rating': rating,
+            'stars': "⭐" * rating,
+            'reviewer_name': reviewer.full_name,
+            'proposal_title': proposal.title
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=reviewee.id,
             notification_type=NotificationType.REVIEW_RECEIVED,
-            title=f"New {rating}-star review! {stars}",
-            message=f"{reviewer.full_name} left you a {rating}-star review for '{proposal.title}'. Check it out!",
+            title=title,
+            message=message,
             priority=NotificationPriority.MEDIUM,
             action_url=f"/reviews",
             action_label="View Review",
@@ -165,12 +436,16 @@ class NotificationService:
         proposal: ItineraryProposal
     ):
         """Notify reviewer that they got a response to their review"""
-        return await NotificationService.create_notification(
+        title, message = _render(NotificationType.REVIEW_RESPONSE, {
+            'reviewee_name': reviewee.full_name,
+            'proposal_title': proposal.title
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=reviewer.id,
             notification_type=NotificationType.REVIEW_RESPONSE,
-            title="Response to Your Review",
-            message=f"{reviewee.full_name} responded to your review for '{proposal.title}'.",
+            title=title,
+            message=message,
             priority=NotificationPriority.LOW,
             action_url=f"/reviews",
             action_label="View Response",
@@ -185,12 +460,16 @@ class NotificationService:
         request: ItineraryRequest
     ):
         """Notify local guide of request assignment"""
-        return await NotificationService.create_notification(
+        title, message = _render(NotificationType.REQUEST_ASSIGNED, {
+            'request_title': request.title,
+            'destination_city': request.destination_city
+        })
+        NotificationService.stage_notification(
             db=db,
             user_id=local_guide.id,
             notification_type=NotificationType.REQUEST_ASSIGNED,
-            title="New Request Assignment",
-            message=f"You've been assigned to help with '{request.title}' in {request.destination_city}.",
+            title=title,
+            message=message,
             priority=NotificationPriority.HIGH,
             action_url=f"/itineraries/requests/{request.id}",
             action_label="View Request",
@@ -201,23 +480,69 @@ class NotificationService:
     @staticmethod
     async def notify_system_announcement(
         db: AsyncSession,
-        user_id: UUID,
+        user_ids: List[UUID],
         title: str,
         message: str,
         action_url: Optional[str] = None,
         expires_in_days: int = 30
-    ):
-        """Send a system announcement notification"""
-        expires_at = datetime.utcnow() + timedelta(days=expires_in_days)
+    ) -> List[Tuple[UUID, datetime]]:
+        """Send a system announcement notification to every user in user_ids"""
+        # Identical for every recipient; built once, created_at is left to the server default
+        shared = {
+            "type": NotificationType.SYSTEM_ANNOUNCEMENT,
+            "priority": NotificationPriority.MEDIUM,
+            "title": title,
+            "message": message,
+            "action_url": action_url,
+            "action_label": "Learn More" if action_url else None,
+            "expires_at": datetime.utcnow() + timedelta(days=expires_in_days)
+        }
 
-        return await NotificationService.create_notification(
-            db=db,
-            user_id=user_id,
-            notification_type=NotificationType.SYSTEM_ANNOUNCEMENT,
-            title=title,
-            message=message,
-            priority=NotificationPriority.MEDIUM,
-            action_url=action_url,
-            action_label="Learn More" if action_url else None,
-            expires_at=expires_at
-        )
\ No newline at end of file
+        rows = [{"user_id": user_id, **shared} for user_id in user_ids]
+
+        return await NotificationService.create_notifications_bulk(db, rows)
+
+    @staticmethod
+    async def broadcast_system_announcement(
+        db: AsyncSession,
+        title: str,
+        message: str,
+        segment_filter: Optional[ColumnElement] = None,
+        action_url: Optional[str] = None,
+        expires_in_days: int = 30
+    ) -> int:
+        """Announce to every active user matching segment_filter with one INSERT ... SELECT; returns rows inserted"""
+        values = {
+            Notification.type: NotificationType.SYSTEM_ANNOUNCEMENT.value,
+            Notification.priority: NotificationPriority.MEDIUM.value,
+            Notification.title: title,
+            Notification.message: message,
+            Notification.action_url: action_url,
+            Notification.action_label: "Learn More" if action_url else None,
+            Notification.expires_at: datetime.utcnow() + timedelta(days=expires_in_days)
+        }
+
+        recipients = select(
+            # Python-side uuid7 default can't run per row here; the server generates ids
+            func.gen_random_uuid(),
+            User.id,
+            *(literal(value, column.type) for column, value in values.items()),
+            false(),
+            false()
+        ).where(User.is_active == True)
+        if segment_filter is not None:
+            recipients = recipients.where(segment_filter)
+
+        result = await db.execute(
+            insert(Notification).from_select(
+                [
+                    Notification.id, Notification.user_id, *values,
+                    Notification.is_read, Notification.is_sent
+                ],
+                recipients,
+                include_defaults=False
+            )
+        )
+        await db.commit()
+
+        return result.rowcount
@@ -3,22 +3,43 @@ from sqlalchemy import select, update
 from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.profile import ProfileUpdate
+from app.core.caching import cache_manager, user_row_cache_key
 from uuid import UUID
+from datetime import datetime
+from typing import Any, Dict
 from sqlalchemy.sql import func
 
+# Short TTL; profile writes also invalidate explicitly
+USER_CACHE_TTL_SECONDS = 60
+
+# Columns kept in the cache; never the password hash
+_CACHED_USER_FIELDS = (
+    'id', 'email', 'full_name', 'role', 'profile_picture_url', 'bio',
+    'onboarding_completed', 'is_active', 'last_seen_at', 'created_at', 'updated_at'
+)
+_CACHED_DATETIME_FIELDS = ('last_seen_at', 'created_at', 'updated_at')
+
+def _user_to_cache(user: User) -> Dict[str, Any]:
+    return {field: getattr(user, field) for field in _CACHED_USER_FIELDS}
+
+def _user_from_cache(data: Dict[str, Any]) -> User:
+    """Rebuild a detached, read-only User from its cached columns"""
+    data['id'] = UUID(data['id'])
+    for field in _CACHED_DATETIME_FIELDS:
+        if data[field] is not None:
+            data[field] = datetime.fromisoformat(data[field])
+    return User(**data)
+
 class ProfileService:
     @staticmethod
-    async def get_user_by_id(db: AsyncSession, user_id: str) -> User:
+    async def get_user_by_id(db: AsyncSession, user_id: UUID) -> User:
         """Get user by ID."""
-        try:
-            user_uuid = UUID(user_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid user ID format"
-            )
+        cache_key = user_row_cache_key(str(user_id))
+        cached_user = await cache_manager.get(cache_key)
+        if cached_user is not None:
+            return _user_from_cache(cached_user)
         
-        result = await db.execute(select(User).where(User.id == user_uuid))
+        result = await db.execute(select(User).where(User.id == user_id))
         user = result.scalar_one_or_none()
         
         if not user:
@@ -27,6 +48,7 @@ class ProfileService:
                 detail="User not found"
             )
         
+        await cache_manager.set(cache_key, _user_to_cache(user), expire=USER_CACHE_TTL_SECONDS)
         return user
     
     @staticmethod
@@ -44,31 +66,35 @@ class ProfileService:
         # Add updated timestamp
         update_data["updated_at"] = func.now()
         
-        # Update user
-        await db.execute(
+        # Update user and read the new row back in the same statement
+        result = await db.execute(
             update(User)
             .where(User.id == user_id)
             .values(**update_data)
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
+        user = result.scalar_one()
         await db.commit()
+        await cache_manager.delete(user_row_cache_key(str(user_id)))
         
-        # Return updated user
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one()
+        return user
     
     @staticmethod
     async def complete_onboarding(db: AsyncSession, user_id: UUID) -> User:
         """Mark user onboarding as completed."""
-        await db.execute(
+        result = await db.execute(
             update(User)
             .where(User.id == user_id)
             .values(
                 onboarding_completed=True,
                 updated_at=func.now()
             )
+            .returning(User)
+            .execution_options(synchronize_session=False, populate_existing=True)
         )
+        user = result.scalar_one()
         await db.commit()
+        await cache_manager.delete(user_row_cache_key(str(user_id)))
         
-        # Return updated user
-        result = await db.execute(select(User).where(User.id == user_id))
-        return result.scalar_one()
\ No newline at end of file
+        return user
\ No newline at end of file
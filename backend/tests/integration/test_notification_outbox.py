@@ -0,0 +1,46 @@
+from datetime import timedelta
+from uuid import uuid4
+
+from sqlalchemy import func, update
+
+from app.models.notification import NotificationDedup
+from app.services.notification_outbox import DEDUP_WINDOW_SECONDS, _claim, dedup_key
+
+
+def _proposal_row():
+    return {"user_id": uuid4(), "type": "proposal_received", "related_proposal_id": uuid4()}
+
+async def _claim_one(db_session, row):
+    return await db_session.run_sync(lambda session: _claim(session, [row]))
+
+async def _age_claim(db_session, row, seconds):
+    await db_session.execute(
+        update(NotificationDedup)
+        .where(NotificationDedup.key == dedup_key(row))
+        .values(created_at=func.now() - timedelta(seconds=seconds))
+    )
+
+
+async def test_repeat_within_window_is_dropped_across_any_boundary(db_session):
+    row = _proposal_row()
+    assert await _claim_one(db_session, row) == [row]
+
+    # One second short of the window, wherever a fixed bucket edge would have fallen
+    await _age_claim(db_session, row, DEDUP_WINDOW_SECONDS - 1)
+    assert await _claim_one(db_session, row) == []
+
+    await db_session.rollback()
+
+async def test_repeat_after_window_is_delivered(db_session):
+    row = _proposal_row()
+    assert await _claim_one(db_session, row) == [row]
+
+    await _age_claim(db_session, row, DEDUP_WINDOW_SECONDS + 1)
+    assert await _claim_one(db_session, row) == [row]
+
+    await db_session.rollback()
+
+async def test_rows_without_a_proposal_are_never_deduplicated(db_session):
+    row = {"user_id": uuid4(), "type": "new_message", "related_proposal_id": None}
+    assert await _claim_one(db_session, row) == [row]
+    assert await _claim_one(db_session, row) == [row]
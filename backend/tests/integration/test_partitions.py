@@ -0,0 +1,49 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import text
+
+from app.core.database import PARTITION_MONTHS_AHEAD, engine
+
+INSERT_NOTIFICATION = text("""
+    INSERT INTO notifications (id, user_id, type, title, message, is_read, is_sent, created_at)
+    VALUES (gen_random_uuid(), :user_id, 'system_announcement', 'Past the horizon', 'Test row',
+            false, false, :created_at)
+    RETURNING id
+""")
+
+async def _partition_of(conn, notification_id):
+    return await conn.scalar(
+        text("SELECT tableoid::regclass::text FROM notifications WHERE id = :id"),
+        {"id": notification_id}
+    )
+
+def _months_from_now(months):
+    now = datetime.now(timezone.utc)
+    month_index = now.month - 1 + months
+    return datetime(now.year + month_index // 12, month_index % 12 + 1, 15, tzinfo=timezone.utc)
+
+
+async def test_row_past_the_horizon_moves_into_its_new_partition(signed_up_user):
+    user_id, _ = signed_up_user
+    # Far enough out that no provisioning run has reached it
+    months_ahead = PARTITION_MONTHS_AHEAD + 21
+    created_at = _months_from_now(months_ahead)
+
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            notification_id = await conn.scalar(
+                INSERT_NOTIFICATION, {"user_id": UUID(user_id), "created_at": created_at}
+            )
+            assert await _partition_of(conn, notification_id) == "notifications_default"
+
+            await conn.execute(
+                text("SELECT ensure_monthly_partitions('notifications', :months)"),
+                {"months": months_ahead}
+            )
+
+            assert await _partition_of(conn, notification_id) == f"notifications_{created_at:%Y_%m}"
+        finally:
+            # Partition DDL is transactional; leave the database as it was
+            await transaction.rollback()
@@ -0,0 +1,20 @@
+from uuid import UUID
+
+from app.core.caching import cache_manager, user_row_cache_key
+from app.services.profile_service import ProfileService
+
+
+async def test_deactivated_user_is_rejected_immediately(client, db_session, signed_up_user):
+    user_id, headers = signed_up_user
+
+    # Warm the cached User row the way profile reads do
+    await ProfileService.get_user_by_id(db_session, UUID(user_id))
+
+    response = await client.delete("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200, response.text
+
+    assert await cache_manager.get(user_row_cache_key(user_id)) is None
+
+    response = await client.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["error"]["message"] == "Inactive user"
@@ -0,0 +1,18 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.schemas.auth import UserResponse
+
+
+def test_user_response_created_at_keeps_utc_offset():
+    user = UserResponse(
+        id=uuid4(),
+        email="traveler@example.com",
+        full_name="Test Traveler",
+        role="traveler",
+        onboarding_completed=True,
+        is_active=True,
+        created_at=datetime(2026, 10, 15, 9, 30, tzinfo=timezone.utc),
+    )
+
+    assert user.model_dump(mode="json")["created_at"] == "2026-10-15T09:30:00+00:00"
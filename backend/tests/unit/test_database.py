@@ -0,0 +1,56 @@
+from uuid import uuid4
+
+import pytest
+
+from app.core import database
+from app.core.database import NOTIFICATION_OUTBOX_KEY
+from app.core.monitoring import metrics_collector
+from app.services.notification_outbox import NotificationOutbox
+
+
+class _FakeSession:
+    def __init__(self):
+        self.info = {}
+        self.committed = False
+        self.closed = False
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+async def test_get_db_drops_and_reports_uncommitted_notifications(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(database, "AsyncSessionLocal", lambda: session)
+    dropped_key = "counter:notifications_dropped_uncommitted"
+    dropped_before = metrics_collector.get_metrics().get(dropped_key, 0)
+
+    dependency = database.get_db()
+    db = await dependency.__anext__()
+    # A handler that stages a notification and returns without committing
+    NotificationOutbox.add(db, {"user_id": uuid4(), "type": "new_message"})
+    # FastAPI resumes the dependency after the response, as anext does here
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert not session.committed
+    assert session.closed
+    assert NOTIFICATION_OUTBOX_KEY not in session.info
+    assert metrics_collector.get_metrics()[dropped_key] == dropped_before + 1
+
+async def test_get_db_leaves_committed_sessions_alone(monkeypatch):
+    session = _FakeSession()
+    monkeypatch.setattr(database, "AsyncSessionLocal", lambda: session)
+
+    dependency = database.get_db()
+    await dependency.__anext__()
+    with pytest.raises(StopAsyncIteration):
+        await dependency.__anext__()
+
+    assert not session.committed
+    assert session.closed